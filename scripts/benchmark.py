@@ -0,0 +1,262 @@
+"""Benchmarks of the business logic's hot paths.
+
+Times Cell.use, Battery.use, Vehicle.use, one Fleet.use step, FleetControler.build_fleet, adapters' loading and validation and full runs, for several fleet sizes, scenario lengths and engines. Fleets and scenarios are drawn from the seeded distributions of the sweep module, with the ranges of the generator scripts.
+
+Usage:
+    python scripts/benchmark.py --output baseline.json
+    python scripts/benchmark.py --compare baseline.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from fleet_operator.columnar import save_columns
+from fleet_operator.domain.core import Battery, Cell, FleetControler, Vehicle, simulate
+from fleet_operator.domain.sweep import FleetDistribution, ScenarioDistribution
+from fleet_operator.server import ConsoleServerAdapter, NpyServerAdapter
+from fleet_operator.user import ConsoleUserAdapter, NpyUserAdapter
+
+ENGINES = ["OBJECT", "VECTORIZED", "EVENT"]
+
+
+def measure(
+    function: Callable[[Any], None],
+    setup: Callable[[], Any] = lambda: None,
+    repeat: int = 3,
+    number: int = 1,
+    min_time: float = 0.05,
+) -> float:
+    """Returns the best wall time of a function call over several repeats (s).
+
+    Each repeat calls the function until it has been timed for at least min_time, so that short calls are not dominated by the timer's resolution and noise.
+
+    Parameters
+    ----------
+    function : Callable[[Any], None]
+        Function to time, called with the setup's result.
+    setup : Callable[[], Any]
+        Function preparing each call, not timed.
+    repeat : int
+        Number of repeats.
+    number : int
+        Number of calls the function makes, to return the time of one of them.
+    min_time : float
+        Minimum timed duration of each repeat (s).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        elapsed, calls_number = 0.0, 0
+        while elapsed < min_time or calls_number == 0:
+            state = setup()
+            start = perf_counter()
+            function(state)
+            elapsed += perf_counter() - start
+            calls_number += 1
+        best = min(best, elapsed / calls_number)
+    return best / number
+
+
+def draw(vehicles_number: int, tasks_number: int, seed: int) -> tuple:
+    """Draws a fleet's resources and a scenario with the generator scripts' ranges."""
+    rng = np.random.default_rng(seed)
+    resources = FleetDistribution(
+        vehicles_number, max(1, vehicles_number // 5)
+    ).sample(rng)
+    scenario = ScenarioDistribution(tasks_number).sample(rng)
+    return resources, scenario
+
+
+def micro_benchmarks(repeat: int) -> Dict[str, float]:
+    """Times the use of one cell, battery and vehicle."""
+    calls_number = 100
+
+    def use_cells(cell: Cell) -> None:
+        for _ in range(calls_number):
+            cell.renew()
+            cell.use(900, -5.0)
+
+    def use_batteries(battery: Battery) -> None:
+        for _ in range(calls_number):
+            battery.renew()
+            battery.use(900, -20e3)
+
+    def use_vehicles(vehicle: Vehicle) -> None:
+        for _ in range(calls_number):
+            vehicle.change_battery()
+            vehicle.use(900)
+
+    return {
+        "cell_use": measure(use_cells, Cell, repeat, calls_number),
+        "battery_use": measure(use_batteries, Battery, repeat, calls_number),
+        "vehicle_use": measure(use_vehicles, Vehicle, repeat, calls_number),
+    }
+
+
+def scale_benchmarks(
+    vehicles_number: int,
+    tasks_numbers: List[int],
+    engines: List[str],
+    repeat: int,
+    seed: int,
+    max_work: float,
+) -> Dict[str, float]:
+    """Times adapters, fleets' building, one step and full runs for a fleet size."""
+    results = {}
+    resources, scenario = draw(vehicles_number, max(tasks_numbers), seed)
+    cells_nominal_capacity, series, parallel, vehicles_power = zip(*resources["vehicles"])
+    with tempfile.TemporaryDirectory() as directory:
+        fleet_path = os.path.join(directory, "fleet")
+        scenario_path = os.path.join(directory, "scenario")
+        save_columns(
+            {
+                "cells_nominal_capacity": np.array(cells_nominal_capacity),
+                "series_cells_numbers": np.array(series, dtype=np.int64),
+                "parallel_branches_numbers": np.array(parallel, dtype=np.int64),
+                "vehicles_power": np.array(vehicles_power),
+                "charging_stations_power": np.array(resources["charging_stations"]),
+            },
+            fleet_path,
+        )
+        timelapses, loads = zip(*scenario)
+        save_columns(
+            {"timelapses": np.array(timelapses), "loads": np.array(loads)},
+            scenario_path,
+        )
+        server_side_adapter = ConsoleServerAdapter(**resources)
+        results["console_server_adapter[{}]".format(vehicles_number)] = measure(
+            lambda _: ConsoleServerAdapter(**resources), repeat=repeat
+        )
+        results["npy_server_adapter[{}]".format(vehicles_number)] = measure(
+            lambda _: NpyServerAdapter(fleet_path), repeat=repeat
+        )
+        fleet_controler = FleetControler(server_side_adapter, engine=engines[0])
+        results["console_user_adapter[{}]".format(len(scenario))] = measure(
+            lambda _: ConsoleUserAdapter(
+                fleet_controler, scenario=scenario, use_priority_criterion="POOR"
+            ),
+            repeat=repeat,
+        )
+        results["npy_user_adapter[{}]".format(len(scenario))] = measure(
+            lambda _: NpyUserAdapter(
+                fleet_controler, scenario_path, use_priority_criterion="POOR"
+            ),
+            repeat=repeat,
+        )
+    for engine in engines:
+        fleet_controler = FleetControler(server_side_adapter, engine=engine)
+        results["build_fleet[{},{}]".format(engine, vehicles_number)] = measure(
+            lambda _: fleet_controler.build_fleet(server_side_adapter.data),
+            repeat=repeat,
+        )
+        fleet = fleet_controler.fleet
+
+        def reset_fleet() -> None:
+            fleet.reset()
+
+        timelapse, load = scenario[0]
+        results["fleet_use[{},{}]".format(engine, vehicles_number)] = measure(
+            lambda _: fleet.use(timelapse, load, "POOR"), reset_fleet, repeat
+        )
+        for tasks_number in tasks_numbers:
+            if vehicles_number * tasks_number > max_work:
+                continue
+            results["run[{},{},{}]".format(engine, vehicles_number, tasks_number)] = (
+                measure(
+                    lambda _: simulate(fleet, scenario[:tasks_number], "POOR"),
+                    repeat=repeat,
+                )
+            )
+    return results
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[str]:
+    """Prints results against a baseline and returns the names of regressed benchmarks."""
+    regressions = []
+    print("{:<40} {:>12} {:>12} {:>8}".format("benchmark", "baseline", "current", "ratio"))
+    for name, seconds in results.items():
+        if name not in baseline:
+            print("{:<40} {:>12} {:>12.6f} {:>8}".format(name, "-", seconds, "new"))
+            continue
+        ratio = seconds / baseline[name]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            "{:<40} {:>12.6f} {:>12.6f} {:>8.2f}{}".format(
+                name, baseline[name], seconds, ratio, flag
+            )
+        )
+    return regressions
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=ENGINES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-work",
+        type=float,
+        default=1e6,
+        help="Runs of more vehicles times tasks are skipped.",
+    )
+    parser.add_argument("--output", help="Path of the JSON file to write results to.")
+    parser.add_argument("--compare", help="Path of a baseline JSON file to compare to.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown above which a benchmark is flagged.",
+    )
+    args = parser.parse_args(arguments)
+
+    results = micro_benchmarks(args.repeat)
+    for vehicles_number in args.sizes:
+        results.update(
+            scale_benchmarks(
+                vehicles_number,
+                args.tasks,
+                args.engines,
+                args.repeat,
+                args.seed,
+                args.max_work,
+            )
+        )
+    if args.output:
+        with open(args.output, "w") as results_json:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "numpy": np.__version__,
+                    "machine": platform.machine(),
+                    "seed": args.seed,
+                    "results": results,
+                },
+                results_json,
+                indent=4,
+            )
+    if args.compare:
+        with open(args.compare, "r") as baseline_json:
+            baseline = json.load(baseline_json)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("{} regression(s): {}".format(len(regressions), ", ".join(regressions)))
+            return 1
+    else:
+        for name, seconds in results.items():
+            print("{:<40} {:>12.6f}".format(name, seconds))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
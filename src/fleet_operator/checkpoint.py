@@ -0,0 +1,216 @@
+import os
+import shutil
+from json import dumps, loads
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .columnar import load_columns, save_columns
+from .domain.core import Fleet, simulate
+from .domain.data_models import ColumnarOutputsData
+from .domain.observers import FleetCounters, IRunObserver
+
+METADATA_FILENAME = "checkpoint.json"
+STATE_DIRNAME = "state"
+HISTORY_COLUMNS = ("time", "grades")
+
+
+def _state_path(path: str) -> Optional[str]:
+    """Returns the path of a checkpoint's complete state directory, the previous one if a save was interrupted while swapping them, None if there is none."""
+    for state_path in (
+        os.path.join(path, STATE_DIRNAME),
+        os.path.join(path, STATE_DIRNAME + ".old"),
+    ):
+        if os.path.exists(os.path.join(state_path, METADATA_FILENAME)):
+            return state_path
+    return None
+
+
+def save_checkpoint(
+    snapshot: Dict[str, np.ndarray],
+    path: str,
+    scenario_index: int,
+    history_start: int = 0,
+) -> None:
+    """Saves a fleet's snapshot as a directory of binary columns.
+
+    The vehicles' state is written to a new directory which is then swapped with the previous one, the previous one being renamed aside first, so that there is a complete checkpoint at any time. The time and grades are appended to raw binary files of the whole history, those of a checkpoint being the first entries of the files.
+
+    Parameters
+    ----------
+    snapshot : Dict[str, np.ndarray]
+        State of a fleet (see 'Fleet.snapshot'), whose time and grades are the history's entries from 'history_start' on.
+    path : str
+        Path of the checkpoint's directory, created if needed.
+    scenario_index : int
+        Index of the first scenario's task not run yet.
+    history_start : int
+        Index, in the whole history, of the first entry of the snapshot's time and grades, entries already saved from it on are overwritten.
+    """
+    os.makedirs(path, exist_ok=True)
+    for name in HISTORY_COLUMNS:
+        with open(os.path.join(path, name + ".bin"), "ab") as history_file:
+            history_file.truncate(history_start * 8)
+            np.asarray(snapshot[name], dtype="<f8").tofile(history_file)
+    history_length = history_start + len(snapshot["time"])
+    state = {
+        name: column
+        for name, column in snapshot.items()
+        if name not in HISTORY_COLUMNS
+    }
+    state_path = os.path.join(path, STATE_DIRNAME)
+    temporary_path, previous_path = state_path + ".tmp", state_path + ".old"
+    if os.path.exists(temporary_path):
+        shutil.rmtree(temporary_path)
+    save_columns(state, temporary_path)
+    with open(os.path.join(temporary_path, METADATA_FILENAME), "w") as metadata_json:
+        metadata_json.write(
+            dumps(
+                {
+                    "scenario_index": scenario_index,
+                    "columns": list(state),
+                    "history_length": history_length,
+                }
+            )
+        )
+    if os.path.exists(state_path):
+        if os.path.exists(previous_path):
+            shutil.rmtree(previous_path)
+        os.replace(state_path, previous_path)
+    os.replace(temporary_path, state_path)
+    if os.path.exists(previous_path):
+        shutil.rmtree(previous_path)
+
+
+def load_checkpoint(
+    path: str, mmap_mode: Optional[str] = "r"
+) -> Tuple[Dict[str, np.ndarray], int]:
+    """Loads a fleet's snapshot saved by 'save_checkpoint'.
+
+    Parameters
+    ----------
+    path : str
+        Path of the checkpoint's directory.
+    mmap_mode : Optional[str]
+        Memory-map mode of the columns (see 'numpy.load'), columns are read in memory if None.
+
+    Returns
+    -------
+    Tuple[Dict[str, np.ndarray], int]
+        State of the fleet and index of the first scenario's task not run yet.
+    """
+    state_path = _state_path(path)
+    if state_path is None:
+        raise FileNotFoundError("No checkpoint in {}.".format(repr(path)))
+    with open(os.path.join(state_path, METADATA_FILENAME), "r") as metadata_json:
+        metadata = loads(metadata_json.read())
+    snapshot = load_columns(state_path, metadata["columns"], mmap_mode)
+    for name in HISTORY_COLUMNS:
+        history_path = os.path.join(path, name + ".bin")
+        if mmap_mode is None:
+            snapshot[name] = np.fromfile(
+                history_path, dtype="<f8", count=metadata["history_length"]
+            )
+        else:
+            snapshot[name] = np.memmap(
+                history_path,
+                dtype="<f8",
+                mode=mmap_mode,
+                shape=(metadata["history_length"],),
+            )
+    return snapshot, metadata["scenario_index"]
+
+
+class CheckpointObserver(IRunObserver):
+    """Observer saving the fleet's snapshot and the scenario's index every given number of steps, so that an interrupted run can be resumed from its last checkpoint (see 'simulate_from_checkpoint').
+
+    Only the time and grades of the steps run since the previous checkpoint are saved, appended to the history of the previous ones (see 'save_checkpoint'). A last checkpoint is saved at the end of the run.
+
+    Parameters
+    ----------
+    fleet : Fleet
+        Fleet of the observed run.
+    path : str
+        Path of the checkpoint's directory.
+    interval : int
+        Number of steps between two checkpoints.
+    start_index : int
+        Index, in the whole scenario, of the first task of the observed run, not null for resumed runs.
+    """
+
+    def __init__(
+        self, fleet: Fleet, path: str, interval: int = 1000, start_index: int = 0
+    ) -> None:
+        if interval < 1:
+            raise ValueError("The interval must be a positive number of steps.")
+        self.fleet = fleet
+        self.path = path
+        self.interval = interval
+        self.start_index = start_index
+        self.__scenario_index = start_index
+        self.__time: List[float] = []
+        self.__grades: List[float] = []
+
+    def on_start(self, tasks_number: Optional[int]) -> None:
+        self.__scenario_index = self.start_index
+        self.__time = [self.fleet.time[-1]]
+        self.__grades = [self.fleet.grades[-1]]
+
+    def on_step(
+        self, index: int, time: float, grade: float, counters: FleetCounters
+    ) -> None:
+        self.__scenario_index = self.start_index + index + 1
+        self.__time.append(time)
+        self.__grades.append(grade)
+        if (index + 1) % self.interval == 0:
+            self.save()
+
+    def on_end(self, counters: FleetCounters) -> None:
+        self.save()
+
+    def save(self) -> None:
+        """Saves the current state of the fleet, the time and grades of the steps run since the previous save and the index of the first scenario's task not run yet."""
+        snapshot = self.fleet.vehicles_state()
+        snapshot["time"] = np.array(self.__time, dtype=float)
+        snapshot["grades"] = np.array(self.__grades, dtype=float)
+        history_start = self.__scenario_index + 1 - len(self.__time)
+        save_checkpoint(snapshot, self.path, self.__scenario_index, history_start)
+        self.__time = self.__time[-1:]
+        self.__grades = self.__grades[-1:]
+
+
+def simulate_from_checkpoint(
+    fleet: Fleet,
+    scenario: Sequence[Tuple[float, float]],
+    use_priority_criterion: str,
+    path: str,
+    interval: int = 1000,
+) -> ColumnarOutputsData:
+    """Runs a scenario on a fleet with periodic checkpoints, resuming it from the last checkpoint at path if any.
+
+    Parameters
+    ----------
+    fleet : Fleet
+        Fleet on which to run the scenario.
+    scenario : Sequence[Tuple[float, float]]
+        Whole scenario of fleet tasks as a list of tuples: timelapse of task (s), task's needed fleet's load.
+    use_priority_criterion : str
+        Criterion to use to sort vehicles.
+    path : str
+        Path of the checkpoint's directory.
+    interval : int
+        Number of steps between two checkpoints.
+
+    Returns
+    -------
+    ColumnarOutputsData
+        Outputs of the computing, as if the run had not been interrupted.
+    """
+    snapshot, scenario_index = None, 0
+    if _state_path(path) is not None:
+        snapshot, scenario_index = load_checkpoint(path, mmap_mode=None)
+    return simulate(
+        fleet,
+        scenario[scenario_index:],
+        use_priority_criterion,
+        snapshot,
+        CheckpointObserver(fleet, path, interval, scenario_index),
+    )
@@ -0,0 +1,247 @@
+import argparse
+import os
+from copy import deepcopy
+from json import dumps
+from typing import Dict, List, Optional, Union
+from .domain.core import Fleet, FleetControler, iter_simulate, simulate
+from .domain.criterions import criterion_names
+from .domain.data_models import ColumnarOutputsData
+from .domain.observers import IRunObserver, PhaseProfiler, ProgressObserver
+from .domain.server import IObtainFleetData
+from .domain.user import IRequestInputsData, IStreamInputsData
+from .report import plot_outputs
+from .server import JsonServerAdapter, NpyServerAdapter
+from .user import JsonScenarioAdapter, NdjsonScenarioAdapter, NpyScenarioAdapter
+
+CRITERIONS = ["PERFORMANT", "POOR", "MEDIUM"]
+ENGINES = ["OBJECT", "VECTORIZED", "EVENT"]
+
+
+def load_fleet(path: Optional[str]) -> IObtainFleetData:
+    """Returns the resources adapter of a fleet file, chosen after its extension.
+
+    Parameters
+    ----------
+    path : Optional[str]
+        Path of a JSON file, of a '.npz' archive or of a directory of '.npy' columns, the packaged fleet if None.
+
+    Returns
+    -------
+    IObtainFleetData
+        The resources adapter.
+    """
+    if path is None or path.endswith(".json"):
+        return JsonServerAdapter(path)
+    return NpyServerAdapter(path)
+
+
+def load_scenario(
+    path: Optional[str], fleet_controler: FleetControler
+) -> Union[IRequestInputsData, IStreamInputsData]:
+    """Returns the inputs adapter of a scenario file, chosen after its extension, read without criterion to be run with several ones.
+
+    NDJSON scenarios are streamed: they are read task by task each time they are run, instead of being loaded at once.
+
+    Parameters
+    ----------
+    path : Optional[str]
+        Path of a JSON file, of a NDJSON file, of a '.npz' archive or of a directory of '.npy' columns, the packaged scenario if None.
+    fleet_controler : FleetControler
+        Controler of the business logic.
+
+    Returns
+    -------
+    Union[IRequestInputsData, IStreamInputsData]
+        The inputs adapter.
+    """
+    if path is not None and path.endswith(".ndjson"):
+        return NdjsonScenarioAdapter(fleet_controler, path)
+    if path is None or path.endswith(".json"):
+        return JsonScenarioAdapter(fleet_controler, path)
+    return NpyScenarioAdapter(fleet_controler, path)
+
+
+def run(
+    fleet: Fleet,
+    inputs_adapter: Union[IRequestInputsData, IStreamInputsData],
+    use_priority_criterion: str,
+    observer: Optional[IRunObserver] = None,
+) -> ColumnarOutputsData:
+    """Runs the scenario of an inputs adapter on a fleet with a criterion, streaming it if the adapter does.
+
+    Parameters
+    ----------
+    fleet : Fleet
+        Fleet on which to run the scenario.
+    inputs_adapter : Union[IRequestInputsData, IStreamInputsData]
+        Inputs adapter of the scenario (see 'load_scenario').
+    use_priority_criterion : str
+        Criterion to use to sort vehicles.
+    observer : Optional[IRunObserver]
+        Observer notified after each step, the run is not instrumented if None.
+
+    Returns
+    -------
+    ColumnarOutputsData
+        Outputs of the computing.
+    """
+    if isinstance(inputs_adapter, IStreamInputsData):
+        return ColumnarOutputsData.concatenate(
+            iter_simulate(
+                fleet,
+                inputs_adapter.iter_scenario(),
+                use_priority_criterion,
+                observer=observer,
+            )
+        )
+    return simulate(
+        fleet, inputs_adapter.data.scenario, use_priority_criterion, observer=observer
+    )
+
+
+def profile(
+    fleet_controler: FleetControler,
+    inputs_adapter: Union[IRequestInputsData, IStreamInputsData],
+    use_priority_criterions: List[str],
+    directory: str,
+) -> Dict[str, ColumnarOutputsData]:
+    """Runs each criterion in process with a phase profiler attached and writes its reports.
+
+    A "<criterion>.txt" summary and a "<criterion>.folded" stack dump, to be rendered by flamegraph tools, are written per criterion, as well as an "all.folded" dump rooted on criterions.
+
+    Parameters
+    ----------
+    fleet_controler : FleetControler
+        Controler of the business logic.
+    inputs_adapter : Union[IRequestInputsData, IStreamInputsData]
+        Inputs adapter of the scenario (see 'load_scenario').
+    use_priority_criterions : List[str]
+        Criterions to run.
+    directory : str
+        Directory of the reports, created if needed.
+
+    Returns
+    -------
+    Dict[str, ColumnarOutputsData]
+        Outputs of each criterion.
+    """
+    os.makedirs(directory, exist_ok=True)
+    outputs, stacks = {}, []
+    for use_priority_criterion in use_priority_criterions:
+        fleet = deepcopy(fleet_controler.fleet)
+        fleet.profiler = PhaseProfiler()
+        outputs[use_priority_criterion] = run(
+            fleet, inputs_adapter, use_priority_criterion
+        )
+        with open(
+            os.path.join(directory, use_priority_criterion + ".txt"), "w"
+        ) as summary_file:
+            summary_file.write(fleet.profiler.summary() + "\n")
+        with open(
+            os.path.join(directory, use_priority_criterion + ".folded"), "w"
+        ) as folded_file:
+            folded_file.write(fleet.profiler.folded())
+        stacks.append(fleet.profiler.folded(use_priority_criterion))
+    with open(os.path.join(directory, "all.folded"), "w") as folded_file:
+        folded_file.write("".join(stacks))
+    return outputs
+
+
+def plot(
+    outputs: Dict[str, ColumnarOutputsData], path: Optional[str] = None
+) -> None:
+    """Plots the grades of each criterion, downsampled, saved at path if given, shown otherwise."""
+    plot_outputs(
+        {
+            "{} criterion".format(use_priority_criterion.capitalize()): output
+            for use_priority_criterion, output in outputs.items()
+        },
+        path,
+    )
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    """Runs a scenario on a fleet with several criterions from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="fleet_operator",
+        description="Simulates a usage scenario on an EV fleet for several sorting criterions.",
+    )
+    parser.add_argument(
+        "--fleet",
+        help="Fleet's JSON file, '.npz' archive or directory of '.npy' columns, the packaged fleet by default.",
+    )
+    parser.add_argument(
+        "--scenario",
+        help="Scenario's JSON or NDJSON file, '.npz' archive or directory of '.npy' columns, the packaged scenario by default. NDJSON scenarios are streamed and their runs are sequential.",
+    )
+    parser.add_argument(
+        "--criterions", nargs="+", choices=criterion_names(), default=CRITERIONS
+    )
+    parser.add_argument("--engine", choices=ENGINES, default="OBJECT")
+    parser.add_argument(
+        "--charging-allocation", choices=["SORTED", "NEEDIEST"], default="SORTED"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Maximum number of worker processes, the number of processors by default.",
+    )
+    parser.add_argument("--output", help="JSON file to write the outputs to.")
+    parser.add_argument(
+        "--plot",
+        nargs="?",
+        const="",
+        help="Plots the grades, saved to the given image file or shown if none.",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Reports the progress of each run (runs are then sequential).",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIRECTORY",
+        help="Times the phases of every step and writes summaries and flamegraph stacks to DIRECTORY (runs are then sequential).",
+    )
+    args = parser.parse_args(arguments)
+
+    fleet_controler = FleetControler(
+        load_fleet(args.fleet),
+        engine=args.engine,
+        charging_allocation=args.charging_allocation,
+    )
+    inputs_adapter = load_scenario(args.scenario, fleet_controler)
+    if args.profile is not None:
+        outputs = profile(
+            fleet_controler, inputs_adapter, args.criterions, args.profile
+        )
+    elif args.progress or isinstance(inputs_adapter, IStreamInputsData):
+        outputs = {
+            use_priority_criterion: run(
+                deepcopy(fleet_controler.fleet),
+                inputs_adapter,
+                use_priority_criterion,
+                observer=ProgressObserver() if args.progress else None,
+            )
+            for use_priority_criterion in args.criterions
+        }
+    else:
+        outputs = {
+            use_priority_criterion: output
+            for (_, use_priority_criterion), output in fleet_controler.run_grid(
+                [inputs_adapter.data.scenario], args.criterions, args.workers
+            ).items()
+        }
+
+    if args.output is not None:
+        with open(args.output, "w") as outputs_json:
+            outputs_json.write(
+                dumps(
+                    {
+                        use_priority_criterion: output.as_dict()
+                        for use_priority_criterion, output in outputs.items()
+                    }
+                )
+            )
+    if args.plot is not None:
+        plot(outputs, args.plot or None)
@@ -0,0 +1,49 @@
+import os
+from typing import Dict, Optional, Sequence
+import numpy as np
+
+
+def save_columns(columns: Dict[str, np.ndarray], path: str) -> None:
+    """Saves columns as a directory of binary '.npy' files, one per column.
+
+    Parameters
+    ----------
+    columns : Dict[str, np.ndarray]
+        Columns indexed by name.
+    path : str
+        Path of the directory, created if needed.
+    """
+    os.makedirs(path, exist_ok=True)
+    for name, column in columns.items():
+        np.save(os.path.join(path, name + ".npy"), np.ascontiguousarray(column))
+
+
+def load_columns(
+    path: str, names: Sequence[str], mmap_mode: Optional[str] = "r"
+) -> Dict[str, np.ndarray]:
+    """Loads columns from a directory of '.npy' files or from a '.npz' archive.
+
+    Columns of a directory are memory-mapped, those of an archive are read in memory as it can not be memory-mapped.
+
+    Parameters
+    ----------
+    path : str
+        Path of the directory or of the archive.
+    names : Sequence[str]
+        Names of the columns to load, missing ones are skipped.
+    mmap_mode : Optional[str]
+        Memory-map mode of a directory's columns (see 'numpy.load'), columns are read in memory if None.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Loaded columns indexed by name.
+    """
+    if os.path.isdir(path):
+        return {
+            name: np.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode)
+            for name in names
+            if os.path.exists(os.path.join(path, name + ".npy"))
+        }
+    with np.load(path) as archive:
+        return {name: archive[name] for name in names if name in archive.files}
@@ -0,0 +1,154 @@
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    Future,
+    LifoQueue,
+    QueueEmpty,
+    Semaphore,
+    get_running_loop,
+    shield,
+)
+from http.client import HTTPConnection, HTTPException
+from json import loads
+from typing import Optional
+
+
+class HttpConnectionPool:
+    """Pool of persistent HTTP/1.1 connections to a resources service.
+
+    Requests are sent from worker threads so that they do not block the event loop, each on an idle connection of the pool when there is one. At most size connections are open, and so at most size requests are in flight, at the same time, the connections of cancelled requests aside until their worker threads are done.
+    The pool's queue and semaphore are bound to an event loop, and created again with the idle connections carried over when the pool is used in another one, so that it can be reused across 'asyncio.run' calls. It must not be used by two running event loops at the same time.
+
+    Parameters
+    ----------
+    host : str
+        Host of the service.
+    port : Optional[int]
+        Port of the service, the HTTP default one if None.
+    size : int
+        Maximum number of open connections.
+    timeout : Optional[float]
+        Timeout of the connections' blocking operations (s).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int] = None,
+        size: int = 8,
+        timeout: Optional[float] = 30,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.size = size
+        self.timeout = timeout
+        self.__loop: Optional[AbstractEventLoop] = None
+        self.__slots: Optional[Semaphore] = None
+        self.__idle_connections: Optional[LifoQueue] = None
+        self.opened_connections_number = 0
+
+    async def get_json(self, path: str) -> object:
+        """Returns the decoded JSON body of a GET request.
+
+        A request failing on a reused connection, closed by the service meanwhile, is sent again once on a new one. A cancelled request's connection is dropped, and closed once its worker thread is done with it.
+
+        Parameters
+        ----------
+        path : str
+            Path of the resource.
+
+        Returns
+        -------
+        object
+            The decoded body.
+        """
+        self.__bind(get_running_loop())
+        async with self.__slots:
+            try:
+                connection = self.__idle_connections.get_nowait()
+                reused = True
+            except QueueEmpty:
+                connection, reused = self.__connect(), False
+            try:
+                body = await self.__request(connection, path)
+            except (HTTPException, ConnectionError):
+                connection.close()
+                if not reused:
+                    raise
+                connection = self.__connect()
+                try:
+                    body = await self.__request(connection, path)
+                except Exception:
+                    connection.close()
+                    raise
+            except Exception:
+                connection.close()
+                raise
+            self.__idle_connections.put_nowait(connection)
+        return loads(body)
+
+    def __bind(self, loop: AbstractEventLoop) -> None:
+        """Creates the queue and the semaphore in an event loop, carrying over the idle connections of the previous one."""
+        if loop is self.__loop:
+            return
+        idle_connections = LifoQueue()
+        while (
+            self.__idle_connections is not None
+            and not self.__idle_connections.empty()
+        ):
+            idle_connections.put_nowait(self.__idle_connections.get_nowait())
+        self.__loop = loop
+        self.__slots = Semaphore(self.size)
+        self.__idle_connections = idle_connections
+
+    async def __request(self, connection: HTTPConnection, path: str) -> bytes:
+        """Sends a GET request on a connection from a worker thread and returns its body."""
+        request = get_running_loop().run_in_executor(None, self.__get, connection, path)
+        try:
+            return await shield(request)
+        except CancelledError:
+            # The worker thread still uses the connection: it is closed once done
+
+            def close(request: Future) -> None:
+                if not request.cancelled():
+                    request.exception()  # Retrieved, so that it is not logged
+                connection.close()
+
+            request.add_done_callback(close)
+            raise
+
+    def __connect(self) -> HTTPConnection:
+        self.opened_connections_number += 1
+        return HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    @staticmethod
+    def __get(connection: HTTPConnection, path: str) -> bytes:
+        connection.request("GET", path, headers={"Accept": "application/json"})
+        response = connection.getresponse()
+        body = response.read()
+        if response.status != 200:
+            raise ValueError(
+                "GET {} failed with status {} {}.".format(
+                    path, response.status, response.reason
+                )
+            )
+        return body
+
+    async def close(self) -> None:
+        """Closes the idle connections."""
+        while (
+            self.__idle_connections is not None
+            and not self.__idle_connections.empty()
+        ):
+            self.__idle_connections.get_nowait().close()
+
+    async def __aenter__(self) -> "HttpConnectionPool":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return "HttpConnectionPool({}, {}, {})".format(
+            repr(self.host), self.port, self.size
+        )
@@ -1,11 +1,31 @@
-from functools import partial
-from enum import Enum
-from typing import Callable, Dict, List, Literal, Union, Tuple
+from enum import IntEnum
+from heapq import nlargest
+from operator import itemgetter
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Sized,
+    Union,
+    Tuple,
+)
 from copy import deepcopy
-from scipy import interpolate
+from math import sqrt
+import numpy as np
 from itertools import count, chain
 from .server import IObtainFleetData
-from .data_models import ResourcesData
+from .criterions import Criterion, FleetState, get_criterion, smallest_indexes
+from .data_models import ColumnarOutputsData, ColumnarResourcesData, ResourcesData
+from .observers import FleetCounters, IRunObserver, PhaseProfiler
+from .trajectories import TrajectoryRecorder, VehicleFlags
+from .ocv import TabulatedOCV
 from .utils import (
     EmptyCellError,
     FullCellError,
@@ -15,6 +35,243 @@ from .utils import (
 )
 
 
+class CellSpec(NamedTuple):
+    """Immutable parameters a 'Cell' is built from, shared by its renewals."""
+
+    ocv: Callable
+    resistance: float
+    nominal_capacity: float
+    alpha: float
+    beta: float
+    tolerance: Optional[float]
+
+
+class BatterySpec(NamedTuple):
+    """Immutable parameters a 'Battery' is built from, shared by its renewals."""
+
+    cell: CellSpec
+    series_cells_number: int
+    parallel_branches_number: int
+
+
+class Status(IntEnum):
+    """Outcome of a cells' advance, mirroring the errors raised by 'Cell.use'."""
+
+    DONE = 0
+    EMPTY = 1
+    FULL = 2
+    TOO_POWERFULL = 3
+
+
+class CellsJump(NamedTuple):
+    """Outcome of the closed form use of some cells (see 'jump_cells'), one value per cell.
+
+    The state is the one reached after the completed time increments, it is meaningless for undecided cells.
+    """
+
+    statuses: np.ndarray
+    decided: np.ndarray
+    event_steps: np.ndarray
+    completed_steps: np.ndarray
+    available_capacity: np.ndarray
+    resistance: np.ndarray
+    tension: np.ndarray
+    current_capacity: np.ndarray
+
+
+def jump_cells(
+    current_capacity: np.ndarray,
+    available_capacity: np.ndarray,
+    resistance: np.ndarray,
+    tension: np.ndarray,
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    power: np.ndarray,
+    ocv: Callable,
+    steps_number: int,
+    tolerance: float,
+    event_steps: Optional[np.ndarray] = None,
+) -> CellsJump:
+    """Uses some cells for a number of time increments in closed form, each one stopping before its first event.
+
+    Over a use, capacity and resistance ageing are geometric sequences of the time increment's index and the current capacity is affine in it, so the time increments before a cell is empty are a division, as are the ones before it is full without capacity ageing, Newton's method refining them otherwise. Too powerfull discharges depend on the open circuit voltage curve and are bisected, only for the cells whose discharge is too powerfull at their first other event.
+    Predictions rely on the margins to the boundaries varying monotonously during a use, which holds as long as the open circuit voltage does not decrease with the state of charge and the current capacity varies faster than the available one. Cells for which this does not hold, whose prediction is not confirmed around its event or which get closer than the tolerance to a boundary before it are undecided, to be used time increment by time increment.
+
+    Parameters
+    ----------
+    current_capacity : np.ndarray
+        Current capacity of each cell (Wh).
+    available_capacity : np.ndarray
+        Maximum available capacity of each cell (Wh).
+    resistance : np.ndarray
+        Internal resistance of each cell (Ohms).
+    tension : np.ndarray
+        Tension of each cell (V).
+    alpha : np.ndarray
+        Capacity ageing coefficient of each cell (1/(W.s)).
+    beta : np.ndarray
+        Internal resistance ageing coefficient of each cell (1/(W.s)).
+    power : np.ndarray
+        Power of use of each cell (W).
+    ocv : Callable
+        Function of the state of charge returning open circuit voltage (V), shared by all the cells.
+    steps_number : int
+        Number of time increments of use.
+    tolerance : float
+        Relative margin to the empty, full and too powerfull discharge boundaries under which a cell is undecided.
+    event_steps : Optional[np.ndarray]
+        Time increments before the first event of each cell, as predicted by a previous decided jump with the same power that led to the current state, searched if None.
+
+    Returns
+    -------
+    CellsJump
+        Status, decision, time increments before the first event (infinite if none) and completed time increments of each cell, with its state after them.
+    """
+    capacity_ageing = 1 - alpha * Cell.TIME_INCREMENT * np.abs(power)
+    resistance_ageing = 1 + beta * Cell.TIME_INCREMENT * np.abs(power)
+    capacity_delta = power * Cell.TIME_INCREMENT / Constants.SECONDS_PER_HOUR
+
+    def margins(rows: Union[slice, np.ndarray], steps: np.ndarray) -> np.ndarray:
+        """Returns the too powerfull, empty and full margins of the time increments following some completed ones (one row of numbers of completed time increments per cell), with the open circuit voltage and the discriminant of the tension they are used at."""
+        cells_capacity_ageing = capacity_ageing[rows, None]
+        cells_available_capacity = available_capacity[rows, None]
+        cells_capacity_delta = capacity_delta[rows, None]
+        cells_current_capacity = (
+            current_capacity[rows, None] + steps * cells_capacity_delta
+        )
+        next_available_capacity = cells_available_capacity * cells_capacity_ageing ** (
+            steps + 1
+        )
+        next_current_capacity = cells_current_capacity + cells_capacity_delta
+        cells_ocv = ocv(
+            np.minimum(
+                np.maximum(
+                    cells_current_capacity
+                    / (cells_available_capacity * cells_capacity_ageing ** steps),
+                    0,
+                ),
+                1,
+            )
+        )
+        delta = (
+            cells_ocv ** 2
+            + 4
+            * resistance[rows, None]
+            * resistance_ageing[rows, None] ** steps
+            * power[rows, None]
+        )
+        return np.stack(
+            (
+                delta / cells_ocv ** 2,
+                next_current_capacity / cells_available_capacity,
+                (next_available_capacity - next_current_capacity)
+                / next_available_capacity,
+                cells_ocv,
+                delta,
+            )
+        )
+
+    def points(event_steps: np.ndarray) -> np.ndarray:
+        """Returns the numbers of completed time increments whose following one is checked: the event's, the last completed, the first and the one before the event."""
+        events = np.where(np.isfinite(event_steps), event_steps, 0)
+        previous = np.maximum(events - 1, 0)
+        return np.stack(
+            (
+                events,
+                np.minimum(previous, steps_number - 1),
+                np.zeros(len(event_steps)),
+                previous,
+            ),
+            axis=1,
+        )
+
+    searched = event_steps is None
+    if searched:
+        discharging = capacity_delta < 0
+        charging = capacity_delta > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            empty_steps = np.where(
+                discharging, np.floor(current_capacity / -capacity_delta), np.inf
+            )
+            full_root = (available_capacity - current_capacity) / capacity_delta
+            logarithm = np.log(capacity_ageing)
+            if (charging & (logarithm != 0)).any():
+                full_root[:] = 0
+                for _ in range(50):  # Newton's method, from the left of the root
+                    aged_capacity = available_capacity * capacity_ageing ** full_root
+                    step = np.where(
+                        charging,
+                        (aged_capacity - current_capacity - full_root * capacity_delta)
+                        / (aged_capacity * logarithm - capacity_delta),
+                        0,
+                    )
+                    full_root -= step
+                    if not (np.abs(step) > 1e-9).any():
+                        break
+        event_steps = np.minimum(
+            empty_steps,
+            np.where(charging, np.maximum(np.floor(full_root), 0), np.inf),
+        )
+        decided = (capacity_ageing > 0) & (
+            ~discharging | (-capacity_delta > (1 - capacity_ageing) * current_capacity)
+        )
+    else:
+        event_steps = np.asarray(event_steps, dtype=float)
+        decided = np.ones(len(power), dtype=bool)
+    points_margins = margins(slice(None), points(event_steps))
+    if searched:
+        # Discharges too powerfull before their other event are bisected
+        bisected = np.flatnonzero(
+            np.isfinite(event_steps) & (event_steps > 0) & (points_margins[0, :, 3] < 0)
+        )
+        if len(bisected):
+            low, high = np.zeros(len(bisected)), event_steps[bisected] - 1
+            while (low < high).any():
+                middle = np.floor((low + high) / 2)
+                too_powerfull = margins(bisected, middle[:, None])[0, :, 0] < 0
+                active = low < high
+                high = np.where(active & too_powerfull, middle, high)
+                low = np.where(active & ~too_powerfull, middle + 1, low)
+            event_steps[bisected] = high
+            points_margins[:, bisected] = margins(bisected, points(high))
+
+    failures = points_margins[:3] < 0
+    finite_events = np.isfinite(event_steps)
+    within = event_steps < steps_number
+    decided &= ~(finite_events & ~failures[:, :, 0].any(axis=0))
+    if searched:
+        near = np.abs(points_margins[:3]) <= tolerance
+        decided &= (
+            ~((event_steps > 0) & failures[:, :, 2:].any(axis=(0, 2)))
+            & ~near[:, :, 2:].any(axis=(0, 2))
+            & ~(finite_events & near[:, :, 0].any(axis=0))
+        )
+
+    statuses = np.full(len(power), Status.DONE, dtype=np.int8)
+    too_powerfull = within & failures[0, :, 0]
+    empty = within & ~too_powerfull & failures[1, :, 0]
+    full = within & ~too_powerfull & ~empty & failures[2, :, 0]
+    statuses[too_powerfull] = Status.TOO_POWERFULL
+    statuses[empty] = Status.EMPTY
+    statuses[full] = Status.FULL
+    completed_steps = np.minimum(event_steps, steps_number)
+    return CellsJump(
+        statuses,
+        decided,
+        event_steps,
+        completed_steps.astype(np.int64),
+        available_capacity * capacity_ageing ** completed_steps,
+        resistance * resistance_ageing ** completed_steps,
+        np.where(
+            completed_steps > 0,
+            (points_margins[3, :, 1] + np.sqrt(np.maximum(points_margins[4, :, 1], 0)))
+            / 2,
+            tension,
+        ),
+        current_capacity + completed_steps * capacity_delta,
+    )
+
+
 class Cell:
     """Battery object.
 
@@ -30,9 +287,25 @@ class Cell:
         Cell's capacity ageing coefficient (1/(W.s)).
     beta : float
         Cell's internal resistance ageing coefficient (1/(W.s)).
+    tolerance : Optional[float]
+        Relative margin to the empty, full and too powerfull discharge boundaries under which a use is integrated time increment by time increment. If None, uses are always integrated time increment by time increment, otherwise they are integrated in closed form.
     """
 
-    DEFAULT_OCV = interpolate.interp1d([0, 1], [3, 4.2], bounds_error=True)
+    __slots__ = (
+        "spec",
+        "soc",
+        "ocv",
+        "resistance",
+        "alpha",
+        "beta",
+        "tolerance",
+        "tension",
+        "nominal_capacity",
+        "available_capacity",
+        "current_capacity",
+    )
+
+    DEFAULT_OCV = TabulatedOCV([0, 1], [3, 4.2])
     DEFAULT_RESISTANCE = 70 * 1e-3
     DEFAULT_NOMINAL_CAPACITY = 2600 * 1e-3 * Constants.SECONDS_PER_HOUR
     TIME_INCREMENT = 120
@@ -44,14 +317,37 @@ class Cell:
         nominal_capacity: float = DEFAULT_NOMINAL_CAPACITY,
         alpha: float = 0,
         beta: float = 0,
+        tolerance: Optional[float] = None,
     ) -> None:
-        self.soc = 1
+        self.spec = CellSpec(ocv, resistance, nominal_capacity, alpha, beta, tolerance)
         self.ocv = ocv
-        self.resistance = resistance
         self.alpha = alpha
         self.beta = beta
+        self.tolerance = tolerance
+        self.renew()
+
+    @classmethod
+    def from_spec(cls, spec: CellSpec) -> "Cell":
+        """Builds a new cell from its parameters.
+
+        Parameters
+        ----------
+        spec : CellSpec
+            Parameters of the cell.
+
+        Returns
+        -------
+        Cell
+            The new cell.
+        """
+        return cls(*spec)
+
+    def renew(self) -> None:
+        """Restores the cell's state at birth."""
+        self.soc = 1
+        self.resistance = self.spec.resistance
         self.tension = self.ocv(self.soc)
-        self.nominal_capacity = self.c_to_wh(nominal_capacity, self.tension)
+        self.nominal_capacity = self.c_to_wh(self.spec.nominal_capacity, self.tension)
         self.available_capacity = self.nominal_capacity
         self.current_capacity = self.available_capacity
 
@@ -91,13 +387,14 @@ class Cell:
         float
             Cell's voltage (V).
         """
-        delta = self.ocv(self.soc) ** 2 + 4 * self.resistance * power
+        ocv = self.ocv(self.soc)
+        delta = ocv ** 2 + 4 * self.resistance * power
         if delta < 0:
             raise TooPowerfullDischargeError
         elif delta == 0:
-            return self.ocv(self.soc) / 2
+            return ocv / 2
         else:
-            return (self.ocv(self.soc) + delta ** 0.5) / 2
+            return (ocv + sqrt(delta)) / 2
 
     def __use_on_time_increment(self, power: float) -> None:
         """Uses the cell for a time increment.
@@ -123,6 +420,72 @@ class Cell:
             self.current_capacity += capacity_delta
             self.soc = self.current_capacity / self.available_capacity
 
+    def __integrate(self, steps_number: int, power: float) -> bool:
+        """Uses the cell for a number of time increments in closed form (see 'jump_cells').
+
+        Parameters
+        ----------
+        steps_number : int
+            Number of time increments of use.
+        power : float
+            Power of use (W).
+
+        Returns
+        -------
+        bool
+            False if a boundary is too close to be decided in closed form (the cell is then left untouched), True otherwise.
+        """
+        jump = jump_cells(
+            np.array([self.current_capacity], dtype=float),
+            np.array([self.available_capacity], dtype=float),
+            np.array([self.resistance], dtype=float),
+            np.array([self.tension], dtype=float),
+            np.array([self.alpha], dtype=float),
+            np.array([self.beta], dtype=float),
+            np.array([power], dtype=float),
+            self.ocv,
+            steps_number,
+            self.tolerance,
+        )
+        if not jump.decided[0]:
+            return False
+        if jump.completed_steps[0] > 0:
+            self.available_capacity = jump.available_capacity[0]
+            self.resistance = jump.resistance[0]
+            self.tension = jump.tension[0]
+            self.current_capacity = jump.current_capacity[0]
+            self.soc = self.current_capacity / self.available_capacity
+        if jump.statuses[0] == Status.TOO_POWERFULL:
+            raise TooPowerfullDischargeError
+        elif jump.statuses[0] == Status.EMPTY:
+            raise EmptyCellError
+        elif jump.statuses[0] == Status.FULL:
+            raise FullCellError
+        return True
+
+    @classmethod
+    def steps_number(cls, timelapse: float) -> int:
+        """Computes the number of time increments of a use over a timelapse.
+
+        Parameters
+        ----------
+        timelapse : float
+            Timelapse of use (s).
+
+        Returns
+        -------
+        int
+            Number of time increments.
+        """
+        if timelapse <= 0:
+            return 0
+        steps_number = int(np.ceil(timelapse / cls.TIME_INCREMENT))
+        while cls.TIME_INCREMENT * steps_number < timelapse:
+            steps_number += 1
+        while cls.TIME_INCREMENT * (steps_number - 1) >= timelapse:
+            steps_number -= 1
+        return steps_number
+
     def use(self, timelapse: float, power: float) -> None:
         """Uses the cell for a given timelapse with a given power.
 
@@ -133,14 +496,23 @@ class Cell:
         power : float
             Power of use (W).
         """
+        if self.tolerance is not None and self.__integrate(
+            self.steps_number(timelapse), power
+        ):
+            return
         elapsed_time = 0
         while elapsed_time < timelapse:
             elapsed_time += self.TIME_INCREMENT
             self.__use_on_time_increment(power)
 
     def __repr__(self) -> str:
-        return "Cell({}, {}, {}, {}, {})".format(
-            self.ocv, self.resistance, self.nominal_capacity, self.alpha, self.beta
+        return "Cell({}, {}, {}, {}, {}, {})".format(
+            self.ocv,
+            self.resistance,
+            self.nominal_capacity,
+            self.alpha,
+            self.beta,
+            self.tolerance,
         )
 
     def c_to_wh(self, c_capacity: float, tension: float) -> float:
@@ -174,18 +546,61 @@ class Battery:
         Number of parallel branches.
     """
 
-    MINIMUM_AVAILABLE_CAPACITY_RATIO: float = 0.3
+    __slots__ = (
+        "spec",
+        "cell",
+        "series_cells_number",
+        "parallel_branches_number",
+        "nominal_capacity",
+        "available_capacity",
+        "current_capacity",
+        "tension",
+    )
+
+    MINIMUM_AVAILABLE_CAPACITY_RATIO: float = Constants.MINIMUM_AVAILABLE_CAPACITY_RATIO
 
     def __init__(
         self,
-        cell: Cell = Cell(),
+        cell: Optional[Cell] = None,
         series_cells_number: int = 100,
         parallel_branches_number: int = 10,
     ) -> None:
-        self.cell = cell
+        self.cell = Cell() if cell is None else cell
         self.series_cells_number = series_cells_number
         self.parallel_branches_number = parallel_branches_number
-        self.nominal_capacity = self.cell.nominal_capacity * parallel_branches_number
+        self.spec = BatterySpec(
+            self.cell.spec, series_cells_number, parallel_branches_number
+        )
+        self.__update()
+
+    @classmethod
+    def from_spec(cls, spec: BatterySpec) -> "Battery":
+        """Builds a new battery from its parameters.
+
+        Parameters
+        ----------
+        spec : BatterySpec
+            Parameters of the battery.
+
+        Returns
+        -------
+        Battery
+            The new battery.
+        """
+        return cls(
+            Cell.from_spec(spec.cell),
+            spec.series_cells_number,
+            spec.parallel_branches_number,
+        )
+
+    def renew(self) -> None:
+        """Restores the battery's state at birth."""
+        self.cell.renew()
+        self.__update()
+
+    def __update(self) -> None:
+        """Sets the battery's capacities and tension from its cell's ones."""
+        self.nominal_capacity = self.cell.nominal_capacity * self.parallel_branches_number
         self.available_capacity = (
             self.cell.available_capacity * self.parallel_branches_number
         )
@@ -236,23 +651,30 @@ class Vehicle:
     ----------
     power : float
         The electrical power consumption of the vehicle (W).
+    battery : Optional[Battery]
+        Battery of the vehicle, or any battery following its interface such as 'PackBattery', a default 'Battery' if None.
 
     Attributes
     ----------
     battery : Battery
-        Battery of the vehicle.
+        Battery of the vehicle, renewed and upgraded as one of its type.
     id : str
         Unique identification code of the vehicle.
+    counters : Optional[FleetCounters]
+        Counters of the fleet of the vehicle, if any, counting its batteries renewals and upgrades.
     """
 
+    __slots__ = ("power", "battery", "id", "counters", "__needed_battery")
+
     DEFAULT_POWER: float = 20e3
     __ids = count(0)
 
-    def __init__(self, power: float = 20e3, battery: Battery = Battery()) -> None:
+    def __init__(self, power: float = 20e3, battery: Optional[Battery] = None) -> None:
         self.power = power
-        self.battery = battery
+        self.battery = Battery() if battery is None else battery
         self.id = "V#{}".format(next(self.__ids))
-        self.__needed_battery = deepcopy(battery)
+        self.counters: Optional[FleetCounters] = None
+        self.__needed_battery: BatterySpec = self.battery.spec
 
     def use(self, timelapse: float) -> None:
         """Uses the vehicle for a given time lapse.
@@ -290,7 +712,12 @@ class Vehicle:
         self,
     ) -> None:
         """Renew the battery of a vehicle."""
-        self.battery = deepcopy(self.__needed_battery)
+        if self.counters is not None:
+            self.counters.renewals_number += 1
+        if self.battery.spec is self.__needed_battery:
+            self.battery.renew()
+        else:
+            self.battery = type(self.battery).from_spec(self.__needed_battery)
 
     def upgrade_battery(
         self, series_multiplier: int = 1, parallel_multiplier: int = 2
@@ -304,17 +731,100 @@ class Vehicle:
         parallel_multiplier : int
             Multiplier of the number of branches.
         """
-        self.battery = Battery(
-            deepcopy(self.__needed_battery.cell),
-            self.__needed_battery.series_cells_number * series_multiplier,
-            self.__needed_battery.parallel_branches_number * parallel_multiplier,
+        if self.counters is not None:
+            self.counters.upgrades_number += 1
+        self.__needed_battery = self.__needed_battery._replace(
+            series_cells_number=self.__needed_battery.series_cells_number
+            * series_multiplier,
+            parallel_branches_number=self.__needed_battery.parallel_branches_number
+            * parallel_multiplier,
         )
-        self.__needed_battery = deepcopy(self.battery)
+        self.battery = type(self.battery).from_spec(self.__needed_battery)
+
+    def snapshot(self) -> Tuple[float, ...]:
+        """Returns the state of the vehicle's battery and of its needed one.
+
+        Returns
+        -------
+        Tuple[float, ...]
+            State of the vehicle, in the order of 'VEHICLE_STATE'.
+        """
+        cell = self.battery.cell
+        return (
+            self.__needed_battery.series_cells_number,
+            self.__needed_battery.parallel_branches_number,
+            cell.soc,
+            cell.resistance,
+            cell.tension,
+            cell.available_capacity,
+            cell.current_capacity,
+            self.battery.available_capacity,
+            self.battery.current_capacity,
+        )
+
+    def restore(self, state: Sequence[float]) -> None:
+        """Restores the state of the vehicle's battery and of its needed one.
+
+        Parameters
+        ----------
+        state : Sequence[float]
+            State of the vehicle, in the order of 'VEHICLE_STATE'.
+        """
+        if not isinstance(self.battery, Battery):
+            raise TypeError(
+                "Only vehicles with a 'Battery' can be restored, not {}.".format(
+                    repr(self.battery)
+                )
+            )
+        (
+            series_cells_number,
+            parallel_branches_number,
+            soc,
+            resistance,
+            tension,
+            available_capacity,
+            current_capacity,
+            battery_available_capacity,
+            battery_current_capacity,
+        ) = state
+        if (
+            series_cells_number != self.__needed_battery.series_cells_number
+            or parallel_branches_number != self.__needed_battery.parallel_branches_number
+        ):
+            self.__needed_battery = BatterySpec(
+                self.__needed_battery.cell,
+                int(series_cells_number),
+                int(parallel_branches_number),
+            )
+        if self.battery.spec != self.__needed_battery:
+            self.battery = Battery.from_spec(self.__needed_battery)
+        cell = self.battery.cell
+        cell.soc = soc
+        cell.resistance = resistance
+        cell.tension = tension
+        cell.available_capacity = available_capacity
+        cell.current_capacity = current_capacity
+        self.battery.available_capacity = battery_available_capacity
+        self.battery.current_capacity = battery_current_capacity
+        self.battery.tension = tension * self.battery.series_cells_number
 
     def __repr__(self) -> str:
         return "Vehicle({}, {})".format(self.power, repr(self.battery))
 
 
+VEHICLE_STATE: Tuple[str, ...] = (
+    "series_cells_numbers",
+    "parallel_branches_numbers",
+    "soc",
+    "resistance",
+    "tension",
+    "available_capacity",
+    "current_capacity",
+    "batteries_available_capacity",
+    "batteries_current_capacity",
+)
+
+
 class ChargingStation:
     """Charging station object.
 
@@ -355,20 +865,147 @@ class ChargingStation:
         return "ChargingStation({})".format(self.power)
 
 
+class PriorityIndex:
+    """Vehicles scored by a priority criterion, all at once.
+
+    The state of every vehicle is cached in arrays, only read again for vehicles marked as dirty, so that scoring the fleet costs one vectorized call of the criterion per selection. Ties are broken by order of addition, as a stable sort of the vehicles would do.
+    """
+
+    def __init__(self) -> None:
+        self.__vehicles: List[Vehicle] = []
+        self.__ranks: Dict[str, int] = {}
+        self.__state: np.ndarray = np.empty((len(FleetState._fields), 0))
+        self.__dirty_ranks: Set[int] = set()
+
+    def add(self, vehicle: Vehicle) -> None:
+        """Adds a vehicle, or replaces the one with the same id.
+
+        Parameters
+        ----------
+        vehicle : Vehicle
+            Vehicle to add.
+        """
+        if vehicle.id in self.__ranks:
+            self.__vehicles[self.__ranks[vehicle.id]] = vehicle
+        else:
+            self.__ranks[vehicle.id] = len(self.__vehicles)
+            self.__vehicles.append(vehicle)
+        self.__dirty_ranks.add(self.__ranks[vehicle.id])
+
+    def mark_dirty(self, vehicles: Iterable[Vehicle]) -> None:
+        """Marks vehicles whose state may have changed.
+
+        Parameters
+        ----------
+        vehicles : Iterable[Vehicle]
+            Vehicles whose battery has been used.
+        """
+        self.__dirty_ranks.update(self.__ranks[vehicle.id] for vehicle in vehicles)
+
+    def invalidate(self) -> None:
+        """Marks every vehicle as dirty."""
+        self.__dirty_ranks.update(range(len(self.__vehicles)))
+
+    def __refresh(self) -> None:
+        """Reads the state of dirty vehicles back into the cached arrays."""
+        missing = len(self.__vehicles) - self.__state.shape[1]
+        if missing > 0:
+            self.__state = np.concatenate(
+                (self.__state, np.empty((len(self.__state), missing))), axis=1
+            )
+        ranks = list(self.__dirty_ranks)
+        self.__state[:, ranks] = np.array(
+            [
+                (
+                    vehicle.battery.current_capacity,
+                    vehicle.battery.nominal_capacity,
+                    vehicle.battery.available_capacity,
+                    vehicle.battery.cell.soc,
+                    vehicle.power,
+                )
+                for vehicle in map(self.__vehicles.__getitem__, ranks)
+            ],
+            dtype=float,
+        ).T
+        self.__dirty_ranks.clear()
+
+    def state(self) -> FleetState:
+        """Returns the state of the vehicles, in their order of addition."""
+        if self.__dirty_ranks:
+            self.__refresh()
+        return FleetState(*self.__state)
+
+    def smallest(self, number: int, criterion: Criterion) -> List[Vehicle]:
+        """Returns the vehicles with the smallest criterion values.
+
+        Parameters
+        ----------
+        number : int
+            Number of vehicles to return.
+        criterion : Criterion
+            Function that takes a 'FleetState' instance as input and that returns the vehicles' criterion values (see 'register_criterion').
+
+        Returns
+        -------
+        List[Vehicle]
+            Vehicles sorted by increasing criterion value.
+        """
+        return [
+            self.__vehicles[rank]
+            for rank in smallest_indexes(criterion(self.state()), number).tolist()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.__vehicles)
+
+
 class Fleet:
     """Fleet object.
 
     A fleet contains several 'Vehicle' instances and has several 'ChargingStation' instances available to charge them.
+
+    Parameters
+    ----------
+    charging_allocation : Literal["SORTED", "NEEDIEST"]
+        Allocation of the charging stations at each step. "SORTED" plugs the vehicles following the used ones in the priority order, then the failed ones, in the stations' order. "NEEDIEST" plugs the vehicles not used successfully with the most missing capacity, skipping full ones, in the most powerful stations.
+
+    Attributes
+    ----------
+    counters : FleetCounters
+        Counters of the events occurred since the last reset.
+    profiler : Optional[PhaseProfiler]
+        Profiler timing the phases of each step, steps are not timed if None.
+    recorder : Optional[TrajectoryRecorder]
+        Recorder of the vehicles' trajectories, nothing is recorded if None.
     """
 
-    def __init__(self, *args: List[Union[Vehicle, ChargingStation]]) -> None:
+    def __init__(
+        self,
+        *args: List[Union[Vehicle, ChargingStation]],
+        charging_allocation: Literal["SORTED", "NEEDIEST"] = "SORTED",
+    ) -> None:
+        if charging_allocation not in ("SORTED", "NEEDIEST"):
+            raise ValueError(
+                "Unknown charging allocation {}.".format(repr(charging_allocation))
+            )
+        self.charging_allocation = charging_allocation
         self.__vehicles: Dict[str, Vehicle] = {}
+        self.__vehicles_indexes: Dict[str, int] = {}
         self.__charging_stations: List[ChargingStation] = []
+        self.__charging_stations_by_power: List[ChargingStation] = []
+        self.__priorities = PriorityIndex()
+        self.counters = FleetCounters()
+        self.profiler: Optional[PhaseProfiler] = None
+        self.recorder: Optional[TrajectoryRecorder] = None
         for arg in args:
             if isinstance(arg, Vehicle):
                 self.__vehicles[arg.id] = arg
+                self.__vehicles_indexes.setdefault(arg.id, len(self.__vehicles_indexes))
+                self.__priorities.add(arg)
+                arg.counters = self.counters
             elif isinstance(arg, ChargingStation):
                 self.__charging_stations.append(arg)
+        self.__sort_charging_stations()
         self.time = [0]
         self.grades = [0]
 
@@ -376,7 +1013,7 @@ class Fleet:
         self,
         timelapse: float,
         load: float,
-        use_priority_criterion: Literal["POOR", "MEDIUM", "PERFORMANT"],
+        use_priority_criterion: str,
     ) -> None:
         """Method to use the fleet.
 
@@ -389,69 +1026,201 @@ class Fleet:
             Time lapse of fleet use (s).
         load : float
             Load of use of the fleet.
-        use_priority_criterion : Literal["POOR", "MEDIUM", "PERFORMANT"]
-            Name of an implemented function that takes a 'Vehicle' instance as input and that returns a numerical sorting criterion (vehicle's battery's age for instance). Higher the criterion value is, higher the priority will be to use the vehicle.
+        use_priority_criterion : str
+            Name of a registered criterion (see 'register_criterion'), scoring the vehicles from their state. Lower the criterion value is, higher the priority will be to use the vehicle.
         """
+        profiler = self.profiler
+        recorder = self.recorder
+        counters = self.counters
+        if profiler is not None:
+            profiler.start()
         number_of_vehicles_to_use = round(load * len(self.__vehicles))
-        sorted_vehicles = sorted(
-            self.__vehicles.values(), key=Criterions[use_priority_criterion].value
-        )
-        vehicles_to_use = {
-            vehicle.id: vehicle
-            for vehicle in sorted_vehicles[:number_of_vehicles_to_use]
-        }
-        vehicles_to_charge = {
-            vehicle.id: vehicle
-            for vehicle in sorted_vehicles[number_of_vehicles_to_use:]
-        }
-        failed_vehicles = {}
+        prioritized_vehicles = self.__priorities.smallest(
+            number_of_vehicles_to_use
+            + (
+                len(self.__charging_stations)
+                if self.charging_allocation == "SORTED"
+                else 0
+            ),
+            get_criterion(use_priority_criterion),
+        )
+        vehicles_to_use = prioritized_vehicles[:number_of_vehicles_to_use]
+        vehicles_to_charge = prioritized_vehicles[number_of_vehicles_to_use:]
+        failed_vehicles = []
+        renewed_vehicles = []
+        if profiler is not None:
+            profiler.lap("select")
 
         grade = 0
-        for vehicle in vehicles_to_use.values():  # Loop on vehicles to use
+        for vehicle in vehicles_to_use:  # Loop on vehicles to use
+            if recorder is not None:
+                changes_number = counters.renewals_number + counters.upgrades_number
             try:
                 vehicle.use(timelapse)
             except EmptyCellError:  # A vehicle to use experiences a too low battery error, we add it at the first place of the list of vehicles to charge
-                failed_vehicles[vehicle.id] = vehicle
+                failed_vehicles.append(vehicle)
+                if profiler is not None:
+                    profiler.lap("use;failed_vehicle")
             else:
                 grade += 1
+                if profiler is not None:
+                    profiler.lap("use;vehicle")
+            if (
+                recorder is not None
+                and counters.renewals_number + counters.upgrades_number
+                != changes_number
+            ):
+                renewed_vehicles.append(vehicle)
 
         if len(vehicles_to_use) > 0:
             grade /= len(vehicles_to_use)
 
-        vehicles_to_use = {
-            vehicle.id: vehicle
-            for vehicle in vehicles_to_use.values()
-            if vehicle.id not in failed_vehicles.keys()
-        }
+        if self.charging_allocation == "NEEDIEST":
+            vehicles_to_charge = self.__neediest_vehicles(
+                vehicles_to_use, failed_vehicles
+            )
+            charging_stations = self.__charging_stations_by_power
+        else:
+            vehicles_to_charge = chain(vehicles_to_charge, failed_vehicles)
+            charging_stations = self.__charging_stations
+        if profiler is not None:
+            profiler.lap("allocate")
 
+        charged_vehicles = []
         for vehicle, charging_station in zip(
-            chain(vehicles_to_charge.values(), failed_vehicles.values()),
-            self.__charging_stations,
+            vehicles_to_charge, charging_stations
         ):  # Loop on vehicles to charge
             charging_station.plug_vehicle(vehicle)
+            charged_vehicles.append(vehicle)
+            if recorder is not None:
+                changes_number = counters.renewals_number
             try:
                 charging_station.charge(timelapse)
             except FullCellError:
-                pass
+                counters.full_stops_number += 1
+                if profiler is not None:
+                    profiler.lap("charge;full_vehicle")
+            else:
+                if profiler is not None:
+                    profiler.lap("charge;vehicle")
+            if recorder is not None and counters.renewals_number != changes_number:
+                renewed_vehicles.append(vehicle)
 
-        self.__vehicles.update(vehicles_to_use)
-        self.__vehicles.update(vehicles_to_charge)
-        self.__vehicles.update(failed_vehicles)
+        counters.empty_failures_number += len(failed_vehicles)
+        counters.occupied_charging_stations_number = len(charged_vehicles)
+        self.__priorities.mark_dirty(vehicles_to_use)
+        self.__priorities.mark_dirty(charged_vehicles)
 
         self.time.append(timelapse + self.time[-1])
         self.grades.append(grade + self.grades[-1])
+        if recorder is not None:
+            self.__record(
+                recorder,
+                vehicles_to_use,
+                failed_vehicles,
+                charged_vehicles,
+                renewed_vehicles,
+            )
+        if profiler is not None:
+            profiler.lap("bookkeeping")
+            profiler.stop()
+
+    def __neediest_vehicles(
+        self, vehicles_to_use: List[Vehicle], failed_vehicles: List[Vehicle]
+    ) -> List[Vehicle]:
+        """Returns the vehicles not used successfully with the most missing capacity, one per charging station at most.
+
+        Missing capacities are computed from the cells, as the batteries' ones are not updated by a failed use, and full vehicles are skipped. The selection keeps a heap of the charging stations' number of vehicles, ties being broken by insertion order.
+
+        Parameters
+        ----------
+        vehicles_to_use : List[Vehicle]
+            Vehicles used during the step.
+        failed_vehicles : List[Vehicle]
+            Vehicles which failed to be used during the step.
+
+        Returns
+        -------
+        List[Vehicle]
+            Vehicles by decreasing missing capacity.
+        """
+        busy_vehicles = {vehicle.id for vehicle in vehicles_to_use}.difference(
+            vehicle.id for vehicle in failed_vehicles
+        )
+        needs = (
+            (
+                (
+                    vehicle.battery.cell.available_capacity
+                    - vehicle.battery.cell.current_capacity
+                )
+                * vehicle.battery.series_cells_number
+                * vehicle.battery.parallel_branches_number,
+                vehicle,
+            )
+            for vehicle in self.__vehicles.values()
+            if vehicle.id not in busy_vehicles
+        )
+        return [
+            vehicle
+            for _, vehicle in nlargest(
+                len(self.__charging_stations),
+                (need for need in needs if need[0] > 0),
+                key=itemgetter(0),
+            )
+        ]
+
+    def __record(
+        self,
+        recorder: TrajectoryRecorder,
+        used_vehicles: List[Vehicle],
+        failed_vehicles: List[Vehicle],
+        charged_vehicles: List[Vehicle],
+        renewed_vehicles: List[Vehicle],
+    ) -> None:
+        """Flags the vehicles of a step, used ones being those used successfully, and ends the step of the recorder."""
+        indexes = self.__vehicles_indexes
+        failed_ids = {vehicle.id for vehicle in failed_vehicles}
+        recorder.mark(
+            [
+                indexes[vehicle.id]
+                for vehicle in used_vehicles
+                if vehicle.id not in failed_ids
+            ],
+            VehicleFlags.USED,
+        )
+        recorder.mark(
+            [indexes[vehicle_id] for vehicle_id in failed_ids], VehicleFlags.FAILED
+        )
+        recorder.mark(
+            [indexes[vehicle.id] for vehicle in charged_vehicles], VehicleFlags.CHARGED
+        )
+        recorder.mark(
+            [indexes[vehicle.id] for vehicle in renewed_vehicles], VehicleFlags.RENEWED
+        )
+        recorder.record(self)
+
+    def __sort_charging_stations(self) -> None:
+        """Sorts the charging stations by decreasing power, ties being kept in insertion order."""
+        self.__charging_stations_by_power = sorted(
+            self.__charging_stations,
+            key=lambda charging_station: -charging_station.power,
+        )
 
     def extend_fleet(self, *args: List[Vehicle]) -> None:
         """Extends the fleet with new vehicles."""
         for arg in args:
             if isinstance(arg, Vehicle):
                 self.__vehicles[arg.id] = arg
+                self.__vehicles_indexes.setdefault(arg.id, len(self.__vehicles_indexes))
+                self.__priorities.add(arg)
+                arg.counters = self.counters
 
     def add_charging_stations(self, *args: List[ChargingStation]) -> None:
         """Adds new charging stations to the fleet."""
         for arg in args:
             if isinstance(arg, ChargingStation):
                 self.__charging_stations.append(arg)
+        self.__sort_charging_stations()
 
     def reset(self) -> None:
         """Resets the fleet vehicles and metrics."""
@@ -459,6 +1228,69 @@ class Fleet:
         self.grades = [0]
         for vehicle in self.__vehicles.values():
             vehicle.change_battery()
+        self.counters.reset()
+        self.__priorities.invalidate()
+        if self.recorder is not None:
+            self.recorder.reset()
+
+    def priority_state(self) -> FleetState:
+        """Returns the state of the fleet's vehicles scored by priority criterions, in the order vehicles were added."""
+        return self.__priorities.state()
+
+    def vehicles_state(self) -> Dict[str, np.ndarray]:
+        """Returns the state of the fleet's vehicles.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Vehicles' state columns named after 'VEHICLE_STATE', in the order vehicles were added.
+        """
+        states = np.array(
+            [vehicle.snapshot() for vehicle in self.__vehicles.values()], dtype=float
+        ).reshape(len(self.__vehicles), len(VEHICLE_STATE))
+        snapshot = {name: states[:, index] for index, name in enumerate(VEHICLE_STATE)}
+        snapshot["series_cells_numbers"] = snapshot["series_cells_numbers"].astype(np.int64)
+        snapshot["parallel_branches_numbers"] = snapshot[
+            "parallel_branches_numbers"
+        ].astype(np.int64)
+        return snapshot
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """Returns the state of the fleet.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Vehicles' state columns named after 'VEHICLE_STATE', in the order vehicles were added, and the fleet's time and grades.
+        """
+        snapshot = self.vehicles_state()
+        snapshot["time"] = np.array(self.time, dtype=float)
+        snapshot["grades"] = np.array(self.grades, dtype=float)
+        return snapshot
+
+    def restore(self, snapshot: Dict[str, np.ndarray]) -> None:
+        """Restores the state of the fleet.
+
+        Parameters
+        ----------
+        snapshot : Dict[str, np.ndarray]
+            State of a fleet with the same vehicles, as returned by 'snapshot'.
+        """
+        if len(snapshot["soc"]) != len(self.__vehicles):
+            raise ValueError(
+                "The snapshot has {} vehicles while the fleet has {}.".format(
+                    len(snapshot["soc"]), len(self.__vehicles)
+                )
+            )
+        states = zip(*(np.asarray(snapshot[name]).tolist() for name in VEHICLE_STATE))
+        for vehicle, state in zip(self.__vehicles.values(), states):
+            vehicle.restore(state)
+        self.time = np.asarray(snapshot["time"]).tolist()
+        self.grades = np.asarray(snapshot["grades"]).tolist()
+        self.counters.reset()
+        self.__priorities.invalidate()
+        if self.recorder is not None:
+            self.recorder.reset()
 
     def __repr__(self) -> str:
         return "Fleet(*{})".format(
@@ -467,47 +1299,130 @@ class Fleet:
         )
 
 
-def performant_criterion(vehicle: Vehicle) -> float:
-    """Describe a criterion computing how long the vehicle can be used until battery's end of life.
+def simulate(
+    fleet: Fleet,
+    scenario: Sequence[Tuple[float, float]],
+    use_priority_criterion: str,
+    snapshot: Optional[Dict[str, np.ndarray]] = None,
+    observer: Optional[IRunObserver] = None,
+) -> ColumnarOutputsData:
+    """Runs a scenario on a fleet from its reset state or from a snapshot.
 
     Parameters
     ----------
-    vehicle: Vehicle
-        Vehicle on which to compute the criterion.
+    fleet : Fleet
+        Fleet on which to run the scenario.
+    scenario : Sequence[Tuple[float, float]]
+        Scenario of fleet tasks as a list of tuples: timelapse of task (s), task's needed fleet's load.
+    use_priority_criterion : str
+        Criterion to use to sort vehicles.
+    snapshot : Optional[Dict[str, np.ndarray]]
+        State to resume the fleet from (see 'Fleet.snapshot'), the fleet is reset if None.
+    observer : Optional[IRunObserver]
+        Observer notified after each step, the run is not instrumented if None.
+
+    Returns
+    -------
+    ColumnarOutputsData
+        Outputs of the computing.
     """
-    return (
-        vehicle.battery.current_capacity
-        - vehicle.battery.MINIMUM_AVAILABLE_CAPACITY_RATIO
-        * vehicle.battery.nominal_capacity
-    ) / vehicle.power
-
-
-def medium_criterion(vehicle: Vehicle) -> float:
-    """Describe a criterion computing how long the vehicle can be used until battery's end of life.
+    if snapshot is None:
+        fleet.reset()
+    else:
+        fleet.restore(snapshot)
+    if observer is None:
+        for time_lapse, fleet_load in scenario:
+            fleet.use(time_lapse, fleet_load, use_priority_criterion)
+    else:
+        observer.on_start(len(scenario))
+        for index, (time_lapse, fleet_load) in enumerate(scenario):
+            fleet.use(time_lapse, fleet_load, use_priority_criterion)
+            observer.on_step(index, fleet.time[-1], fleet.grades[-1], fleet.counters)
+        observer.on_end(fleet.counters)
+    return ColumnarOutputsData(
+        time=np.array(fleet.time, dtype=float),
+        grades=np.array(fleet.grades, dtype=float),
+    )
+
+
+def iter_simulate(
+    fleet: Fleet,
+    scenario: Iterable[Tuple[float, float]],
+    use_priority_criterion: str,
+    chunk_size: int = 1000,
+    snapshot: Optional[Dict[str, np.ndarray]] = None,
+    observer: Optional[IRunObserver] = None,
+) -> Iterator[ColumnarOutputsData]:
+    """Runs a scenario on a fleet from its reset state or from a snapshot, yielding outputs by chunks.
+
+    Tasks are consumed as they are run and the fleet's time and grades are trimmed after each chunk, so that memory does not grow with the scenario's length. Concatenated, the chunks are the outputs 'simulate' would return.
 
     Parameters
     ----------
-    vehicle: Vehicle
-        Vehicle on which to compute the criterion.
+    fleet : Fleet
+        Fleet on which to run the scenario.
+    scenario : Iterable[Tuple[float, float]]
+        Scenario of fleet tasks as tuples: timelapse of task (s), task's needed fleet's load.
+    use_priority_criterion : str
+        Criterion to use to sort vehicles.
+    chunk_size : int
+        Number of time steps of each chunk.
+    snapshot : Optional[Dict[str, np.ndarray]]
+        State to resume the fleet from (see 'Fleet.snapshot'), the fleet is reset if None.
+    observer : Optional[IRunObserver]
+        Observer notified after each step, the run is not instrumented if None.
+
+    Yields
+    ------
+    ColumnarOutputsData
+        Outputs of the computing, chunk by chunk.
     """
-    return vehicle.battery.current_capacity / vehicle.power
+    if snapshot is None:
+        fleet.reset()
+    else:
+        fleet.restore(snapshot)
+    if observer is not None:
+        observer.on_start(len(scenario) if isinstance(scenario, Sized) else None)
+    start = 0
+    for index, (time_lapse, fleet_load) in enumerate(scenario):
+        fleet.use(time_lapse, fleet_load, use_priority_criterion)
+        if observer is not None:
+            observer.on_step(index, fleet.time[-1], fleet.grades[-1], fleet.counters)
+        if len(fleet.time) - start >= chunk_size:
+            yield ColumnarOutputsData(
+                time=np.array(fleet.time[start:], dtype=float),
+                grades=np.array(fleet.grades[start:], dtype=float),
+            )
+            fleet.time = fleet.time[-1:]
+            fleet.grades = fleet.grades[-1:]
+            start = 1
+    if observer is not None:
+        observer.on_end(fleet.counters)
+    if len(fleet.time) > start:
+        yield ColumnarOutputsData(
+            time=np.array(fleet.time[start:], dtype=float),
+            grades=np.array(fleet.grades[start:], dtype=float),
+        )
 
 
-def poor_criterion(vehicle: Vehicle) -> float:
-    """Describe a criterion computing how long the vehicle can be used until battery's end of life.
+_worker_fleet: Optional[Fleet] = None
 
-    Parameters
-    ----------
-    vehicle: Vehicle
-        Vehicle on which to compute the criterion.
-    """
-    return vehicle.battery.cell.soc
 
+def _initialize_worker(fleet: Fleet) -> None:
+    """Stores the fleet each grid run of a worker process starts from."""
+    global _worker_fleet
+    _worker_fleet = fleet
 
-class Criterions(Enum):
-    POOR = partial(poor_criterion)
-    MEDIUM = partial(medium_criterion)
-    PERFORMANT = partial(performant_criterion)
+
+def _simulate_in_worker(
+    scenario: Sequence[Tuple[float, float]],
+    use_priority_criterion: str,
+    snapshot: Optional[Dict[str, np.ndarray]] = None,
+) -> ColumnarOutputsData:
+    """Runs a scenario on a copy of the worker process' fleet."""
+    return simulate(
+        deepcopy(_worker_fleet), scenario, use_priority_criterion, snapshot
+    )
 
 
 class FleetControler:
@@ -517,12 +1432,29 @@ class FleetControler:
     ----------
     server_side_adapter : IObtainFleetData
         IObtainFleetData inherited adpater.
+    engine : Literal["OBJECT", "VECTORIZED", "EVENT"]
+        Simulation engine of the fleet, either one object per vehicle ('Fleet'), struct-of-arrays ('VectorizedFleet') or event driven struct-of-arrays ('EventFleet').
+    tolerance : Optional[float]
+        Closed form integration tolerance of the cells of the 'OBJECT' engine (see 'Cell') or of the 'EVENT' engine (see 'EventFleet').
+    charging_allocation : Literal["SORTED", "NEEDIEST"]
+        Allocation of the charging stations at each step (see 'Fleet').
     """
 
-    def __init__(self, server_side_adapter: IObtainFleetData) -> None:
+    def __init__(
+        self,
+        server_side_adapter: IObtainFleetData,
+        engine: Literal["OBJECT", "VECTORIZED", "EVENT"] = "OBJECT",
+        tolerance: Optional[float] = None,
+        charging_allocation: Literal["SORTED", "NEEDIEST"] = "SORTED",
+    ) -> None:
+        self.engine = engine
+        self.tolerance = tolerance
+        self.charging_allocation = charging_allocation
         self.fleet = self.build_fleet(server_side_adapter.data)
 
-    def build_fleet(self, resources_data: ResourcesData) -> Fleet:
+    def build_fleet(
+        self, resources_data: Union[ResourcesData, ColumnarResourcesData]
+    ) -> Fleet:
         """Builds the fleet according to resources data.
 
         Returns
@@ -530,7 +1462,26 @@ class FleetControler:
         Fleet
             The fleet built according to resources data.
         """
-        fleet = Fleet()
+        if self.engine == "VECTORIZED":
+            from .vectorized import VectorizedFleet
+
+            return VectorizedFleet.from_resources_data(
+                resources_data, charging_allocation=self.charging_allocation
+            )
+        if self.engine == "EVENT":
+            from .events import EventFleet
+
+            if self.tolerance is None:
+                return EventFleet.from_resources_data(
+                    resources_data, charging_allocation=self.charging_allocation
+                )
+            return EventFleet.from_resources_data(
+                resources_data,
+                tolerance=self.tolerance,
+                charging_allocation=self.charging_allocation,
+            )
+        ocv = self.build_ocv(resources_data)
+        fleet = Fleet(charging_allocation=self.charging_allocation)
         for (
             cell_nominal_capacity,
             battery_series_cells_number,
@@ -541,7 +1492,11 @@ class FleetControler:
                 Vehicle(
                     vehicle_power,
                     Battery(
-                        Cell(nominal_capacity=cell_nominal_capacity),
+                        Cell(
+                            ocv=ocv,
+                            nominal_capacity=cell_nominal_capacity,
+                            tolerance=self.tolerance,
+                        ),
                         battery_series_cells_number,
                         battery_parallel_branches_number,
                     ),
@@ -550,3 +1505,100 @@ class FleetControler:
         for vehicle_power in resources_data.charging_stations:
             fleet.add_charging_stations(ChargingStation(vehicle_power))
         return fleet
+
+    @staticmethod
+    def build_ocv(
+        resources_data: Union[ResourcesData, ColumnarResourcesData]
+    ) -> Callable:
+        """Builds the cells' open circuit voltage curve according to resources data.
+
+        Returns
+        -------
+        Callable
+            The tabulated curve of resources data if any, the default cell's one otherwise.
+        """
+        if resources_data.ocv is None:
+            return Cell.DEFAULT_OCV
+        return TabulatedOCV(resources_data.ocv.soc, resources_data.ocv.tension)
+
+    def run_grid(
+        self,
+        scenarios: Sequence[Sequence[Tuple[float, float]]],
+        use_priority_criterions: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[Tuple[int, str], ColumnarOutputsData]:
+        """Runs every scenario with every criterion in parallel.
+
+        Each run is performed in a worker process on its own copy of the fleet, in the state it is when the grid is launched.
+
+        Parameters
+        ----------
+        scenarios : Sequence[Sequence[Tuple[float, float]]]
+            Scenarios of fleet tasks as lists of tuples: timelapse of task (s), task's needed fleet's load.
+        use_priority_criterions : Sequence[str]
+            Criterions to use to sort vehicles.
+        max_workers : Optional[int]
+            Maximum number of worker processes, the number of processors if None.
+
+        Returns
+        -------
+        Dict[Tuple[int, str], ColumnarOutputsData]
+            Outputs of each run, indexed by scenario's index and criterion.
+        """
+        for use_priority_criterion in use_priority_criterions:
+            get_criterion(use_priority_criterion)
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers, initializer=_initialize_worker, initargs=(self.fleet,)
+        ) as executor:
+            futures = {
+                (index, use_priority_criterion): executor.submit(
+                    _simulate_in_worker, scenario, use_priority_criterion
+                )
+                for index, scenario in enumerate(scenarios)
+                for use_priority_criterion in use_priority_criterions
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+    def fork(
+        self,
+        snapshot: Dict[str, np.ndarray],
+        scenario: Sequence[Tuple[float, float]],
+        use_priority_criterions: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, ColumnarOutputsData]:
+        """Resumes a snapshot of the fleet with every criterion in parallel.
+
+        Each branch is run in a worker process on its own copy of the fleet restored from the snapshot, so that the scenario's prefix leading to it is not simulated again.
+
+        Parameters
+        ----------
+        snapshot : Dict[str, np.ndarray]
+            State to resume the fleet from (see 'Fleet.snapshot').
+        scenario : Sequence[Tuple[float, float]]
+            Remaining scenario of fleet tasks as a list of tuples: timelapse of task (s), task's needed fleet's load.
+        use_priority_criterions : Sequence[str]
+            Criterions to use to sort vehicles, one per branch.
+        max_workers : Optional[int]
+            Maximum number of worker processes, the number of processors if None.
+
+        Returns
+        -------
+        Dict[str, ColumnarOutputsData]
+            Outputs of each branch, from the snapshot's time on, indexed by criterion.
+        """
+        for use_priority_criterion in use_priority_criterions:
+            get_criterion(use_priority_criterion)
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers, initializer=_initialize_worker, initargs=(self.fleet,)
+        ) as executor:
+            futures = {
+                use_priority_criterion: executor.submit(
+                    _simulate_in_worker, scenario, use_priority_criterion, snapshot
+                )
+                for use_priority_criterion in use_priority_criterions
+            }
+            return {key: future.result() for key, future in futures.items()}
@@ -0,0 +1,141 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+import numpy as np
+from .utils import Constants
+
+
+class FleetState(NamedTuple):
+    """Views on the state of every vehicle of a fleet, one array per field, in the vehicles' order."""
+
+    current_capacity: np.ndarray
+    nominal_capacity: np.ndarray
+    available_capacity: np.ndarray
+    soc: np.ndarray
+    power: np.ndarray
+
+
+Criterion = Callable[[FleetState], np.ndarray]
+
+_criterions: Dict[str, Criterion] = {}
+
+
+def register_criterion(
+    name: str, criterion: Optional[Criterion] = None, replace: bool = False
+) -> Union[Criterion, Callable[[Criterion], Criterion]]:
+    """Registers a criterion under a name, so that it can be used as 'use_priority_criterion'.
+
+    A criterion takes the 'FleetState' of a fleet and returns one score per vehicle, as an array: the lower the score, the higher the priority to use the vehicle. It is computed once per step, on the whole fleet, by every engine. Called without criterion, the function returns a decorator.
+    Criterions must be registered before the fleets' worker processes are started to be known by them.
+
+    Parameters
+    ----------
+    name : str
+        Name of the criterion.
+    criterion : Optional[Criterion]
+        Function that takes a 'FleetState' instance as input and that returns the vehicles' scores.
+    replace : bool
+        Whether the criterion replaces the one already registered under its name, a ValueError being raised otherwise.
+
+    Returns
+    -------
+    Union[Criterion, Callable[[Criterion], Criterion]]
+        The criterion, or a decorator registering one.
+    """
+    if criterion is None:
+        return lambda criterion: register_criterion(name, criterion, replace)
+    if name in _criterions and not replace:
+        raise ValueError("A criterion is already registered as {}.".format(repr(name)))
+    _criterions[name] = criterion
+    return criterion
+
+
+def get_criterion(name: str) -> Criterion:
+    """Returns the criterion registered under a name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the criterion.
+
+    Returns
+    -------
+    Criterion
+        The registered criterion.
+    """
+    try:
+        return _criterions[name]
+    except KeyError:
+        raise ValueError("Unknown criterion {}.".format(repr(name))) from None
+
+
+def criterion_names() -> List[str]:
+    """Returns the names of the registered criterions, in their order of registration."""
+    return list(_criterions)
+
+
+def smallest_indexes(values: np.ndarray, number: int) -> np.ndarray:
+    """Returns the indexes of the smallest values, as the head of a stable argsort would.
+
+    The smallest values are selected by partition and only them are sorted.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values to select from.
+    number : int
+        Number of indexes to return.
+
+    Returns
+    -------
+    np.ndarray
+        Indexes sorted by increasing value, ties broken by index.
+    """
+    if number >= len(values):
+        return np.argsort(values, kind="stable")
+    if number <= 0:
+        return np.empty(0, dtype=np.intp)
+    threshold = np.partition(values, number - 1)[number - 1]
+    if threshold != threshold:  # NaN, sorted last but equal to nothing
+        return np.argsort(values, kind="stable")[:number]
+    below = np.flatnonzero(values < threshold)
+    ties = np.flatnonzero(values == threshold)[: number - len(below)]
+    selected = np.sort(np.concatenate((below, ties)))
+    return selected[np.argsort(values[selected], kind="stable")]
+
+
+@register_criterion("PERFORMANT")
+def performant_criterion(state: FleetState) -> np.ndarray:
+    """Describe a criterion computing how long the vehicles can be used until batteries' end of life.
+
+    Parameters
+    ----------
+    state: FleetState
+        State of the vehicles on which to compute the criterion.
+    """
+    return (
+        state.current_capacity
+        - Constants.MINIMUM_AVAILABLE_CAPACITY_RATIO * state.nominal_capacity
+    ) / state.power
+
+
+@register_criterion("MEDIUM")
+def medium_criterion(state: FleetState) -> np.ndarray:
+    """Describe a criterion computing how long the vehicles can be used at full capacity.
+
+    Parameters
+    ----------
+    state: FleetState
+        State of the vehicles on which to compute the criterion.
+    """
+    return state.current_capacity / state.power
+
+
+@register_criterion("POOR")
+def poor_criterion(state: FleetState) -> np.ndarray:
+    """Describe a criterion using the vehicles' state of charge.
+
+    Parameters
+    ----------
+    state: FleetState
+        State of the vehicles on which to compute the criterion.
+    """
+    return state.soc
@@ -1,7 +1,33 @@
-from typing import Literal, Tuple
-from pydantic import BaseModel
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from pydantic import BaseModel, validator
 from pydantic.fields import Field
 from pydantic.types import confloat, conint, conlist
+from .criterions import criterion_names
+
+
+class OcvData(BaseModel):
+    soc: conlist(confloat(ge=0, le=1), min_items=2) = Field(
+        ...,
+        description="Strictly increasing states of charge breakpoints, from 0 to 1.",
+    )
+    tension: conlist(confloat(gt=0), min_items=2) = Field(
+        ..., description="Open circuit voltage at each breakpoint (V)."
+    )
+
+    @validator("soc")
+    def soc_must_span_the_charge_range(cls, soc: List[float]) -> List[float]:
+        if soc[0] != 0 or soc[-1] != 1:
+            raise ValueError("states of charge breakpoints must span from 0 to 1")
+        if any(lower >= upper for lower, upper in zip(soc, soc[1:])):
+            raise ValueError("states of charge breakpoints must be strictly increasing")
+        return soc
+
+    @validator("tension")
+    def tension_must_match_soc(cls, tension: List[float], values: dict) -> List[float]:
+        if "soc" in values and len(tension) != len(values["soc"]):
+            raise ValueError("there must be one tension per state of charge breakpoint")
+        return tension
 
 
 class ResourcesData(BaseModel):
@@ -15,18 +41,234 @@ class ResourcesData(BaseModel):
     charging_stations: conlist(confloat(gt=0), min_items=1) = Field(
         ..., description="Charging stations as a list of delivered power (W)."
     )
+    ocv: Optional[OcvData] = Field(
+        None,
+        description="Tabulated open circuit voltage curve of the vehicles' batteries' cells, the default cell's one if not given.",
+    )
+
+
+ROWS_CHUNK_SIZE = 65536
+
+
+class ColumnarRows(Sequence):
+    """Rows of columns as tuples, in the layout of the non columnar data models.
+
+    Rows are read chunk by chunk when iterated over, so that memory-mapped columns are not read in memory at once, and slices are views of the columns.
+
+    Parameters
+    ----------
+    columns : np.ndarray
+        Columns of the same length.
+    """
+
+    def __init__(self, *columns: np.ndarray) -> None:
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns[0])
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[float, ...], "ColumnarRows"]:
+        if isinstance(index, slice):
+            return ColumnarRows(*(column[index] for column in self.columns))
+        return tuple(column[index].item() for column in self.columns)
+
+    def __iter__(self) -> Iterator[Tuple[float, ...]]:
+        for start in range(0, len(self), ROWS_CHUNK_SIZE):
+            yield from zip(
+                *(
+                    column[start : start + ROWS_CHUNK_SIZE].tolist()
+                    for column in self.columns
+                )
+            )
+
+
+def _check_column(column: np.ndarray, integer: bool = False) -> np.ndarray:
+    """Checks that a column is a non empty one dimensional numerical array and casts it as pydantic would.
+
+    Floating values of an integer column are truncated, as by 'conint', and integer values of a floating column are converted, as by 'confloat'. Columns already of the right kind are returned as is.
+    """
+    if column.ndim != 1 or len(column) == 0:
+        raise ValueError("column must be one dimensional and non empty")
+    if np.issubdtype(column.dtype, np.integer):
+        return column if integer else column.astype(float)
+    if not np.issubdtype(column.dtype, np.floating):
+        raise ValueError("column must be of an integer or a floating type")
+    if integer:
+        if not np.isfinite(column).all():
+            raise ValueError("all values must be finite integers")
+        return column.astype(np.int64)
+    return column
+
+
+def _check_positive(column: np.ndarray) -> np.ndarray:
+    """Checks that all the values of a column are strictly positive (NaN excluded)."""
+    if not (column > 0).all():
+        raise ValueError("all values must be greater than 0")
+    return column
+
+
+def _check_criterion(use_priority_criterion: str) -> str:
+    """Checks that a criterion is registered (see 'register_criterion')."""
+    names = criterion_names()
+    if use_priority_criterion not in names:
+        raise ValueError(
+            "criterion must be one of {}".format(", ".join(map(repr, names)))
+        )
+    return use_priority_criterion
+
+
+class ColumnarResourcesData(BaseModel):
+    """Columnar counterpart of 'ResourcesData', holding one array per vehicles' field.
+
+    Columns are validated as whole arrays, with the same guarantees as 'ResourcesData', and kept as given (memory-mapped ones are not read in memory).
+    """
+
+    cells_nominal_capacity: np.ndarray = Field(
+        ..., description="Vehicle's battery's cell nominal capacity (C)."
+    )
+    series_cells_numbers: np.ndarray = Field(
+        ..., description="Vehicle's battery's number of cells in series."
+    )
+    parallel_branches_numbers: np.ndarray = Field(
+        ..., description="Vehicle's battery's number of parallel branches."
+    )
+    vehicles_power: np.ndarray = Field(
+        ..., description="Power consumption of the vehicle (W)."
+    )
+    charging_stations_power: np.ndarray = Field(
+        ..., description="Delivered power of charging stations (W)."
+    )
+    ocv: Optional[OcvData] = Field(
+        None,
+        description="Tabulated open circuit voltage curve of the vehicles' batteries' cells, the default cell's one if not given.",
+    )
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @validator("cells_nominal_capacity", "vehicles_power", "charging_stations_power")
+    def float_columns_must_be_positive(cls, column: np.ndarray) -> np.ndarray:
+        return _check_positive(_check_column(column))
+
+    @validator("series_cells_numbers", "parallel_branches_numbers")
+    def integer_columns_must_be_positive(cls, column: np.ndarray) -> np.ndarray:
+        return _check_positive(_check_column(column, integer=True))
 
+    @validator("series_cells_numbers", "parallel_branches_numbers", "vehicles_power")
+    def vehicles_columns_must_match(
+        cls, column: np.ndarray, values: dict
+    ) -> np.ndarray:
+        if (
+            "cells_nominal_capacity" in values
+            and len(column) != len(values["cells_nominal_capacity"])
+        ):
+            raise ValueError("there must be one value per vehicle")
+        return column
+
+    @property
+    def vehicles(self) -> ColumnarRows:
+        """Vehicles as tuples, in the layout of 'ResourcesData.vehicles', read chunk by chunk."""
+        return ColumnarRows(
+            self.cells_nominal_capacity,
+            self.series_cells_numbers,
+            self.parallel_branches_numbers,
+            self.vehicles_power,
+        )
+
+    @property
+    def charging_stations(self) -> List[float]:
+        """Charging stations, in the layout of 'ResourcesData.charging_stations'."""
+        return self.charging_stations_power.tolist()
+
+
+class ScenarioData(BaseModel):
+    """Scenario read without criterion, to be run with several ones (see 'IRequestInputsData.run_criterions')."""
 
-class InputsData(BaseModel):
     scenario: conlist(Tuple[confloat(gt=0), confloat(ge=0, le=1)], min_items=1) = Field(
         ...,
         description="Scenario of fleet tasks to realize as a list of tuples: timelapse of task (s), task's needed fleet's load.",
     )
-    use_priority_criterion: Literal["POOR", "MEDIUM", "PERFORMANT"] = Field(
+
+
+class InputsData(ScenarioData):
+    use_priority_criterion: str = Field(
         ...,
-        description="Criterion to use to sort vehicles and so to choose which ones will be used for a given task.",
+        description="Criterion to use to sort vehicles and so to choose which ones will be used for a given task, among the registered ones.",
     )
 
+    @validator("use_priority_criterion")
+    def criterion_must_be_registered(cls, use_priority_criterion: str) -> str:
+        return _check_criterion(use_priority_criterion)
+
+
+class ColumnarScenarioData(BaseModel):
+    """Columnar counterpart of 'ScenarioData', holding one array per tasks' field.
+
+    Columns are validated as whole arrays, with the same guarantees as 'ScenarioData', and kept as given (memory-mapped ones are not read in memory).
+    """
+
+    timelapses: np.ndarray = Field(..., description="Timelapse of tasks (s).")
+    loads: np.ndarray = Field(..., description="Tasks' needed fleet's load.")
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @validator("timelapses")
+    def timelapses_must_be_positive(cls, timelapses: np.ndarray) -> np.ndarray:
+        return _check_positive(_check_column(timelapses))
+
+    @validator("loads")
+    def loads_must_be_fractions(cls, loads: np.ndarray, values: dict) -> np.ndarray:
+        _check_column(loads)
+        if not ((loads >= 0) & (loads <= 1)).all():
+            raise ValueError("all values must be between 0 and 1")
+        if "timelapses" in values and len(loads) != len(values["timelapses"]):
+            raise ValueError("there must be one load per timelapse")
+        return loads
+
+    @property
+    def scenario(self) -> ColumnarRows:
+        """Scenario as tuples, in the layout of 'InputsData.scenario', read chunk by chunk."""
+        return ColumnarRows(self.timelapses, self.loads)
+
+
+class ColumnarInputsData(ColumnarScenarioData):
+    """Columnar counterpart of 'InputsData', holding one array per tasks' field.
+
+    Columns are validated as whole arrays, with the same guarantees as 'InputsData', and kept as given (memory-mapped ones are not read in memory).
+    """
+
+    use_priority_criterion: str = Field(
+        ...,
+        description="Criterion to use to sort vehicles and so to choose which ones will be used for a given task, among the registered ones.",
+    )
+
+    @validator("use_priority_criterion")
+    def criterion_must_be_registered(cls, use_priority_criterion: str) -> str:
+        return _check_criterion(use_priority_criterion)
+
+
+class TaskData(BaseModel):
+    timelapse: confloat(gt=0) = Field(..., description="Timelapse of task (s).")
+    load: confloat(ge=0, le=1) = Field(..., description="Task's needed fleet's load.")
+
+
+class StreamScenarioData(BaseModel):
+    """Streamed scenario read without criterion, to be run with several ones, its tasks being validated one by one by 'TaskData'."""
+
+
+class StreamInputsData(StreamScenarioData):
+    use_priority_criterion: str = Field(
+        ...,
+        description="Criterion to use to sort vehicles and so to choose which ones will be used for a given task, among the registered ones.",
+    )
+
+    @validator("use_priority_criterion")
+    def criterion_must_be_registered(cls, use_priority_criterion: str) -> str:
+        return _check_criterion(use_priority_criterion)
+
 
 class OutputsData(BaseModel):
     grades: conlist(float, min_items=1) = Field(
@@ -36,3 +278,84 @@ class OutputsData(BaseModel):
     time: conlist(float, min_items=1) = Field(
         ..., description="Time vector gathering the time step at each scenario frame."
     )
+
+
+class ColumnarOutputsData(BaseModel):
+    """Columnar counterpart of 'OutputsData', holding time and grades as arrays.
+
+    Columns are validated as whole arrays and kept as given, so that reading them does not copy anything.
+    """
+
+    grades: np.ndarray = Field(
+        ...,
+        description="Cumulated number of fleet's succeded tasks (timelapse and load respected).",
+    )
+    time: np.ndarray = Field(
+        ..., description="Time vector gathering the time step at each scenario frame."
+    )
+
+    class Config:
+        arbitrary_types_allowed = True
+        json_encoders = {np.ndarray: np.ndarray.tolist}
+
+    @validator("grades", "time")
+    def columns_must_be_numerical(cls, column: np.ndarray) -> np.ndarray:
+        return _check_column(column)
+
+    @validator("time")
+    def columns_must_match(cls, time: np.ndarray, values: dict) -> np.ndarray:
+        if "grades" in values and len(time) != len(values["grades"]):
+            raise ValueError("there must be one time per grade")
+        return time
+
+    @classmethod
+    def concatenate(
+        cls, chunks: Iterable["ColumnarOutputsData"]
+    ) -> "ColumnarOutputsData":
+        """Returns the outputs of consecutive chunks, as yielded by 'iter_simulate', joined together."""
+        chunks = list(chunks)
+        return cls(
+            grades=np.concatenate([chunk.grades for chunk in chunks]),
+            time=np.concatenate([chunk.time for chunk in chunks]),
+        )
+
+    def as_dict(self) -> Dict[str, List[float]]:
+        """Outputs as lists, in the layout of 'OutputsData.dict'."""
+        return {"grades": self.grades.tolist(), "time": self.time.tolist()}
+
+
+class SweepOutputsData(BaseModel):
+    seed: int = Field(
+        ..., description="Entropy of the sweep's seed, to reproduce its samples."
+    )
+    samples_number: conint(gt=0) = Field(
+        ..., description="Number of drawn fleets and scenarios."
+    )
+    quantiles: conlist(confloat(ge=0, le=1)) = Field(
+        ..., description="Quantiles computed on the final grades."
+    )
+    means: Dict[str, float] = Field(
+        ..., description="Mean of the final grades per criterion."
+    )
+    grades_quantiles: Dict[str, List[float]] = Field(
+        ...,
+        description="Quantiles of the final grades per criterion, in the order of quantiles.",
+    )
+
+
+class SizingOutputsData(BaseModel):
+    dimension: str = Field(
+        ..., description="Sized part of the fleet, vehicles or charging stations."
+    )
+    target: float = Field(..., description="Final grade to reach.")
+    size: conint(gt=0) = Field(
+        ...,
+        description="Size found to reach the target grade, the smallest number of charging stations or the largest number of vehicles.",
+    )
+    evaluated_sizes: List[int] = Field(
+        ..., description="Sizes evaluated during the search, in order."
+    )
+    simulated_steps: conint(ge=0) = Field(
+        ...,
+        description="Number of fleet's steps simulated during the search, steps reused from previous searches excluded.",
+    )
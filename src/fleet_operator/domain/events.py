@@ -0,0 +1,126 @@
+import numpy as np
+from .core import Status, jump_cells
+from .vectorized import VectorizedFleet
+
+
+class EventFleet(VectorizedFleet):
+    """Event driven fleet object.
+
+    Instead of stepping through every time increment of a task, the time to the first event of each vehicle (empty or full cell, too powerfull discharge) is solved in closed form (see 'jump_cells') and the vehicle jumps straight to it, or to the task's end. Events are returned as statuses and handled at the task boundary (failures, renewals at end of life and upgrades), as 'VectorizedFleet' does, so no exception is raised in the loop.
+    Predicted events are kept across tasks with the power and the state they were predicted for: a vehicle used again with the same power from the state its last jump left it in is known to reach its event later, so that its event is not searched again. Charges, renewals and upgrades change the state or the power and discard the prediction.
+    Vehicles whose prediction lies within the tolerance of a boundary are stepped time increment by time increment so that events match the ones of 'Fleet'.
+
+    Parameters
+    ----------
+    tolerance : float
+        Relative margin to the boundaries under which vehicles are stepped time increment by time increment.
+    args : list
+        List of unnamed parameters passed to 'VectorizedFleet'.
+    kwargs : dict
+        Dictionary of named parameters passed to 'VectorizedFleet'.
+    """
+
+    DEFAULT_TOLERANCE: float = 1e-9
+
+    def __init__(
+        self,
+        *args: list,
+        tolerance: float = DEFAULT_TOLERANCE,
+        **kwargs: dict,
+    ) -> None:
+        self.tolerance = tolerance
+        self.__events_power = np.empty(0)
+        self.__events_state = np.empty((3, 0))
+        self.__event_steps = np.empty(0)
+        super().__init__(*args, **kwargs)
+
+    def __state(self, indexes: np.ndarray) -> np.ndarray:
+        """Returns the state predictions are kept for: current capacity, available capacity and resistance of some vehicles' cells."""
+        return np.stack(
+            (
+                self.current_capacity[indexes],
+                self.available_capacity[indexes],
+                self.resistance[indexes],
+            )
+        )
+
+    def _advance(
+        self, indexes: np.ndarray, powers: np.ndarray, steps_number: int
+    ) -> np.ndarray:
+        """Advances the cells of some vehicles for a number of time increments.
+
+        Each cell jumps to the first time increment that would raise an error in 'Cell.use', keeping the state it had before it.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the vehicles whose cells are used.
+        powers : np.ndarray
+            Power of use of each cell (W).
+        steps_number : int
+            Number of time increments.
+
+        Returns
+        -------
+        np.ndarray
+            Status of each cell's advance.
+        """
+        statuses = np.full(len(indexes), Status.DONE, dtype=np.int8)
+        if steps_number == 0 or not len(indexes):
+            return statuses
+        if len(self.__event_steps) != len(self):
+            self.__events_power = np.full(len(self), np.nan)
+            self.__events_state = np.full((3, len(self)), np.nan)
+            self.__event_steps = np.full(len(self), np.nan)
+        predicted = (self.__events_power[indexes] == powers) & (
+            self.__events_state[:, indexes] == self.__state(indexes)
+        ).all(axis=0)
+        stepped = np.zeros(len(indexes), dtype=bool)
+        for rows, event_steps in (
+            (np.flatnonzero(predicted), self.__event_steps[indexes[predicted]]),
+            (np.flatnonzero(~predicted), None),
+        ):
+            if not len(rows):
+                continue
+            jumped_indexes = indexes[rows]
+            jump = jump_cells(
+                self.current_capacity[jumped_indexes],
+                self.available_capacity[jumped_indexes],
+                self.resistance[jumped_indexes],
+                self.tension[jumped_indexes],
+                self.alpha[jumped_indexes],
+                self.beta[jumped_indexes],
+                powers[rows],
+                self.ocv,
+                steps_number,
+                self.tolerance,
+                event_steps,
+            )
+            decided = jump.decided
+            stepped[rows[~decided]] = True
+            statuses[rows[decided]] = jump.statuses[decided]
+            jumped_indexes = jumped_indexes[decided]
+            self.available_capacity[jumped_indexes] = jump.available_capacity[decided]
+            self.resistance[jumped_indexes] = jump.resistance[decided]
+            self.tension[jumped_indexes] = jump.tension[decided]
+            self.current_capacity[jumped_indexes] = jump.current_capacity[decided]
+            self.soc[jumped_indexes] = (
+                self.current_capacity[jumped_indexes]
+                / self.available_capacity[jumped_indexes]
+            )
+            self.__events_power[jumped_indexes] = powers[rows[decided]]
+            self.__events_state[:, jumped_indexes] = self.__state(jumped_indexes)
+            self.__event_steps[jumped_indexes] = (
+                jump.event_steps[decided] - jump.completed_steps[decided]
+            )
+        if stepped.any():
+            self.__events_power[indexes[stepped]] = np.nan
+            statuses[stepped] = super()._advance(
+                indexes[stepped], powers[stepped], steps_number
+            )
+        return statuses
+
+    def __repr__(self) -> str:
+        return "EventFleet({} vehicles, {} charging stations)".format(
+            len(self), len(self.charging_stations_power)
+        )
@@ -0,0 +1,30 @@
+from asyncio import Semaphore, gather
+from typing import Awaitable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(awaitables: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    """Awaits awaitables concurrently, at most limit at a time.
+
+    Meant to load many resources and inputs with the asynchronous adapters, 'IAsyncObtainFleetData.create' and 'IAsyncRequestInputsData.create' coroutines for instance, without flooding their source.
+
+    Parameters
+    ----------
+    awaitables : Iterable[Awaitable[T]]
+        Awaitables to await, coroutines for instance.
+    limit : int
+        Maximum number of awaitables awaited at the same time.
+
+    Returns
+    -------
+    List[T]
+        Results in the order of the awaitables.
+    """
+    semaphore = Semaphore(limit)
+
+    async def await_bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await gather(*(await_bounded(awaitable) for awaitable in awaitables))
@@ -0,0 +1,303 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+
+class FleetCounters:
+    """Cumulated counters of the events driving a fleet's behavior and cost since its last reset.
+
+    Attributes
+    ----------
+    renewals_number : int
+        Number of batteries renewed at their end of life.
+    upgrades_number : int
+        Number of batteries upgraded because too weak for their vehicle.
+    empty_failures_number : int
+        Number of vehicles failing their task because of an empty cell.
+    full_stops_number : int
+        Number of charges stopped because of a full cell.
+    occupied_charging_stations_number : int
+        Number of charging stations occupied during the last step.
+    """
+
+    __slots__ = (
+        "renewals_number",
+        "upgrades_number",
+        "empty_failures_number",
+        "full_stops_number",
+        "occupied_charging_stations_number",
+    )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets the counters."""
+        self.renewals_number = 0
+        self.upgrades_number = 0
+        self.empty_failures_number = 0
+        self.full_stops_number = 0
+        self.occupied_charging_stations_number = 0
+
+    def __repr__(self) -> str:
+        return "FleetCounters({})".format(
+            ", ".join(
+                "{}={}".format(name, getattr(self, name)) for name in self.__slots__
+            )
+        )
+
+
+class IRunObserver(ABC):
+    """Run observer interface to inherit from.
+
+    Observers are notified by 'simulate' and 'iter_simulate' after each step of a run. When none is attached, runs are not instrumented at all.
+    """
+
+    def on_start(self, tasks_number: Optional[int]) -> None:
+        """Called before the first step of a run.
+
+        Parameters
+        ----------
+        tasks_number : Optional[int]
+            Number of tasks of the scenario, None if unknown (streamed scenario).
+        """
+
+    @abstractmethod
+    def on_step(
+        self, index: int, time: float, grade: float, counters: FleetCounters
+    ) -> None:
+        """Called after each step of a run.
+
+        Parameters
+        ----------
+        index : int
+            Index of the task just run.
+        time : float
+            Time of the fleet (s).
+        grade : float
+            Cumulated grade of the fleet.
+        counters : FleetCounters
+            Counters of the fleet, to be read and not kept as they are updated in place.
+        """
+
+    def on_end(self, counters: FleetCounters) -> None:
+        """Called after the last step of a run.
+
+        Parameters
+        ----------
+        counters : FleetCounters
+            Counters of the fleet.
+        """
+
+
+class ProgressObserver(IRunObserver):
+    """Observer reporting the progress of a run, at most once per interval.
+
+    Parameters
+    ----------
+    interval : float
+        Minimum wall time between two reports (s).
+    write : Callable[[str], None]
+        Function writing a report.
+    """
+
+    def __init__(self, interval: float = 1.0, write: Callable[[str], None] = print) -> None:
+        self.interval = interval
+        self.write = write
+        self.tasks_number: Optional[int] = None
+        self.__done_tasks_number = 0
+        self.__start = self.__last_report = 0.0
+
+    def on_start(self, tasks_number: Optional[int]) -> None:
+        self.tasks_number = tasks_number
+        self.__done_tasks_number = 0
+        self.__start = self.__last_report = perf_counter()
+
+    def on_step(
+        self, index: int, time: float, grade: float, counters: FleetCounters
+    ) -> None:
+        self.__done_tasks_number = index + 1
+        now = perf_counter()
+        if now - self.__last_report >= self.interval:
+            self.__last_report = now
+            self.write(self.report(index + 1, now - self.__start, counters))
+
+    def on_end(self, counters: FleetCounters) -> None:
+        self.write(
+            self.report(
+                self.__done_tasks_number, perf_counter() - self.__start, counters
+            )
+        )
+
+    def report(
+        self, done_tasks_number: int, elapsed: float, counters: FleetCounters
+    ) -> str:
+        """Formats a progress report.
+
+        Parameters
+        ----------
+        done_tasks_number : int
+            Number of tasks run so far.
+        elapsed : float
+            Wall time since the start of the run (s).
+        counters : FleetCounters
+            Counters of the fleet.
+
+        Returns
+        -------
+        str
+            The progress report.
+        """
+        throughput = done_tasks_number / elapsed if elapsed > 0 else 0.0
+        if self.tasks_number:
+            parts = [
+                "Progression: {:.1f}%".format(
+                    done_tasks_number / self.tasks_number * 100
+                )
+            ]
+            if throughput > 0:
+                parts.append(
+                    "ETA: {:.1f} s".format(
+                        (self.tasks_number - done_tasks_number) / throughput
+                    )
+                )
+        else:
+            parts = ["Tasks: {}".format(done_tasks_number)]
+        parts.append("{:.1f} tasks/s".format(throughput))
+        parts.append(
+            "renewals: {}, upgrades: {}, empty failures: {}, full stops: {}".format(
+                counters.renewals_number,
+                counters.upgrades_number,
+                counters.empty_failures_number,
+                counters.full_stops_number,
+            )
+        )
+        return " | ".join(parts)
+
+
+class MetricsObserver(IRunObserver):
+    """Observer recording the fleet's counters at each step of a run.
+
+    Attributes
+    ----------
+    occupied_charging_stations : List[int]
+        Number of occupied charging stations at each step.
+    renewals : List[int]
+        Cumulated number of batteries renewals at each step.
+    upgrades : List[int]
+        Cumulated number of batteries upgrades at each step.
+    empty_failures : List[int]
+        Cumulated number of empty cell failures at each step.
+    full_stops : List[int]
+        Cumulated number of full cell charging stops at each step.
+    """
+
+    def __init__(self) -> None:
+        self.occupied_charging_stations: List[int] = []
+        self.renewals: List[int] = []
+        self.upgrades: List[int] = []
+        self.empty_failures: List[int] = []
+        self.full_stops: List[int] = []
+
+    def on_step(
+        self, index: int, time: float, grade: float, counters: FleetCounters
+    ) -> None:
+        self.occupied_charging_stations.append(
+            counters.occupied_charging_stations_number
+        )
+        self.renewals.append(counters.renewals_number)
+        self.upgrades.append(counters.upgrades_number)
+        self.empty_failures.append(counters.empty_failures_number)
+        self.full_stops.append(counters.full_stops_number)
+
+
+class PhaseProfiler:
+    """Wall time profiler of the phases of fleets' steps.
+
+    A fleet with a profiler attached calls 'start' at the beginning of each step, then 'lap' at the end of each phase with the phase's name as a semicolon separated stack ("use;failed_vehicle" for instance), and 'stop' at its end. Fleets without profiler do not time anything.
+
+    Attributes
+    ----------
+    totals : Dict[str, float]
+        Cumulated wall time of each stack (s).
+    counts : Dict[str, int]
+        Number of steps going through each stack.
+    steps : List[Dict[str, float]]
+        Wall time of each top level phase, for each step (s).
+    """
+
+    def __init__(self) -> None:
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.steps: List[Dict[str, float]] = []
+        self.__step: Dict[str, float] = defaultdict(float)
+        self.__last = 0.0
+
+    def start(self) -> None:
+        """Starts timing a step."""
+        self.__step = defaultdict(float)
+        self.__last = perf_counter()
+
+    def lap(self, stack: str) -> None:
+        """Charges the wall time elapsed since the last lap to a stack.
+
+        Parameters
+        ----------
+        stack : str
+            Semicolon separated names of the phase and of its parent phases.
+        """
+        now = perf_counter()
+        self.__step[stack] += now - self.__last
+        self.__last = now
+
+    def stop(self) -> None:
+        """Ends timing a step."""
+        phases: Dict[str, float] = defaultdict(float)
+        for stack, elapsed in self.__step.items():
+            self.totals[stack] += elapsed
+            self.counts[stack] += 1
+            phases[stack.split(";", 1)[0]] += elapsed
+        self.steps.append(dict(phases))
+
+    def summary(self) -> str:
+        """Returns tables of the time spent in each stack, and in each phase per step."""
+        total = sum(self.totals.values())
+        lines = [
+            "{} steps, {:.6f} s".format(len(self.steps), total),
+            "",
+            "{:<40} {:>12} {:>8} {:>10}".format("stack", "total (s)", "share", "steps"),
+        ]
+        for stack in sorted(self.totals, key=self.totals.get, reverse=True):
+            lines.append(
+                "{:<40} {:>12.6f} {:>7.1f}% {:>10}".format(
+                    stack,
+                    self.totals[stack],
+                    self.totals[stack] / total * 100 if total > 0 else 0.0,
+                    self.counts[stack],
+                )
+            )
+        lines += ["", "{:<40} {:>12} {:>12}".format("phase", "mean (s)", "max (s)")]
+        phases = sorted({phase for step in self.steps for phase in step})
+        for phase in phases:
+            per_step = [step.get(phase, 0.0) for step in self.steps]
+            lines.append(
+                "{:<40} {:>12.6f} {:>12.6f}".format(
+                    phase, sum(per_step) / len(per_step), max(per_step)
+                )
+            )
+        return "\n".join(lines)
+
+    def folded(self, root: str = "") -> str:
+        """Returns the stacks in the folded format of flamegraph tools, weighted in microseconds.
+
+        Parameters
+        ----------
+        root : str
+            Name of a root frame prepended to every stack, none if empty.
+        """
+        prefix = root + ";" if root else ""
+        return "".join(
+            "{}{} {}\n".format(prefix, stack, round(elapsed * 1e6))
+            for stack, elapsed in self.totals.items()
+        )
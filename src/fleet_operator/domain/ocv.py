@@ -0,0 +1,126 @@
+from bisect import bisect_left
+from json import loads
+from typing import Sequence, Union
+import numpy as np
+
+
+class TabulatedOCV:
+    """Open circuit voltage curve tabulated on state of charge breakpoints.
+
+    The curve is linearly interpolated between breakpoints. Slopes are computed once so that evaluating the curve on a scalar state of charge is a bisection and a multiply-add, while arrays of states of charge are evaluated in one vectorized call.
+
+    Parameters
+    ----------
+    soc : Sequence[float]
+        Strictly increasing states of charge breakpoints.
+    tension : Sequence[float]
+        Open circuit voltage at each breakpoint (V).
+    """
+
+    def __init__(self, soc: Sequence[float], tension: Sequence[float]) -> None:
+        self.soc = np.asarray(soc, dtype=float)
+        self.tension = np.asarray(tension, dtype=float)
+        if self.soc.ndim != 1 or self.soc.shape != self.tension.shape:
+            raise ValueError(
+                "States of charge and tensions must be one dimensional and of the same length."
+            )
+        if len(self.soc) < 2 or (np.diff(self.soc) <= 0).any():
+            raise ValueError(
+                "At least two strictly increasing states of charge are needed."
+            )
+        self.slopes = (self.tension[1:] - self.tension[:-1]) / (
+            self.soc[1:] - self.soc[:-1]
+        )
+        self.__soc = self.soc.tolist()
+        self.__tension = self.tension.tolist()
+        self.__slopes = self.slopes.tolist()
+
+    @classmethod
+    def from_csv(cls, path: str, delimiter: str = ",") -> "TabulatedOCV":
+        """Loads a curve from a two columns (state of charge, tension) CSV file.
+
+        A non numerical first line is considered as a header and skipped.
+
+        Parameters
+        ----------
+        path : str
+            Path of the CSV file.
+        delimiter : str
+            Columns delimiter.
+
+        Returns
+        -------
+        TabulatedOCV
+            The loaded curve.
+        """
+        with open(path, "r") as csv_file:
+            first_line = csv_file.readline()
+        try:
+            [float(value) for value in first_line.split(delimiter)]
+        except ValueError:
+            skip_header = 1
+        else:
+            skip_header = 0
+        soc, tension = np.loadtxt(
+            path, delimiter=delimiter, skiprows=skip_header, ndmin=2, unpack=True
+        )
+        return cls(soc, tension)
+
+    @classmethod
+    def from_json(cls, path: str) -> "TabulatedOCV":
+        """Loads a curve from a JSON file with "soc" and "tension" lists.
+
+        Parameters
+        ----------
+        path : str
+            Path of the JSON file.
+
+        Returns
+        -------
+        TabulatedOCV
+            The loaded curve.
+        """
+        with open(path, "r") as ocv_json:
+            ocv = loads(ocv_json.read())
+        return cls(ocv["soc"], ocv["tension"])
+
+    def __call__(self, soc: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Evaluates the open circuit voltage.
+
+        Parameters
+        ----------
+        soc : Union[float, np.ndarray]
+            State(s) of charge.
+
+        Returns
+        -------
+        Union[float, np.ndarray]
+            Open circuit voltage(s) (V).
+        """
+        if np.ndim(soc) == 0:
+            if not self.__soc[0] <= soc <= self.__soc[-1]:
+                raise ValueError(
+                    "A state of charge is out of the tabulated open circuit voltage range."
+                )
+            index = min(max(bisect_left(self.__soc, soc), 1), len(self.__soc) - 1) - 1
+            return self.__slopes[index] * (soc - self.__soc[index]) + self.__tension[index]
+        soc = np.asarray(soc, dtype=float)
+        if (soc < self.soc[0]).any() or (soc > self.soc[-1]).any():
+            raise ValueError(
+                "A state of charge is out of the tabulated open circuit voltage range."
+            )
+        indexes = np.searchsorted(self.soc, soc, side="left").clip(1, len(self.soc) - 1) - 1
+        return self.slopes[indexes] * (soc - self.soc[indexes]) + self.tension[indexes]
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, TabulatedOCV)
+            and np.array_equal(self.soc, other.soc)
+            and np.array_equal(self.tension, other.tension)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.soc.tobytes(), self.tension.tobytes()))
+
+    def __repr__(self) -> str:
+        return "TabulatedOCV({}, {})".format(self.__soc, self.__tension)
@@ -0,0 +1,535 @@
+from typing import Callable, NamedTuple, Optional, Sequence, Union
+import numpy as np
+from .core import Battery, Cell, CellSpec, Status
+from .utils import (
+    BatteryLifetimeError,
+    Constants,
+    EmptyCellError,
+    FullCellError,
+    TooPowerfullDischargeError,
+)
+
+
+class CellPacks:
+    """Batteries of heterogeneous cells, one cell-level pack per vehicle.
+
+    Unlike 'Battery', which uses one cell for all of its cells, every cell of every pack has its own capacity, resistance and ageing coefficients, and its own state. They are kept in flat arrays, pack by pack, branch by branch and series cell by series cell, and all the cells of the used packs are moved forward together, one array operation per time increment.
+    Each cell receives an equal share of its pack's power, as in 'Battery'. A pack stops at the first time increment at which one of its cells would raise an error in 'Cell.use', and its tension and capacities are the ones of its weakest branch: a branch's capacities are the lowest of its cells' ones and its tension is the sum of its cells' ones. With identical cells, packs behave as 'Battery'.
+
+    Parameters
+    ----------
+    series_cells_numbers : Sequence[int]
+        Number of series cells per branch of each pack.
+    parallel_branches_numbers : Sequence[int]
+        Number of parallel branches of each pack.
+    cells_nominal_capacity : Sequence[float]
+        Nominal capacity of each cell (C).
+    resistance : Sequence[float]
+        Internal resistance of each cell at birth (Ohms).
+    alpha : Sequence[float]
+        Capacity ageing coefficient of each cell (1/(W.s)).
+    beta : Sequence[float]
+        Internal resistance ageing coefficient of each cell (1/(W.s)).
+    ocv : Callable
+        Function of the state of charge returning open circuit voltage (V), shared by all the cells.
+    """
+
+    def __init__(
+        self,
+        series_cells_numbers: Sequence[int],
+        parallel_branches_numbers: Sequence[int],
+        cells_nominal_capacity: Sequence[float],
+        resistance: Sequence[float],
+        alpha: Sequence[float],
+        beta: Sequence[float],
+        ocv: Callable = Cell.DEFAULT_OCV,
+    ) -> None:
+        self.ocv = ocv
+        self.series_cells_numbers = np.asarray(series_cells_numbers, dtype=np.int64)
+        self.parallel_branches_numbers = np.asarray(
+            parallel_branches_numbers, dtype=np.int64
+        )
+        cells_numbers = self.series_cells_numbers * self.parallel_branches_numbers
+        self.cells_offsets = np.append(0, np.cumsum(cells_numbers))
+        self.branches_offsets = np.append(0, np.cumsum(self.parallel_branches_numbers))
+        branches_packs = np.repeat(
+            np.arange(len(self.series_cells_numbers)), self.parallel_branches_numbers
+        )
+        self.branches_starts = (
+            self.cells_offsets[branches_packs]
+            + (np.arange(len(branches_packs)) - self.branches_offsets[branches_packs])
+            * self.series_cells_numbers[branches_packs]
+        )
+        columns = [
+            np.asarray(column, dtype=float)
+            for column in (cells_nominal_capacity, resistance, alpha, beta)
+        ]
+        if any(len(column) != self.cells_offsets[-1] for column in columns):
+            raise ValueError(
+                "There must be one value per cell, {} cells being expected.".format(
+                    self.cells_offsets[-1]
+                )
+            )
+        cells_nominal_capacity, self.initial_resistance, self.alpha, self.beta = columns
+        self.cells_nominal_capacity = (
+            cells_nominal_capacity * self.ocv(1) / Constants.SECONDS_PER_HOUR
+        )
+        self.soc = np.empty(len(self.alpha))
+        self.resistance = np.empty(len(self.alpha))
+        self.tension = np.empty(len(self.alpha))
+        self.available_capacity = np.empty(len(self.alpha))
+        self.current_capacity = np.empty(len(self.alpha))
+        self.renew(np.arange(len(self)))
+
+    @classmethod
+    def sample(
+        cls,
+        series_cells_numbers: Sequence[int],
+        parallel_branches_numbers: Sequence[int],
+        rng: np.random.Generator,
+        dispersion: float = 0.02,
+        cells_nominal_capacity: float = Cell.DEFAULT_NOMINAL_CAPACITY,
+        resistance: float = Cell.DEFAULT_RESISTANCE,
+        alpha: float = 0,
+        beta: float = 0,
+        ocv: Callable = Cell.DEFAULT_OCV,
+    ) -> "CellPacks":
+        """Builds packs whose cells' parameters are drawn around given means.
+
+        Each parameter of each cell is its mean times a log-normal factor of mean 1, so that it keeps its sign.
+
+        Parameters
+        ----------
+        series_cells_numbers : Sequence[int]
+            Number of series cells per branch of each pack.
+        parallel_branches_numbers : Sequence[int]
+            Number of parallel branches of each pack.
+        rng : np.random.Generator
+            Random generator drawing the cells' parameters.
+        dispersion : float
+            Standard deviation of the logarithm of the factors, roughly the relative cell-to-cell variation.
+        cells_nominal_capacity : float
+            Mean nominal capacity of the cells (C).
+        resistance : float
+            Mean internal resistance of the cells at birth (Ohms).
+        alpha : float
+            Mean capacity ageing coefficient of the cells (1/(W.s)).
+        beta : float
+            Mean internal resistance ageing coefficient of the cells (1/(W.s)).
+        ocv : Callable
+            Function of the state of charge returning open circuit voltage (V), shared by all the cells.
+
+        Returns
+        -------
+        CellPacks
+            The packs.
+        """
+        cells_number = int(
+            np.dot(
+                np.asarray(series_cells_numbers, dtype=np.int64),
+                np.asarray(parallel_branches_numbers, dtype=np.int64),
+            )
+        )
+        factors = rng.lognormal(-(dispersion ** 2) / 2, dispersion, (4, cells_number))
+        return cls(
+            series_cells_numbers,
+            parallel_branches_numbers,
+            cells_nominal_capacity * factors[0],
+            resistance * factors[1],
+            alpha * factors[2],
+            beta * factors[3],
+            ocv,
+        )
+
+    def __len__(self) -> int:
+        return len(self.series_cells_numbers)
+
+    def cells(self, indexes: Union[int, np.ndarray]) -> np.ndarray:
+        """Returns the indexes of the cells of some packs, pack by pack."""
+        indexes = np.atleast_1d(np.asarray(indexes, dtype=np.intp))
+        counts = self.cells_offsets[indexes + 1] - self.cells_offsets[indexes]
+        starts = np.append(0, np.cumsum(counts)[:-1])
+        return np.arange(counts.sum()) + np.repeat(
+            self.cells_offsets[indexes] - starts, counts
+        )
+
+    def renew(self, indexes: np.ndarray) -> None:
+        """Renews some packs, restoring their cells' state at birth.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the packs to renew.
+        """
+        cells = self.cells(np.asarray(indexes, dtype=np.intp))
+        self.soc[cells] = 1
+        self.tension[cells] = self.ocv(1)
+        self.resistance[cells] = self.initial_resistance[cells]
+        self.available_capacity[cells] = self.cells_nominal_capacity[cells]
+        self.current_capacity[cells] = self.cells_nominal_capacity[cells]
+
+    def __weakest_branch(self, values: np.ndarray, ufunc: np.ufunc) -> np.ndarray:
+        """Reduces cells' values over branches with a ufunc, then returns the lowest branch's value of each pack."""
+        return np.minimum.reduceat(
+            ufunc.reduceat(values, self.branches_starts), self.branches_offsets[:-1]
+        )
+
+    @property
+    def batteries_tension(self) -> np.ndarray:
+        """Tension of each pack, the one of its weakest branch (V)."""
+        return self.__weakest_branch(self.tension, np.add)
+
+    @property
+    def batteries_nominal_capacity(self) -> np.ndarray:
+        """Nominal capacity of each pack, its weakest branch's one times its number of branches (Wh)."""
+        return (
+            self.__weakest_branch(self.cells_nominal_capacity, np.minimum)
+            * self.parallel_branches_numbers
+        )
+
+    @property
+    def batteries_available_capacity(self) -> np.ndarray:
+        """Available capacity of each pack, its weakest branch's one times its number of branches (Wh)."""
+        return (
+            self.__weakest_branch(self.available_capacity, np.minimum)
+            * self.parallel_branches_numbers
+        )
+
+    @property
+    def batteries_current_capacity(self) -> np.ndarray:
+        """Current capacity of each pack, its weakest branch's one times its number of branches (Wh)."""
+        return (
+            self.__weakest_branch(self.current_capacity, np.minimum)
+            * self.parallel_branches_numbers
+        )
+
+    def ended(self) -> np.ndarray:
+        """Returns the mask of the packs that reached their end of life, as 'Battery.use' decides it."""
+        return (
+            self.batteries_available_capacity / self.batteries_nominal_capacity
+            <= Battery.MINIMUM_AVAILABLE_CAPACITY_RATIO
+        )
+
+    def use(
+        self, indexes: np.ndarray, timelapse: float, powers: np.ndarray
+    ) -> np.ndarray:
+        """Uses some packs for a given time lapse.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the packs to use.
+        timelapse : float
+            Time lapse of use (s).
+        powers : np.ndarray
+            Power of use of each pack (positive for charge and negative for discharge) (W).
+
+        Returns
+        -------
+        np.ndarray
+            Status of each pack's use.
+        """
+        indexes = np.asarray(indexes, dtype=np.intp)
+        cells_numbers = (
+            self.series_cells_numbers[indexes] * self.parallel_branches_numbers[indexes]
+        )
+        return self.__advance(
+            indexes,
+            np.repeat(np.asarray(powers, dtype=float) / cells_numbers, cells_numbers),
+            Cell.steps_number(timelapse),
+        )
+
+    def __advance(
+        self, indexes: np.ndarray, powers: np.ndarray, steps_number: int
+    ) -> np.ndarray:
+        """Advances the cells of some packs for a number of time increments.
+
+        Each pack stops at the first time increment at which one of its cells would raise an error in 'Cell.use', all its cells keeping the state they had before it. Too powerfull discharges take precedence over empty cells, which take precedence over full ones.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the packs whose cells are used.
+        powers : np.ndarray
+            Power of use of each of their cells, pack by pack (W).
+        steps_number : int
+            Number of time increments.
+
+        Returns
+        -------
+        np.ndarray
+            Status of each pack's advance.
+        """
+        statuses = np.full(len(indexes), Status.DONE, dtype=np.int8)
+        cells = self.cells(indexes)
+        packs = np.repeat(
+            np.arange(len(indexes)),
+            self.cells_offsets[indexes + 1] - self.cells_offsets[indexes],
+        )
+        soc = self.soc[cells]
+        resistance = self.resistance[cells]
+        tension = self.tension[cells]
+        available_capacity = self.available_capacity[cells]
+        current_capacity = self.current_capacity[cells]
+        capacity_ageing = 1 - self.alpha[cells] * Cell.TIME_INCREMENT * np.abs(powers)
+        resistance_ageing = 1 + self.beta[cells] * Cell.TIME_INCREMENT * np.abs(powers)
+        for _ in range(steps_number):
+            if not cells.size:
+                break
+            ocv = self.ocv(soc)
+            delta = ocv ** 2 + 4 * resistance * powers
+            too_powerfull = delta < 0
+            new_tension = (ocv + np.sqrt(np.where(too_powerfull, 0, delta))) / 2
+            capacity_delta = (
+                powers
+                / new_tension
+                * Cell.TIME_INCREMENT
+                * new_tension
+                / Constants.SECONDS_PER_HOUR
+            )
+            new_available_capacity = available_capacity * capacity_ageing
+            new_resistance = resistance * resistance_ageing
+            new_current_capacity = current_capacity + capacity_delta
+            empty = ~too_powerfull & (new_current_capacity < 0)
+            full = (
+                ~too_powerfull
+                & ~empty
+                & (new_current_capacity > new_available_capacity)
+            )
+            if too_powerfull.any() or empty.any() or full.any():
+                for status, mask in (
+                    (Status.FULL, full),
+                    (Status.EMPTY, empty),
+                    (Status.TOO_POWERFULL, too_powerfull),
+                ):
+                    statuses[packs[mask]] = status
+                failed = statuses[packs] != Status.DONE
+                failed_cells = cells[failed]
+                self.soc[failed_cells] = soc[failed]
+                self.resistance[failed_cells] = resistance[failed]
+                self.tension[failed_cells] = tension[failed]
+                self.available_capacity[failed_cells] = available_capacity[failed]
+                self.current_capacity[failed_cells] = current_capacity[failed]
+                succeeded = ~failed
+                cells = cells[succeeded]
+                packs = packs[succeeded]
+                powers = powers[succeeded]
+                capacity_ageing = capacity_ageing[succeeded]
+                resistance_ageing = resistance_ageing[succeeded]
+                new_tension = new_tension[succeeded]
+                new_resistance = new_resistance[succeeded]
+                new_available_capacity = new_available_capacity[succeeded]
+                new_current_capacity = new_current_capacity[succeeded]
+            available_capacity = new_available_capacity
+            resistance = new_resistance
+            tension = new_tension
+            current_capacity = new_current_capacity
+            soc = current_capacity / available_capacity
+        self.soc[cells] = soc
+        self.resistance[cells] = resistance
+        self.tension[cells] = tension
+        self.available_capacity[cells] = available_capacity
+        self.current_capacity[cells] = current_capacity
+        return statuses
+
+    def __repr__(self) -> str:
+        return "CellPacks({} packs, {} cells)".format(len(self), len(self.alpha))
+
+
+class PackSpec(NamedTuple):
+    """Immutable parameters a 'PackBattery' is drawn from, shared by its renewals, with the fields of 'BatterySpec' so that vehicles upgrade it alike."""
+
+    cell: CellSpec
+    series_cells_number: int
+    parallel_branches_number: int
+    dispersion: float
+    seed: Optional[int]
+
+
+class PackCell:
+    """View on the weakest branch of a 'PackBattery' as one of its cells, with the state 'Battery.cell' gives: a cell's share of the branch's tension and capacities, read live from the pack.
+
+    Parameters
+    ----------
+    battery : PackBattery
+        Battery viewed.
+    """
+
+    __slots__ = ("battery",)
+
+    def __init__(self, battery: "PackBattery") -> None:
+        self.battery = battery
+
+    @property
+    def resistance(self) -> float:
+        """Mean internal resistance of the pack's cells (Ohms)."""
+        packs = self.battery.packs
+        return float(np.mean(packs.resistance[packs.cells(self.battery.index)]))
+
+    @property
+    def tension(self) -> float:
+        """Tension of the weakest branch per series cell (V)."""
+        return (
+            float(self.battery.packs.batteries_tension[self.battery.index])
+            / self.battery.series_cells_number
+        )
+
+    @property
+    def available_capacity(self) -> float:
+        """Available capacity of the weakest branch, the lowest of its cells' ones (Wh)."""
+        packs = self.battery.packs
+        return float(np.min(packs.available_capacity[packs.cells(self.battery.index)]))
+
+    @property
+    def current_capacity(self) -> float:
+        """Current capacity of the weakest branch, the lowest of its cells' ones (Wh)."""
+        packs = self.battery.packs
+        return float(np.min(packs.current_capacity[packs.cells(self.battery.index)]))
+
+    @property
+    def soc(self) -> float:
+        """State of charge of the weakest branch."""
+        return self.current_capacity / self.available_capacity
+
+    def __repr__(self) -> str:
+        return "PackCell({})".format(repr(self.battery))
+
+
+class PackBattery:
+    """Battery object backed by one pack of a 'CellPacks'.
+
+    It follows the interface of 'Battery', so that vehicles and 'Fleet' use it alike: a use raises the errors 'Cell.use' would raise for the first failing cell, then 'BatteryLifetimeError' if the pack reached its end of life, its capacities and tension are the ones of its last successful use, 'cell' views its weakest branch (see 'PackCell') and 'spec' draws its renewals and upgrades (see 'from_spec'). Snapshots of vehicles hold this view only, so that they can not be restored.
+
+    Parameters
+    ----------
+    packs : CellPacks
+        Packs holding the battery's cells.
+    index : int
+        Index of the battery's pack.
+    spec : Optional[PackSpec]
+        Parameters the battery was drawn from, the pack's mean ones without dispersion if None.
+    """
+
+    MINIMUM_AVAILABLE_CAPACITY_RATIO: float = Battery.MINIMUM_AVAILABLE_CAPACITY_RATIO
+    __errors = {
+        Status.EMPTY: EmptyCellError,
+        Status.FULL: FullCellError,
+        Status.TOO_POWERFULL: TooPowerfullDischargeError,
+    }
+
+    def __init__(
+        self, packs: CellPacks, index: int = 0, spec: Optional[PackSpec] = None
+    ) -> None:
+        self.packs = packs
+        self.index = index
+        self.series_cells_number = int(packs.series_cells_numbers[index])
+        self.parallel_branches_number = int(packs.parallel_branches_numbers[index])
+        if spec is None:
+            cells = packs.cells(index)
+            spec = PackSpec(
+                CellSpec(
+                    packs.ocv,
+                    float(np.mean(packs.initial_resistance[cells])),
+                    float(np.mean(packs.cells_nominal_capacity[cells]))
+                    * Constants.SECONDS_PER_HOUR
+                    / packs.ocv(1),
+                    float(np.mean(packs.alpha[cells])),
+                    float(np.mean(packs.beta[cells])),
+                    None,
+                ),
+                self.series_cells_number,
+                self.parallel_branches_number,
+                0.0,
+                None,
+            )
+        self.spec = spec
+        self.cell = PackCell(self)
+        self.__update()
+
+    @classmethod
+    def sample(
+        cls,
+        series_cells_number: int = 100,
+        parallel_branches_number: int = 10,
+        rng: Optional[np.random.Generator] = None,
+        **kwargs: Union[float, Callable],
+    ) -> "PackBattery":
+        """Builds a battery whose cells' parameters are drawn around given means (see 'CellPacks.sample')."""
+        return cls(
+            CellPacks.sample(
+                [series_cells_number],
+                [parallel_branches_number],
+                np.random.default_rng() if rng is None else rng,
+                **kwargs,
+            )
+        )
+
+    @classmethod
+    def from_spec(cls, spec: PackSpec) -> "PackBattery":
+        """Draws a new battery from its parameters, the same cells for the same seed.
+
+        Parameters
+        ----------
+        spec : PackSpec
+            Parameters of the battery.
+
+        Returns
+        -------
+        PackBattery
+            The new battery.
+        """
+        packs = CellPacks.sample(
+            [spec.series_cells_number],
+            [spec.parallel_branches_number],
+            np.random.default_rng(spec.seed),
+            spec.dispersion,
+            spec.cell.nominal_capacity,
+            spec.cell.resistance,
+            spec.cell.alpha,
+            spec.cell.beta,
+            spec.cell.ocv,
+        )
+        return cls(packs, 0, spec)
+
+    def __update(self) -> None:
+        """Sets the battery's capacities and tension from its pack's ones."""
+        self.tension = float(self.packs.batteries_tension[self.index])
+        self.nominal_capacity = float(
+            self.packs.batteries_nominal_capacity[self.index]
+        )
+        self.available_capacity = float(
+            self.packs.batteries_available_capacity[self.index]
+        )
+        self.current_capacity = float(
+            self.packs.batteries_current_capacity[self.index]
+        )
+
+    def renew(self) -> None:
+        """Restores the battery's state at birth."""
+        self.packs.renew(np.array([self.index]))
+        self.__update()
+
+    def use(self, timelapse: float, power: float) -> None:
+        """Method to use the battery.
+
+        Parameters
+        ----------
+        timelapse : float
+            Time lapse of using (s).
+        power : float
+            Power of using (positive for charge and negative for discharge) (W).
+        """
+        status = self.packs.use(np.array([self.index]), timelapse, np.array([power]))[0]
+        if status != Status.DONE:
+            raise self.__errors[status]
+        self.__update()
+        if (
+            self.available_capacity / self.nominal_capacity
+            <= self.MINIMUM_AVAILABLE_CAPACITY_RATIO
+        ):
+            raise BatteryLifetimeError
+
+    def __repr__(self) -> str:
+        return "PackBattery({}, {}, {})".format(
+            self.series_cells_number, self.parallel_branches_number, self.index
+        )
@@ -1,13 +1,22 @@
 from abc import ABC, abstractmethod
-from .data_models import ResourcesData
+from typing import Type, Union
+from .data_models import ColumnarResourcesData, ResourcesData
 
 
 class IObtainFleetData(ABC):
-    """Resources interface to inherit from (resource-side)."""
+    """Resources interface to inherit from (resource-side).
+
+    Attributes
+    ----------
+    data_model : Type[Union[ResourcesData, ColumnarResourcesData]]
+        Model validating the resources returned by 'get_fleet_data'.
+    """
+
+    data_model: Type[Union[ResourcesData, ColumnarResourcesData]] = ResourcesData
 
     def __init__(self, *args: list, **kwargs: dict) -> None:
         super().__init__()
-        self.data = ResourcesData(**self.get_fleet_data(*args, **kwargs))
+        self.data = self.data_model(**self.get_fleet_data(*args, **kwargs))
 
     @abstractmethod
     def get_fleet_data(self, *args: list, **kwargs: dict) -> dict:
@@ -25,4 +34,51 @@ class IObtainFleetData(ABC):
         dict
             Dictionary containing the resources.
         """
-        pass
\ No newline at end of file
+        pass
+
+
+class IAsyncObtainFleetData(IObtainFleetData):
+    """Asynchronous resources interface to inherit from (resource-side).
+
+    As '__init__' can not await, instances are built with 'await cls.create(*args, **kwargs)', which awaits 'get_fleet_data' and validates its result.
+    """
+
+    def __init__(self) -> None:
+        pass
+
+    @classmethod
+    async def create(cls, *args: list, **kwargs: dict) -> "IAsyncObtainFleetData":
+        """Returns an adapter whose resources are obtained from the parameters.
+
+        Parameters
+        ----------
+        args : list
+            List of unnamed parameters passed to 'get_fleet_data'.
+        kwargs : dict
+            Dictionary of named parameters passed to 'get_fleet_data'.
+
+        Returns
+        -------
+        IAsyncObtainFleetData
+            The adapter, with validated resources.
+        """
+        adapter = cls()
+        adapter.data = cls.data_model(**await adapter.get_fleet_data(*args, **kwargs))
+        return adapter
+
+    @abstractmethod
+    async def get_fleet_data(self, *args: list, **kwargs: dict) -> dict:
+        """Returns a dictionary of the resources.
+
+        Parameters
+        ----------
+        args : list
+            List of unnamed parameters.
+        kwargs : dict
+            Dictionary of named parameters.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the resources.
+        """
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+from .data_models import ColumnarOutputsData
+
+
+class IResultsSink(ABC):
+    """Results sink interface to inherit from.
+
+    Sinks are given the outputs of a run chunk by chunk, as yielded by 'iter_simulate', and write them as they come, so that the memory taken by results stays bounded by the chunk size.
+    """
+
+    @abstractmethod
+    def write(self, outputs: ColumnarOutputsData) -> None:
+        """Writes the outputs of a chunk, following the ones of the previous chunks.
+
+        Parameters
+        ----------
+        outputs : ColumnarOutputsData
+            Outputs of the chunk.
+        """
+
+    def write_all(self, chunks: Iterable[ColumnarOutputsData]) -> None:
+        """Writes the outputs of every chunk, as they are produced.
+
+        Parameters
+        ----------
+        chunks : Iterable[ColumnarOutputsData]
+            Outputs of the computing, chunk by chunk.
+        """
+        for outputs in chunks:
+            self.write(outputs)
+
+    def close(self) -> None:
+        """Flushes and releases what the sink writes to."""
+
+    def __enter__(self) -> "IResultsSink":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
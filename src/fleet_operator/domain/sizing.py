@@ -0,0 +1,324 @@
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
+from .core import Fleet, FleetControler
+from .criterions import get_criterion
+from .data_models import ColumnarResourcesData, ResourcesData, SizingOutputsData
+from .server import IObtainFleetData
+
+
+def resize(
+    resources_data: Union[ResourcesData, ColumnarResourcesData],
+    dimension: Literal["VEHICLES", "CHARGING_STATIONS"],
+    size: int,
+) -> dict:
+    """Returns resources with a given number of vehicles or charging stations.
+
+    The sized part is made of the base ones repeated in order, so that sizes lower than the base one keep its first vehicles or charging stations.
+
+    Parameters
+    ----------
+    resources_data : Union[ResourcesData, ColumnarResourcesData]
+        Base resources.
+    dimension : Literal["VEHICLES", "CHARGING_STATIONS"]
+        Sized part of the fleet.
+    size : int
+        Number of vehicles or charging stations.
+
+    Returns
+    -------
+    dict
+        Dictionary containing the resized resources, in the layout of 'ResourcesData'.
+    """
+    vehicles = list(resources_data.vehicles)
+    charging_stations = list(resources_data.charging_stations)
+    if dimension == "VEHICLES":
+        vehicles = [vehicles[index % len(vehicles)] for index in range(size)]
+    elif dimension == "CHARGING_STATIONS":
+        charging_stations = [
+            charging_stations[index % len(charging_stations)] for index in range(size)
+        ]
+    else:
+        raise ValueError("Unknown dimension {}.".format(repr(dimension)))
+    resources = {"vehicles": vehicles, "charging_stations": charging_stations}
+    if resources_data.ocv is not None:
+        resources["ocv"] = resources_data.ocv.dict()
+    return resources
+
+
+class SizedFleetAdapter(IObtainFleetData):
+    """Resources adapter for fleets resized from base resources (see 'resize')."""
+
+    def get_fleet_data(
+        self,
+        resources_data: Union[ResourcesData, ColumnarResourcesData],
+        dimension: Literal["VEHICLES", "CHARGING_STATIONS"],
+        size: int,
+    ) -> dict:
+        """Returns the resized resources."""
+        super().get_fleet_data(resources_data, dimension, size)
+        return resize(resources_data, dimension, size)
+
+
+class FleetSizer:
+    """Searches the number of vehicles or charging stations of a fleet reaching a target final grade on a scenario.
+
+    Each step's grade is the share of the used vehicles succeeding, so that the final grade increases with the number of charging stations and decreases with the number of vehicles, which share them. The smallest number of charging stations reaching the target is searched by 'minimum_size' and the largest number of vehicles by 'maximum_size', each by doubling then bisection, which finds them as long as the final grade varies monotonously with the size. Sizes go up to 'MAXIMUM_SIZE_RATIO' times the base size, and charging stations never outnumber vehicles, as each charges at most one vehicle.
+    Candidates' runs stop as soon as their outcome is known: once their grade reaches the target, as grades never decrease, or once it can not reach it anymore, as a step adds at most one to the grade. Runs of the candidates bracketing the searched size are kept and resumed from where they stopped when they are needed again, the others are evicted as the bracket narrows.
+
+    Parameters
+    ----------
+    resources_data : Union[ResourcesData, ColumnarResourcesData]
+        Base resources, resized for each candidate (see 'resize').
+    dimension : Literal["VEHICLES", "CHARGING_STATIONS"]
+        Sized part of the fleet.
+    scenario : Sequence[Tuple[float, float]]
+        Scenario of fleet tasks as a list of tuples: timelapse of task (s), task's needed fleet's load.
+    use_priority_criterion : str
+        Criterion to use to sort vehicles.
+    engine : Literal["OBJECT", "VECTORIZED", "EVENT"]
+        Simulation engine of the candidates (see 'FleetControler').
+    tolerance : Optional[float]
+        Closed form integration tolerance of the candidates (see 'FleetControler').
+    charging_allocation : Literal["SORTED", "NEEDIEST"]
+        Allocation of the charging stations at each step (see 'Fleet').
+
+    Attributes
+    ----------
+    size_limit : int
+        Largest size considered.
+    simulated_steps : int
+        Number of steps simulated by all the candidates.
+    """
+
+    MAXIMUM_SIZE_RATIO: int = 64
+
+    def __init__(
+        self,
+        resources_data: Union[ResourcesData, ColumnarResourcesData],
+        dimension: Literal["VEHICLES", "CHARGING_STATIONS"],
+        scenario: Sequence[Tuple[float, float]],
+        use_priority_criterion: str,
+        engine: Literal["OBJECT", "VECTORIZED", "EVENT"] = "OBJECT",
+        tolerance: Optional[float] = None,
+        charging_allocation: Literal["SORTED", "NEEDIEST"] = "SORTED",
+    ) -> None:
+        resize(resources_data, dimension, 1)
+        get_criterion(use_priority_criterion)
+        self.resources_data = resources_data
+        self.dimension = dimension
+        self.scenario = scenario
+        self.use_priority_criterion = use_priority_criterion
+        self.engine = engine
+        self.tolerance = tolerance
+        self.charging_allocation = charging_allocation
+        vehicles_number = len(resources_data.vehicles)
+        if dimension == "VEHICLES":
+            self.size_limit = self.MAXIMUM_SIZE_RATIO * vehicles_number
+        else:
+            self.size_limit = min(
+                self.MAXIMUM_SIZE_RATIO * len(resources_data.charging_stations),
+                vehicles_number,
+            )
+        self.simulated_steps = 0
+        self.__fleets: Dict[int, Fleet] = {}
+
+    def __fleet(self, size: int) -> Fleet:
+        """Returns the candidate of a size, built and reset on first use."""
+        fleet = self.__fleets.get(size)
+        if fleet is None:
+            fleet = FleetControler(
+                SizedFleetAdapter(self.resources_data, self.dimension, size),
+                engine=self.engine,
+                tolerance=self.tolerance,
+                charging_allocation=self.charging_allocation,
+            ).fleet
+            fleet.reset()
+            self.__fleets[size] = fleet
+        return fleet
+
+    def __run(self, size: int, target: Optional[float]) -> float:
+        """Runs the candidate of a size until its outcome for a target grade is known, or until the end of the scenario if None, and returns its grade."""
+        fleet = self.__fleet(size)
+        tasks_number = len(self.scenario)
+        index = len(fleet.time) - 1
+        start = index
+        while index < tasks_number and (
+            target is None
+            or (
+                fleet.grades[-1] < target
+                and fleet.grades[-1] + tasks_number - index >= target
+            )
+        ):
+            time_lapse, fleet_load = self.scenario[index]
+            fleet.use(time_lapse, fleet_load, self.use_priority_criterion)
+            index += 1
+        self.simulated_steps += index - start
+        return fleet.grades[-1]
+
+    def __evict(self, *bracket: int) -> None:
+        """Forgets the candidates' runs of sizes out of a bracket."""
+        low, high = min(bracket), max(bracket)
+        for size in [size for size in self.__fleets if not low <= size <= high]:
+            del self.__fleets[size]
+
+    def reaches(self, size: int, target: float) -> bool:
+        """Tells whether the candidate of a size reaches a target final grade, simulating it only until this is known.
+
+        Parameters
+        ----------
+        size : int
+            Number of vehicles or charging stations.
+        target : float
+            Final grade to reach.
+
+        Returns
+        -------
+        bool
+            True if the final grade reaches the target.
+        """
+        return self.__run(size, target) >= target
+
+    def final_grade(self, size: int) -> float:
+        """Returns the final grade of the candidate of a size, simulating it until the end of the scenario.
+
+        Parameters
+        ----------
+        size : int
+            Number of vehicles or charging stations.
+
+        Returns
+        -------
+        float
+            Final grade of the candidate.
+        """
+        return self.__run(size, None)
+
+    def minimum_size(
+        self, target: float, low: int = 1, high: Optional[int] = None
+    ) -> SizingOutputsData:
+        """Returns the smallest number of charging stations reaching a target final grade.
+
+        Parameters
+        ----------
+        target : float
+            Final grade to reach.
+        low : int
+            Smallest size to consider.
+        high : Optional[int]
+            Largest size to consider, at most 'size_limit', found by doubling low if None.
+
+        Returns
+        -------
+        SizingOutputsData
+            Size found and cost of the search.
+        """
+        if self.dimension != "CHARGING_STATIONS":
+            raise ValueError(
+                "The final grade decreases with the number of vehicles, search the largest one reaching the target with 'maximum_size'."
+            )
+        return self.__search(target, low, high, True)
+
+    def maximum_size(
+        self, target: float, low: int = 1, high: Optional[int] = None
+    ) -> SizingOutputsData:
+        """Returns the largest number of vehicles reaching a target final grade.
+
+        Parameters
+        ----------
+        target : float
+            Final grade to reach.
+        low : int
+            Smallest size to consider.
+        high : Optional[int]
+            Largest size to consider, at most 'size_limit', found by doubling low if None.
+
+        Returns
+        -------
+        SizingOutputsData
+            Size found and cost of the search.
+        """
+        if self.dimension != "VEHICLES":
+            raise ValueError(
+                "The final grade increases with the number of charging stations, search the smallest one reaching the target with 'minimum_size'."
+            )
+        return self.__search(target, low, high, False)
+
+    def __search(
+        self, target: float, low: int, high: Optional[int], increasing: bool
+    ) -> SizingOutputsData:
+        """Searches the size reaching a target final grade closest to failing ones, the final grade increasing or decreasing with the size."""
+        if target > len(self.scenario):
+            raise ValueError(
+                "The target grade {} exceeds the {} tasks of the scenario.".format(
+                    target, len(self.scenario)
+                )
+            )
+        if low > self.size_limit:
+            raise ValueError(
+                "The smallest size {} exceeds the largest considered one, {}.".format(
+                    low, self.size_limit
+                )
+            )
+        simulated_steps = self.simulated_steps
+        evaluated_sizes: List[int] = []
+        dimension = self.dimension.lower().replace("_", " ")
+
+        def reaches(size: int) -> bool:
+            evaluated_sizes.append(size)
+            return self.reaches(size, target)
+
+        def not_reached(size: int) -> ValueError:
+            return ValueError(
+                "The target grade {} is not reached with {} {}.".format(
+                    target, size, dimension
+                )
+            )
+
+        # Size reaching the target and size failing it, the searched size lying between
+        if increasing:
+            reaching, failing = low, low - 1
+            if high is not None:
+                reaching = min(high, self.size_limit)
+            while not reaches(reaching):
+                if high is not None or reaching >= self.size_limit:
+                    raise not_reached(reaching)
+                failing, reaching = reaching, min(2 * reaching, self.size_limit)
+                self.__evict(failing, reaching)
+        else:
+            if not reaches(low):
+                raise not_reached(low)
+            reaching, failing = low, self.size_limit + 1
+            if high is not None:
+                failing = min(high, self.size_limit) + 1
+            while reaching < failing - 1:
+                size = (
+                    failing - 1 if high is not None else min(2 * reaching, failing - 1)
+                )
+                if not reaches(size):
+                    failing = size
+                    break
+                reaching = size
+                self.__evict(reaching, failing)
+        self.__evict(reaching, failing)
+        while abs(reaching - failing) > 1:
+            middle = (reaching + failing) // 2
+            if reaches(middle):
+                reaching = middle
+            else:
+                failing = middle
+            self.__evict(reaching, failing)
+        return SizingOutputsData(
+            dimension=self.dimension,
+            target=target,
+            size=reaching,
+            evaluated_sizes=evaluated_sizes,
+            simulated_steps=self.simulated_steps - simulated_steps,
+        )
+
+    def clear(self) -> None:
+        """Forgets the candidates' runs."""
+        self.__fleets.clear()
+
+    def __repr__(self) -> str:
+        return "FleetSizer({}, {} candidates)".format(
+            self.dimension, len(self.__fleets)
+        )
@@ -0,0 +1,452 @@
+from copy import deepcopy
+from itertools import repeat
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+import numpy as np
+from .core import FleetControler, simulate
+from .data_models import SweepOutputsData
+from .server import IObtainFleetData
+from .utils import Constants
+
+
+class FleetDistribution:
+    """Uniform distribution of fleets' compositions.
+
+    Parameters
+    ----------
+    number_of_vehicles : int
+        Number of vehicles of each fleet.
+    number_of_charging_stations : int
+        Number of charging stations of each fleet.
+    cell_nominal_capacity_range : Tuple[float, float]
+        Range of vehicles' battery's cell nominal capacity (C).
+    battery_series_cells_number_range : Tuple[int, int]
+        Range of vehicles' battery's number of cells in series.
+    battery_parallel_branches_number_range : Tuple[int, int]
+        Range of vehicles' battery's number of parallel branches.
+    vehicle_power_range : Tuple[float, float]
+        Range of vehicles' power consumption (W).
+    charging_stations_power_range : Tuple[float, float]
+        Range of charging stations' delivered power (W).
+    """
+
+    def __init__(
+        self,
+        number_of_vehicles: int = 100,
+        number_of_charging_stations: int = 20,
+        cell_nominal_capacity_range: Tuple[float, float] = (
+            2 * Constants.SECONDS_PER_HOUR,
+            3 * Constants.SECONDS_PER_HOUR,
+        ),
+        battery_series_cells_number_range: Tuple[int, int] = (50, 150),
+        battery_parallel_branches_number_range: Tuple[int, int] = (5, 15),
+        vehicle_power_range: Tuple[float, float] = (10e3, 50e3),
+        charging_stations_power_range: Tuple[float, float] = (50e3, 150e3),
+    ) -> None:
+        self.number_of_vehicles = number_of_vehicles
+        self.number_of_charging_stations = number_of_charging_stations
+        self.cell_nominal_capacity_range = cell_nominal_capacity_range
+        self.battery_series_cells_number_range = battery_series_cells_number_range
+        self.battery_parallel_branches_number_range = (
+            battery_parallel_branches_number_range
+        )
+        self.vehicle_power_range = vehicle_power_range
+        self.charging_stations_power_range = charging_stations_power_range
+
+    def sample(self, rng: np.random.Generator) -> dict:
+        """Draws a fleet.
+
+        Parameters
+        ----------
+        rng : np.random.Generator
+            Random generator to draw from.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the fleet's resources.
+        """
+        vehicles = self.sample_vehicles([rng] * 4, self.number_of_vehicles)
+        charging_stations = self.sample_charging_stations(
+            rng, self.number_of_charging_stations
+        )
+        return {
+            "vehicles": list(
+                zip(
+                    vehicles["cells_nominal_capacity"].tolist(),
+                    vehicles["series_cells_numbers"].tolist(),
+                    vehicles["parallel_branches_numbers"].tolist(),
+                    vehicles["vehicles_power"].tolist(),
+                )
+            ),
+            "charging_stations": charging_stations.tolist(),
+        }
+
+    def sample_vehicles(
+        self, rngs: Sequence[np.random.Generator], number_of_vehicles: int
+    ) -> Dict[str, np.ndarray]:
+        """Draws vehicles as columns.
+
+        Each column is drawn from its own random generator, so that vehicles drawn by consecutive calls are the ones a single call would draw when generators are distinct.
+
+        Parameters
+        ----------
+        rngs : Sequence[np.random.Generator]
+            Random generators to draw the cells' nominal capacity, the numbers of cells in series, the numbers of parallel branches and the vehicles' power from.
+        number_of_vehicles : int
+            Number of vehicles to draw.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Vehicles' columns named after 'ColumnarResourcesData' fields.
+        """
+        columns = [
+            rng.uniform(min(value_range), max(value_range), number_of_vehicles)
+            for rng, value_range in zip(
+                rngs,
+                [
+                    self.cell_nominal_capacity_range,
+                    self.battery_series_cells_number_range,
+                    self.battery_parallel_branches_number_range,
+                    self.vehicle_power_range,
+                ],
+            )
+        ]
+        return {
+            "cells_nominal_capacity": columns[0],
+            "series_cells_numbers": columns[1].astype(np.int64),
+            "parallel_branches_numbers": columns[2].astype(np.int64),
+            "vehicles_power": columns[3],
+        }
+
+    def sample_charging_stations(
+        self, rng: np.random.Generator, number_of_charging_stations: int
+    ) -> np.ndarray:
+        """Draws charging stations' delivered power (W).
+
+        Parameters
+        ----------
+        rng : np.random.Generator
+            Random generator to draw from.
+        number_of_charging_stations : int
+            Number of charging stations to draw.
+        """
+        return rng.uniform(
+            min(self.charging_stations_power_range),
+            max(self.charging_stations_power_range),
+            number_of_charging_stations,
+        )
+
+    def __repr__(self) -> str:
+        return "FleetDistribution({}, {}, {}, {}, {}, {}, {})".format(
+            self.number_of_vehicles,
+            self.number_of_charging_stations,
+            self.cell_nominal_capacity_range,
+            self.battery_series_cells_number_range,
+            self.battery_parallel_branches_number_range,
+            self.vehicle_power_range,
+            self.charging_stations_power_range,
+        )
+
+
+class LoadCycle:
+    """Daily and weekly cycle of tasks' needed fleet's load.
+
+    The mean load at a given time is the one of the daily profile, linearly interpolated between hours, times the factor of the day of the week. Loads are drawn around it with a gaussian noise.
+
+    Parameters
+    ----------
+    daily_profile : Sequence[float]
+        Mean load at each hour of the day, from midnight.
+    weekly_factors : Sequence[float]
+        Factor of the mean load on each day of the week, from the first day of the scenarios.
+    noise : float
+        Standard deviation of the loads around the mean one.
+    start : float
+        Time of the week at which scenarios start (s).
+    """
+
+    DEFAULT_DAILY_PROFILE: Tuple[float, ...] = (
+        0.15,
+        0.1,
+        0.1,
+        0.1,
+        0.15,
+        0.3,
+        0.6,
+        0.85,
+        0.9,
+        0.7,
+        0.55,
+        0.55,
+        0.6,
+        0.55,
+        0.5,
+        0.55,
+        0.7,
+        0.9,
+        0.95,
+        0.75,
+        0.5,
+        0.35,
+        0.25,
+        0.2,
+    )
+    DEFAULT_WEEKLY_FACTORS: Tuple[float, ...] = (1, 1, 1, 1, 1, 0.6, 0.5)
+
+    def __init__(
+        self,
+        daily_profile: Sequence[float] = DEFAULT_DAILY_PROFILE,
+        weekly_factors: Sequence[float] = DEFAULT_WEEKLY_FACTORS,
+        noise: float = 0.05,
+        start: float = 0,
+    ) -> None:
+        if len(daily_profile) != Constants.HOURS_PER_DAY:
+            raise ValueError(
+                "The daily profile must have one load per hour, {} given.".format(
+                    len(daily_profile)
+                )
+            )
+        self.daily_profile = np.asarray(daily_profile, dtype=float)
+        self.weekly_factors = np.asarray(weekly_factors, dtype=float)
+        self.noise = noise
+        self.start = start
+
+    def mean(self, time: np.ndarray) -> np.ndarray:
+        """Returns the mean load at given times.
+
+        Parameters
+        ----------
+        time : np.ndarray
+            Times from the start of the scenario (s).
+        """
+        time = self.start + np.asarray(time, dtype=float)
+        seconds_per_day = Constants.SECONDS_PER_HOUR * Constants.HOURS_PER_DAY
+        hours = (time % seconds_per_day) / Constants.SECONDS_PER_HOUR
+        days = (time // seconds_per_day).astype(np.int64) % len(self.weekly_factors)
+        return (
+            np.interp(
+                hours,
+                np.arange(Constants.HOURS_PER_DAY + 1),
+                np.append(self.daily_profile, self.daily_profile[0]),
+            )
+            * self.weekly_factors[days]
+        )
+
+    def sample(self, rng: np.random.Generator, time: np.ndarray) -> np.ndarray:
+        """Draws loads at given times.
+
+        Parameters
+        ----------
+        rng : np.random.Generator
+            Random generator to draw from.
+        time : np.ndarray
+            Times from the start of the scenario (s).
+        """
+        return self.mean(time) + rng.normal(0, self.noise, len(time))
+
+    def __repr__(self) -> str:
+        return "LoadCycle({}, {}, {}, {})".format(
+            self.daily_profile.tolist(),
+            self.weekly_factors.tolist(),
+            self.noise,
+            self.start,
+        )
+
+
+class ScenarioDistribution:
+    """Distribution of scenarios, uniform or following a load cycle.
+
+    Parameters
+    ----------
+    tasks_number : int
+        Number of tasks of each scenario.
+    timelapse_range : Tuple[float, float]
+        Range of tasks' timelapse (s).
+    load_range : Tuple[float, float]
+        Range of tasks' needed fleet's load, to which loads drawn from the load cycle are clipped.
+    load_cycle : Optional[LoadCycle]
+        Cycle of the loads at the start of each task, loads are uniform if None.
+    """
+
+    def __init__(
+        self,
+        tasks_number: int = 500,
+        timelapse_range: Tuple[float, float] = (
+            Constants.SECONDS_PER_HOUR / 4,
+            Constants.SECONDS_PER_HOUR * 2,
+        ),
+        load_range: Tuple[float, float] = (0.1, 1),
+        load_cycle: Optional[LoadCycle] = None,
+    ) -> None:
+        self.tasks_number = tasks_number
+        self.timelapse_range = timelapse_range
+        self.load_range = load_range
+        self.load_cycle = load_cycle
+
+    def sample(self, rng: np.random.Generator) -> List[Tuple[float, float]]:
+        """Draws a scenario.
+
+        Parameters
+        ----------
+        rng : np.random.Generator
+            Random generator to draw from.
+
+        Returns
+        -------
+        List[Tuple[float, float]]
+            Scenario of fleet tasks as a list of tuples: timelapse of task (s), task's needed fleet's load.
+        """
+        timelapses, loads, _ = self.sample_tasks([rng] * 2, self.tasks_number)
+        return list(zip(timelapses.tolist(), loads.tolist()))
+
+    def sample_tasks(
+        self,
+        rngs: Sequence[np.random.Generator],
+        tasks_number: int,
+        start_time: float = 0,
+    ) -> Tuple[np.ndarray, np.ndarray, float]:
+        """Draws tasks as columns.
+
+        Each column is drawn from its own random generator, so that tasks drawn by consecutive calls, each starting at the end time of the previous one, are the ones a single call would draw when generators are distinct.
+
+        Parameters
+        ----------
+        rngs : Sequence[np.random.Generator]
+            Random generators to draw the timelapses and the loads from.
+        tasks_number : int
+            Number of tasks to draw.
+        start_time : float
+            Time at the start of the first task (s).
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, float]
+            Tasks' timelapse (s), tasks' needed fleet's load and time at the end of the last task (s).
+        """
+        timelapse_rng, load_rng = rngs
+        timelapses = timelapse_rng.uniform(
+            min(self.timelapse_range), max(self.timelapse_range), tasks_number
+        )
+        time = np.cumsum(np.append(float(start_time), timelapses))
+        if self.load_cycle is None:
+            loads = load_rng.uniform(
+                min(self.load_range), max(self.load_range), tasks_number
+            )
+        else:
+            loads = np.clip(
+                self.load_cycle.sample(load_rng, time[:-1]),
+                min(self.load_range),
+                max(self.load_range),
+            )
+        return timelapses, loads, float(time[-1])
+
+    def __repr__(self) -> str:
+        return "ScenarioDistribution({}, {}, {}, {})".format(
+            self.tasks_number, self.timelapse_range, self.load_range, self.load_cycle
+        )
+
+
+class SampledFleetAdapter(IObtainFleetData):
+    """Resources adapter for fleets drawn from a 'FleetDistribution'."""
+
+    def get_fleet_data(
+        self, fleet_distribution: FleetDistribution, rng: np.random.Generator
+    ) -> dict:
+        """Returns a fleet drawn from the distribution."""
+        super().get_fleet_data(fleet_distribution, rng)
+        return fleet_distribution.sample(rng)
+
+
+def _run_sample(
+    seed_sequence: np.random.SeedSequence,
+    fleet_distribution: FleetDistribution,
+    scenario_distribution: ScenarioDistribution,
+    use_priority_criterions: Sequence[str],
+    engine: Literal["OBJECT", "VECTORIZED"],
+) -> List[float]:
+    """Draws a fleet and a scenario and returns the final grade of each criterion's run."""
+    rng = np.random.default_rng(seed_sequence)
+    fleet_controler = FleetControler(
+        SampledFleetAdapter(fleet_distribution, rng), engine=engine
+    )
+    scenario = scenario_distribution.sample(rng)
+    return [
+        simulate(
+            deepcopy(fleet_controler.fleet), scenario, use_priority_criterion
+        ).grades[-1]
+        for use_priority_criterion in use_priority_criterions
+    ]
+
+
+def sweep(
+    fleet_distribution: FleetDistribution,
+    scenario_distribution: ScenarioDistribution,
+    use_priority_criterions: Sequence[str],
+    samples_number: int,
+    seed: Optional[int] = None,
+    quantiles: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95),
+    max_workers: Optional[int] = None,
+    engine: Literal["OBJECT", "VECTORIZED"] = "VECTORIZED",
+) -> SweepOutputsData:
+    """Runs criterions on random fleets and scenarios and summarizes their final grades.
+
+    Each sample draws a fleet and a scenario from its own seed, spawned from the sweep's one, so that results do not depend on how samples are spread across worker processes. Only final grades are sent back and kept.
+
+    Parameters
+    ----------
+    fleet_distribution : FleetDistribution
+        Distribution to draw fleets from.
+    scenario_distribution : ScenarioDistribution
+        Distribution to draw scenarios from.
+    use_priority_criterions : Sequence[str]
+        Criterions to run on each sample.
+    samples_number : int
+        Number of fleets and scenarios to draw.
+    seed : Optional[int]
+        Seed of the sweep, drawn from the operating system if None.
+    quantiles : Sequence[float]
+        Quantiles of the final grades to compute.
+    max_workers : Optional[int]
+        Maximum number of worker processes, the number of processors if None.
+    engine : Literal["OBJECT", "VECTORIZED"]
+        Simulation engine of the fleets.
+
+    Returns
+    -------
+    SweepOutputsData
+        Summary statistics of the final grades per criterion.
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    samples_seed_sequences = seed_sequence.spawn(samples_number)
+    final_grades = np.empty((samples_number, len(use_priority_criterions)))
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        for index, sample_final_grades in enumerate(
+            executor.map(
+                _run_sample,
+                samples_seed_sequences,
+                repeat(fleet_distribution),
+                repeat(scenario_distribution),
+                repeat(use_priority_criterions),
+                repeat(engine),
+            )
+        ):
+            final_grades[index] = sample_final_grades
+    grades_quantiles = np.quantile(final_grades, quantiles, axis=0)
+    return SweepOutputsData(
+        seed=seed_sequence.entropy,
+        samples_number=samples_number,
+        quantiles=list(quantiles),
+        means={
+            use_priority_criterion: mean
+            for use_priority_criterion, mean in zip(
+                use_priority_criterions, final_grades.mean(axis=0).tolist()
+            )
+        },
+        grades_quantiles={
+            use_priority_criterion: grades_quantiles[:, index].tolist()
+            for index, use_priority_criterion in enumerate(use_priority_criterions)
+        },
+    )
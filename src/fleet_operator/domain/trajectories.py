@@ -0,0 +1,148 @@
+from enum import IntFlag
+from typing import Dict, Sequence, Union
+import numpy as np
+
+TRAJECTORY_STATE = ["soc", "available_capacity", "resistance"]
+
+
+class VehicleFlags(IntFlag):
+    """Events of a vehicle during recorded steps, cumulated between two records."""
+
+    USED = 1
+    FAILED = 2
+    CHARGED = 4
+    RENEWED = 8
+
+
+class TrajectoryRecorder:
+    """Recorder of the state of every vehicle along runs, in preallocated arrays.
+
+    A fleet with a recorder attached flags its vehicles during each step ('mark') and calls 'record' at the end of each step. One step out of decimation is recorded, with the events flagged since the previous record, so that no renewal or failure is missed. Fleets without recorder neither flag nor record anything. The recorder is cleared when its fleet is reset or restored.
+
+    Parameters
+    ----------
+    vehicles_number : int
+        Number of vehicles of the fleet.
+    records_number : int
+        Number of records preallocated.
+    decimation : int
+        Number of steps per record.
+    ring : bool
+        Whether the oldest records are overwritten once all the preallocated ones are used, a ValueError being raised otherwise.
+
+    Attributes
+    ----------
+    steps : np.ndarray
+        Index of the step of each record, the first step being 1.
+    time : np.ndarray
+        Time of the fleet at each record (s).
+    soc : np.ndarray
+        State of charge of each vehicle's cells at each record (float32).
+    available_capacity : np.ndarray
+        Available capacity of each vehicle's cells at each record (Wh, float32).
+    resistance : np.ndarray
+        Internal resistance of each vehicle's cells at each record (Ohms, float32).
+    flags : np.ndarray
+        'VehicleFlags' of each vehicle at each record (uint8).
+    records_count : int
+        Number of records since the last reset, overwritten ones included.
+    """
+
+    def __init__(
+        self,
+        vehicles_number: int,
+        records_number: int,
+        decimation: int = 1,
+        ring: bool = False,
+    ) -> None:
+        if decimation < 1:
+            raise ValueError("The decimation must be a positive integer.")
+        self.decimation = decimation
+        self.ring = ring
+        self.steps = np.zeros(records_number, dtype=np.int64)
+        self.time = np.zeros(records_number)
+        self.soc = np.zeros((records_number, vehicles_number), dtype=np.float32)
+        self.available_capacity = np.zeros(
+            (records_number, vehicles_number), dtype=np.float32
+        )
+        self.resistance = np.zeros((records_number, vehicles_number), dtype=np.float32)
+        self.flags = np.zeros((records_number, vehicles_number), dtype=np.uint8)
+        self.__pending_flags = np.zeros(vehicles_number, dtype=np.uint8)
+        self.__step = 0
+        self.records_count = 0
+
+    def reset(self) -> None:
+        """Clears the records."""
+        self.__pending_flags[:] = 0
+        self.__step = 0
+        self.records_count = 0
+
+    def mark(
+        self, indexes: Union[Sequence[int], np.ndarray], flag: VehicleFlags
+    ) -> None:
+        """Flags some vehicles for the next record.
+
+        Parameters
+        ----------
+        indexes : Union[Sequence[int], np.ndarray]
+            Indexes of the vehicles, in the order they were added to the fleet.
+        flag : VehicleFlags
+            Event to flag.
+        """
+        self.__pending_flags[indexes] |= np.uint8(flag)
+
+    def record(self, fleet: object) -> None:
+        """Ends a step, recording the state of the fleet's vehicles if the step is not decimated.
+
+        Parameters
+        ----------
+        fleet : object
+            Fleet whose step ends, providing 'time' and 'vehicles_state'.
+        """
+        self.__step += 1
+        if self.__step % self.decimation:
+            return
+        records_number = len(self.steps)
+        if self.records_count >= records_number and not self.ring:
+            raise ValueError(
+                "The {} preallocated records are used, enable the ring mode or preallocate more.".format(
+                    records_number
+                )
+            )
+        row = self.records_count % records_number
+        state = fleet.vehicles_state()
+        for name in TRAJECTORY_STATE:
+            getattr(self, name)[row] = state[name]
+        self.flags[row] = self.__pending_flags
+        self.__pending_flags[:] = 0
+        self.time[row] = fleet.time[-1]
+        self.steps[row] = self.__step
+        self.records_count += 1
+
+    def trajectories(self) -> Dict[str, np.ndarray]:
+        """Returns the kept records, from the oldest to the latest.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Records indexed by name ("steps", "time", "flags" and 'TRAJECTORY_STATE'), vehicles along the second axis.
+        """
+        records_number = len(self.steps)
+        names = ["steps", "time", "flags"] + TRAJECTORY_STATE
+        if self.records_count <= records_number:
+            return {name: getattr(self, name)[: self.records_count] for name in names}
+        start = self.records_count % records_number
+        return {
+            name: np.concatenate(
+                (getattr(self, name)[start:], getattr(self, name)[:start])
+            )
+            for name in names
+        }
+
+    def __repr__(self) -> str:
+        return "TrajectoryRecorder({} vehicles, {} records, decimation {}{})".format(
+            self.soc.shape[1],
+            len(self.steps),
+            self.decimation,
+            ", ring" if self.ring else "",
+        )
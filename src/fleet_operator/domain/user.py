@@ -1,6 +1,22 @@
 from abc import ABC, abstractmethod
-from .core import FleetControler
-from .data_models import InputsData, OutputsData
+from itertools import chain
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Type, Union
+from pydantic import ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import ListMinLengthError
+from .core import FleetControler, iter_simulate, simulate
+from .data_models import (
+    ColumnarInputsData,
+    ColumnarOutputsData,
+    ColumnarScenarioData,
+    InputsData,
+    ScenarioData,
+    StreamInputsData,
+    StreamScenarioData,
+    TaskData,
+)
+from .observers import IRunObserver
+from .sinks import IResultsSink
 
 
 class IRequestInputsData(ABC):
@@ -10,13 +26,22 @@ class IRequestInputsData(ABC):
     ----------
     fleet_controler : FleetControler
         Controler of the business logic.
+
+    Attributes
+    ----------
+    data_model : Type[Union[InputsData, ColumnarInputsData, ScenarioData, ColumnarScenarioData]]
+        Model validating the inputs returned by 'get_inputs_data'. Adapters validating them with a criterion-less model, 'ScenarioData' or 'ColumnarScenarioData', can only be run with 'run_criterions'.
     """
 
+    data_model: Type[
+        Union[InputsData, ColumnarInputsData, ScenarioData, ColumnarScenarioData]
+    ] = InputsData
+
     def __init__(
         self, fleet_controler: FleetControler, *args: list, **kwargs: dict
     ) -> None:
         super().__init__()
-        self.data = InputsData(**self.get_inputs_data(*args, **kwargs))
+        self.data = self.data_model(**self.get_inputs_data(*args, **kwargs))
         self.fleet_controler = fleet_controler
 
     @abstractmethod
@@ -36,23 +61,289 @@ class IRequestInputsData(ABC):
             Dictionary containing the inputs.
         """
 
-    def run(self) -> OutputsData:
+    def run(self, observer: Optional[IRunObserver] = None) -> ColumnarOutputsData:
         """Run the scenario on the given fleet.
 
+        Parameters
+        ----------
+        observer : Optional[IRunObserver]
+            Observer notified after each step (a 'ProgressObserver' for instance), the run is not instrumented if None.
+
         Returns
         -------
-        OutputsData
+        ColumnarOutputsData
             Outputs of the computing.
         """
-        self.fleet_controler.fleet.reset()
-        for index, (time_lapse, fleet_load) in enumerate(self.data.scenario):
-            print(
-                f"Progession: {round((index + 1) / len(self.data.scenario) * 100, 1)}%"
-            )
-            self.fleet_controler.fleet.use(
-                time_lapse, fleet_load, self.data.use_priority_criterion
+        return simulate(
+            self.fleet_controler.fleet,
+            self.data.scenario,
+            self.data.use_priority_criterion,
+            observer=observer,
+        )
+
+    def iter_run(
+        self, chunk_size: int = 1000, observer: Optional[IRunObserver] = None
+    ) -> Iterator[ColumnarOutputsData]:
+        """Run the scenario on the given fleet, yielding outputs as they are produced.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Number of time steps of each chunk.
+        observer : Optional[IRunObserver]
+            Observer notified after each step, the run is not instrumented if None.
+
+        Yields
+        ------
+        ColumnarOutputsData
+            Outputs of the computing, chunk by chunk.
+        """
+        return iter_simulate(
+            self.fleet_controler.fleet,
+            self.data.scenario,
+            self.data.use_priority_criterion,
+            chunk_size,
+            observer=observer,
+        )
+
+    def run_into(
+        self,
+        sink: IResultsSink,
+        chunk_size: int = 1000,
+        observer: Optional[IRunObserver] = None,
+    ) -> None:
+        """Run the scenario on the given fleet, writing outputs to a sink as they are produced.
+
+        Parameters
+        ----------
+        sink : IResultsSink
+            Sink the outputs are written to, chunk by chunk.
+        chunk_size : int
+            Number of time steps of each chunk.
+        observer : Optional[IRunObserver]
+            Observer notified after each step, the run is not instrumented if None.
+        """
+        sink.write_all(self.iter_run(chunk_size, observer))
+
+    def run_criterions(
+        self,
+        use_priority_criterions: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, ColumnarOutputsData]:
+        """Run the scenario on copies of the given fleet with several criterions in parallel.
+
+        Parameters
+        ----------
+        use_priority_criterions : Sequence[str]
+            Criterions to use to sort vehicles.
+        max_workers : Optional[int]
+            Maximum number of worker processes, the number of processors if None.
+
+        Returns
+        -------
+        Dict[str, ColumnarOutputsData]
+            Outputs of the computing for each criterion.
+        """
+        outputs = self.fleet_controler.run_grid(
+            [self.data.scenario], use_priority_criterions, max_workers
+        )
+        return {
+            use_priority_criterion: output
+            for (_, use_priority_criterion), output in outputs.items()
+        }
+
+
+class IAsyncRequestInputsData(IRequestInputsData):
+    """Asynchronous inputs interface to inherit from (user-side).
+
+    As '__init__' can not await, instances are built with 'await cls.create(fleet_controler, *args, **kwargs)', which awaits 'get_inputs_data' and validates its result.
+    """
+
+    def __init__(self, fleet_controler: FleetControler) -> None:
+        self.fleet_controler = fleet_controler
+
+    @classmethod
+    async def create(
+        cls, fleet_controler: FleetControler, *args: list, **kwargs: dict
+    ) -> "IAsyncRequestInputsData":
+        """Returns an adapter whose inputs are obtained from the parameters.
+
+        Parameters
+        ----------
+        fleet_controler : FleetControler
+            Controler of the business logic.
+        args : list
+            List of unnamed parameters passed to 'get_inputs_data'.
+        kwargs : dict
+            Dictionary of named parameters passed to 'get_inputs_data'.
+
+        Returns
+        -------
+        IAsyncRequestInputsData
+            The adapter, with validated inputs.
+        """
+        adapter = cls(fleet_controler)
+        adapter.data = cls.data_model(**await adapter.get_inputs_data(*args, **kwargs))
+        return adapter
+
+    @abstractmethod
+    async def get_inputs_data(self, *args: list, **kwargs: dict) -> dict:
+        """Returns a dictionary of the inputs.
+
+        Parameters
+        ----------
+        args : list
+            List of unnamed parameters.
+        kwargs : dict
+            Dictionary of named parameters.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the inputs.
+        """
+
+
+class IStreamInputsData(ABC):
+    """Streamed inputs interface to inherit from (user-side).
+
+    The scenario is read and validated task by task as it is run, instead of being loaded at once.
+
+    Parameters
+    ----------
+    fleet_controler : FleetControler
+        Controler of the business logic.
+
+    Attributes
+    ----------
+    data_model : Type[Union[StreamInputsData, StreamScenarioData]]
+        Model validating the inputs returned by 'get_inputs_data', but the scenario. Adapters validating them with 'StreamScenarioData', without criterion, only stream their scenario with 'iter_scenario'.
+    """
+
+    data_model: Type[Union[StreamInputsData, StreamScenarioData]] = StreamInputsData
+
+    def __init__(
+        self, fleet_controler: FleetControler, *args: list, **kwargs: dict
+    ) -> None:
+        super().__init__()
+        self.__args = args
+        self.__kwargs = kwargs
+        inputs = self.get_inputs_data(*args, **kwargs)
+        del inputs["scenario"]
+        self.data = self.data_model(**inputs)
+        self.fleet_controler = fleet_controler
+
+    @abstractmethod
+    def get_inputs_data(self, *args: list, **kwargs: dict) -> dict:
+        """Returns a dictionary of the inputs.
+
+        The scenario must be a lazy iterable of tasks, read only when iterated over.
+
+        Parameters
+        ----------
+        args : list
+            List of unnamed parameters.
+        kwargs : dict
+            Dictionary of named parameters.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the inputs.
+        """
+
+    def iter_scenario(self) -> Iterator[Tuple[float, float]]:
+        """Iterates over the validated tasks of the scenario.
+
+        The first task is read and validated at once, so that an empty scenario or an invalid first task raises before the fleet is reset, the others as they are iterated over. Invalid scenarios raise the same 'ValidationError' as 'InputsData.scenario', located at the invalid task.
+
+        Returns
+        -------
+        Iterator[Tuple[float, float]]
+            Timelapse of task (s), task's needed fleet's load.
+        """
+        tasks = iter(self.get_inputs_data(*self.__args, **self.__kwargs)["scenario"])
+        for first_task in tasks:
+            break
+        else:
+            raise ValidationError(
+                [ErrorWrapper(ListMinLengthError(limit_value=1), loc="scenario")],
+                self.data_model,
             )
-        return OutputsData(
-            time=self.fleet_controler.fleet.time,
-            grades=self.fleet_controler.fleet.grades,
-        )
\ No newline at end of file
+        return chain(
+            [self.__validate_task(0, first_task)],
+            (
+                self.__validate_task(index, task)
+                for index, task in enumerate(tasks, start=1)
+            ),
+        )
+
+    def __validate_task(self, index: int, task: Sequence[float]) -> Tuple[float, float]:
+        """Validates a task of the scenario as 'InputsData' would."""
+        try:
+            timelapse, load = task
+            task_data = TaskData(timelapse=timelapse, load=load)
+        except (TypeError, ValueError) as error:  # Including 'ValidationError'
+            raise ValidationError(
+                [ErrorWrapper(error, loc=("scenario", index))], self.data_model
+            ) from None
+        return task_data.timelapse, task_data.load
+
+    def iter_run(
+        self, chunk_size: int = 1000, observer: Optional[IRunObserver] = None
+    ) -> Iterator[ColumnarOutputsData]:
+        """Run the scenario on the given fleet, yielding outputs as they are produced.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Number of time steps of each chunk.
+        observer : Optional[IRunObserver]
+            Observer notified after each step, the run is not instrumented if None.
+
+        Yields
+        ------
+        ColumnarOutputsData
+            Outputs of the computing, chunk by chunk.
+        """
+        return iter_simulate(
+            self.fleet_controler.fleet,
+            self.iter_scenario(),
+            self.data.use_priority_criterion,
+            chunk_size,
+            observer=observer,
+        )
+
+    def run(self, observer: Optional[IRunObserver] = None) -> ColumnarOutputsData:
+        """Run the scenario on the given fleet.
+
+        Parameters
+        ----------
+        observer : Optional[IRunObserver]
+            Observer notified after each step, the run is not instrumented if None.
+
+        Returns
+        -------
+        ColumnarOutputsData
+            Outputs of the computing.
+        """
+        return ColumnarOutputsData.concatenate(self.iter_run(observer=observer))
+
+    def run_into(
+        self,
+        sink: IResultsSink,
+        chunk_size: int = 1000,
+        observer: Optional[IRunObserver] = None,
+    ) -> None:
+        """Run the scenario on the given fleet, writing outputs to a sink as they are produced.
+
+        Parameters
+        ----------
+        sink : IResultsSink
+            Sink the outputs are written to, chunk by chunk.
+        chunk_size : int
+            Number of time steps of each chunk.
+        observer : Optional[IRunObserver]
+            Observer notified after each step, the run is not instrumented if None.
+        """
+        sink.write_all(self.iter_run(chunk_size, observer))
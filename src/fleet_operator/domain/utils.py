@@ -4,6 +4,7 @@ class Constants:
     SECONDS_PER_HOUR: int = SECONDS_PER_MINUTE * MINUTES_PER_HOUR
     HOURS_PER_DAY: int = 24
     DAYS_PER_YEAR: float = 365.25
+    MINIMUM_AVAILABLE_CAPACITY_RATIO: float = 0.3
 
 
 class BatteryLifetimeError(ValueError):
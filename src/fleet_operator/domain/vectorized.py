@@ -0,0 +1,673 @@
+from typing import Callable, Dict, List, Literal, Optional, Sequence, Union
+import numpy as np
+from .core import (
+    VEHICLE_STATE,
+    Battery,
+    Cell,
+    ChargingStation,
+    FleetControler,
+    Status,
+    Vehicle,
+)
+from .criterions import FleetState, get_criterion, smallest_indexes
+from .data_models import ColumnarResourcesData, ResourcesData
+from .observers import FleetCounters, PhaseProfiler
+from .trajectories import TrajectoryRecorder, VehicleFlags
+from .utils import Constants
+
+
+class VectorizedFleet:
+    """Vectorized fleet object.
+
+    Struct-of-arrays counterpart of 'Fleet': the state of every vehicle's battery and cell is kept in contiguous arrays and all the vehicles used (or charged) during a task are moved forward together, one array operation per time increment.
+    It reproduces 'Fleet' outputs, including its batteries renewals and upgrades.
+
+    Parameters
+    ----------
+    cells_nominal_capacity : Sequence[float]
+        Nominal capacity of each vehicle's battery's cells (C).
+    series_cells_numbers : Sequence[int]
+        Number of series cells per branch of each vehicle's battery.
+    parallel_branches_numbers : Sequence[int]
+        Number of parallel branches of each vehicle's battery.
+    vehicles_power : Sequence[float]
+        Electrical power consumption of each vehicle (W).
+    charging_stations_power : Sequence[float]
+        Electrical power delivered by each charging station (W).
+    ocv : Callable
+        Function of the state of charge returning open circuit voltage (V), shared by all the cells.
+    resistance : float
+        Internal resistance of the cells at birth (Ohms).
+    alpha : float
+        Cells' capacity ageing coefficient (1/(W.s)).
+    beta : float
+        Cells' internal resistance ageing coefficient (1/(W.s)).
+    charging_allocation : Literal["SORTED", "NEEDIEST"]
+        Allocation of the charging stations at each step (see 'Fleet').
+    """
+
+    def __init__(
+        self,
+        cells_nominal_capacity: Sequence[float] = (),
+        series_cells_numbers: Sequence[int] = (),
+        parallel_branches_numbers: Sequence[int] = (),
+        vehicles_power: Sequence[float] = (),
+        charging_stations_power: Sequence[float] = (),
+        ocv: Callable = Cell.DEFAULT_OCV,
+        resistance: float = Cell.DEFAULT_RESISTANCE,
+        alpha: float = 0,
+        beta: float = 0,
+        charging_allocation: Literal["SORTED", "NEEDIEST"] = "SORTED",
+    ) -> None:
+        if charging_allocation not in ("SORTED", "NEEDIEST"):
+            raise ValueError(
+                "Unknown charging allocation {}.".format(repr(charging_allocation))
+            )
+        self.charging_allocation = charging_allocation
+        self.ocv = ocv
+        self.power = np.empty(0)
+        self.series_cells_numbers = np.empty(0, dtype=np.int64)
+        self.parallel_branches_numbers = np.empty(0, dtype=np.int64)
+        self.cells_nominal_capacity = np.empty(0)
+        self.initial_resistance = np.empty(0)
+        self.alpha = np.empty(0)
+        self.beta = np.empty(0)
+        self.soc = np.empty(0)
+        self.resistance = np.empty(0)
+        self.tension = np.empty(0)
+        self.available_capacity = np.empty(0)
+        self.current_capacity = np.empty(0)
+        self.batteries_nominal_capacity = np.empty(0)
+        self.batteries_available_capacity = np.empty(0)
+        self.batteries_current_capacity = np.empty(0)
+        self.charging_stations_power = np.empty(0)
+        self.charging_stations_by_power = np.empty(0, dtype=np.intp)
+        self.counters = FleetCounters()
+        self.profiler: Optional[PhaseProfiler] = None
+        self.recorder: Optional[TrajectoryRecorder] = None
+        cells_tension = self.ocv(1)
+        self.__append_vehicles(
+            vehicles_power,
+            series_cells_numbers,
+            parallel_branches_numbers,
+            np.asarray(cells_nominal_capacity, dtype=float)
+            * cells_tension
+            / Constants.SECONDS_PER_HOUR,
+            np.full(len(vehicles_power), resistance, dtype=float),
+            np.full(len(vehicles_power), alpha, dtype=float),
+            np.full(len(vehicles_power), beta, dtype=float),
+        )
+        self.__append_charging_stations(charging_stations_power)
+        self.time = [0]
+        self.grades = [0]
+
+    @classmethod
+    def from_resources_data(
+        cls,
+        resources_data: Union[ResourcesData, ColumnarResourcesData],
+        **kwargs: dict,
+    ) -> "VectorizedFleet":
+        """Builds a vectorized fleet according to resources data.
+
+        Parameters
+        ----------
+        resources_data : ResourcesData
+            Resources to build the fleet from.
+        kwargs : dict
+            Dictionary of named parameters passed to the fleet's constructor.
+
+        Returns
+        -------
+        VectorizedFleet
+            The fleet built according to resources data.
+        """
+        if isinstance(resources_data, ColumnarResourcesData):
+            return cls(
+                resources_data.cells_nominal_capacity,
+                resources_data.series_cells_numbers,
+                resources_data.parallel_branches_numbers,
+                resources_data.vehicles_power,
+                resources_data.charging_stations_power,
+                FleetControler.build_ocv(resources_data),
+                **kwargs,
+            )
+        (
+            cells_nominal_capacity,
+            series_cells_numbers,
+            parallel_branches_numbers,
+            vehicles_power,
+        ) = zip(*resources_data.vehicles)
+        return cls(
+            cells_nominal_capacity,
+            series_cells_numbers,
+            parallel_branches_numbers,
+            vehicles_power,
+            resources_data.charging_stations,
+            FleetControler.build_ocv(resources_data),
+            **kwargs,
+        )
+
+    def __len__(self) -> int:
+        return len(self.power)
+
+    def __append_vehicles(
+        self,
+        vehicles_power: Sequence[float],
+        series_cells_numbers: Sequence[int],
+        parallel_branches_numbers: Sequence[int],
+        cells_nominal_capacity: Sequence[float],
+        resistance: Sequence[float],
+        alpha: Sequence[float],
+        beta: Sequence[float],
+    ) -> None:
+        """Appends vehicles with new batteries to the state arrays.
+
+        Parameters
+        ----------
+        vehicles_power : Sequence[float]
+            Electrical power consumption of the vehicles (W).
+        series_cells_numbers : Sequence[int]
+            Number of series cells per branch of the vehicles' batteries.
+        parallel_branches_numbers : Sequence[int]
+            Number of parallel branches of the vehicles' batteries.
+        cells_nominal_capacity : Sequence[float]
+            Nominal capacity of the vehicles' batteries' cells (Wh).
+        resistance : Sequence[float]
+            Internal resistance of the cells at birth (Ohms).
+        alpha : Sequence[float]
+            Cells' capacity ageing coefficient (1/(W.s)).
+        beta : Sequence[float]
+            Cells' internal resistance ageing coefficient (1/(W.s)).
+        """
+        start = len(self)
+        size = len(vehicles_power)
+        self.power = np.append(self.power, np.asarray(vehicles_power, dtype=float))
+        self.series_cells_numbers = np.append(
+            self.series_cells_numbers, np.asarray(series_cells_numbers, dtype=np.int64)
+        )
+        self.parallel_branches_numbers = np.append(
+            self.parallel_branches_numbers,
+            np.asarray(parallel_branches_numbers, dtype=np.int64),
+        )
+        self.cells_nominal_capacity = np.append(
+            self.cells_nominal_capacity, np.asarray(cells_nominal_capacity, dtype=float)
+        )
+        self.initial_resistance = np.append(
+            self.initial_resistance, np.asarray(resistance, dtype=float)
+        )
+        self.alpha = np.append(self.alpha, np.asarray(alpha, dtype=float))
+        self.beta = np.append(self.beta, np.asarray(beta, dtype=float))
+        for name in (
+            "soc",
+            "resistance",
+            "tension",
+            "available_capacity",
+            "current_capacity",
+            "batteries_nominal_capacity",
+            "batteries_available_capacity",
+            "batteries_current_capacity",
+        ):
+            setattr(self, name, np.append(getattr(self, name), np.empty(size)))
+        self.__renew_batteries(np.arange(start, start + size))
+
+    def __append_charging_stations(self, charging_stations_power: Sequence[float]) -> None:
+        """Appends charging stations to the state arrays.
+
+        Parameters
+        ----------
+        charging_stations_power : Sequence[float]
+            Electrical power delivered by the charging stations (W).
+        """
+        self.charging_stations_power = np.append(
+            self.charging_stations_power,
+            np.asarray(charging_stations_power, dtype=float),
+        )
+        self.charging_stations_by_power = np.argsort(
+            -self.charging_stations_power, kind="stable"
+        )
+
+    def __renew_batteries(self, indexes: np.ndarray) -> None:
+        """Renews the batteries of some vehicles.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the vehicles whose battery is renewed.
+        """
+        self.soc[indexes] = 1
+        self.tension[indexes] = self.ocv(1)
+        self.resistance[indexes] = self.initial_resistance[indexes]
+        self.available_capacity[indexes] = self.cells_nominal_capacity[indexes]
+        self.current_capacity[indexes] = self.cells_nominal_capacity[indexes]
+        self.batteries_nominal_capacity[indexes] = (
+            self.cells_nominal_capacity[indexes] * self.parallel_branches_numbers[indexes]
+        )
+        self.batteries_available_capacity[indexes] = (
+            self.available_capacity[indexes] * self.parallel_branches_numbers[indexes]
+        )
+        self.batteries_current_capacity[indexes] = (
+            self.current_capacity[indexes] * self.parallel_branches_numbers[indexes]
+        )
+
+    def __upgrade_batteries(
+        self,
+        indexes: np.ndarray,
+        series_multiplier: int = 1,
+        parallel_multiplier: int = 2,
+    ) -> None:
+        """Upgrades the batteries of some vehicles according to multipliers.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the vehicles whose battery is upgraded.
+        series_multiplier : int
+            Multiplier of the number of series cells in each branches.
+        parallel_multiplier : int
+            Multiplier of the number of branches.
+        """
+        self.series_cells_numbers[indexes] *= series_multiplier
+        self.parallel_branches_numbers[indexes] *= parallel_multiplier
+        self.__renew_batteries(indexes)
+
+    def __update_batteries(self, indexes: np.ndarray) -> np.ndarray:
+        """Updates the batteries of some vehicles from their cells.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the vehicles whose battery has been used.
+
+        Returns
+        -------
+        np.ndarray
+            Mask of the updated batteries that reached their end of life.
+        """
+        self.batteries_available_capacity[indexes] = (
+            self.available_capacity[indexes] * self.parallel_branches_numbers[indexes]
+        )
+        self.batteries_current_capacity[indexes] = (
+            self.current_capacity[indexes] * self.parallel_branches_numbers[indexes]
+        )
+        return (
+            self.batteries_available_capacity[indexes]
+            / self.batteries_nominal_capacity[indexes]
+            <= Battery.MINIMUM_AVAILABLE_CAPACITY_RATIO
+        )
+
+    def _advance(
+        self, indexes: np.ndarray, powers: np.ndarray, steps_number: int
+    ) -> np.ndarray:
+        """Advances the cells of some vehicles for a number of time increments.
+
+        Each cell stops at the first time increment that would raise an error in 'Cell.use', keeping the state it had before it.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the vehicles whose cells are used.
+        powers : np.ndarray
+            Power of use of each cell (W).
+        steps_number : int
+            Number of time increments.
+
+        Returns
+        -------
+        np.ndarray
+            Status of each cell's advance.
+        """
+        statuses = np.full(len(indexes), Status.DONE, dtype=np.int8)
+        positions = np.arange(len(indexes))
+        soc = self.soc[indexes]
+        resistance = self.resistance[indexes]
+        tension = self.tension[indexes]
+        available_capacity = self.available_capacity[indexes]
+        current_capacity = self.current_capacity[indexes]
+        capacity_ageing = 1 - self.alpha[indexes] * Cell.TIME_INCREMENT * np.abs(powers)
+        resistance_ageing = 1 + self.beta[indexes] * Cell.TIME_INCREMENT * np.abs(powers)
+        for _ in range(steps_number):
+            if not positions.size:
+                break
+            ocv = self.ocv(soc)
+            delta = ocv ** 2 + 4 * resistance * powers
+            too_powerfull = delta < 0
+            new_tension = (ocv + np.sqrt(np.where(too_powerfull, 0, delta))) / 2
+            capacity_delta = (
+                powers
+                / new_tension
+                * Cell.TIME_INCREMENT
+                * new_tension
+                / Constants.SECONDS_PER_HOUR
+            )
+            new_available_capacity = available_capacity * capacity_ageing
+            new_resistance = resistance * resistance_ageing
+            new_current_capacity = current_capacity + capacity_delta
+            empty = ~too_powerfull & (new_current_capacity < 0)
+            full = ~too_powerfull & ~empty & (new_current_capacity > new_available_capacity)
+            failed = too_powerfull | empty | full
+            if failed.any():
+                statuses[positions[too_powerfull]] = Status.TOO_POWERFULL
+                statuses[positions[empty]] = Status.EMPTY
+                statuses[positions[full]] = Status.FULL
+                failed_indexes = indexes[positions[failed]]
+                self.soc[failed_indexes] = soc[failed]
+                self.resistance[failed_indexes] = resistance[failed]
+                self.tension[failed_indexes] = tension[failed]
+                self.available_capacity[failed_indexes] = available_capacity[failed]
+                self.current_capacity[failed_indexes] = current_capacity[failed]
+                succeeded = ~failed
+                positions = positions[succeeded]
+                powers = powers[succeeded]
+                capacity_ageing = capacity_ageing[succeeded]
+                resistance_ageing = resistance_ageing[succeeded]
+                new_tension = new_tension[succeeded]
+                new_resistance = new_resistance[succeeded]
+                new_available_capacity = new_available_capacity[succeeded]
+                new_current_capacity = new_current_capacity[succeeded]
+            available_capacity = new_available_capacity
+            resistance = new_resistance
+            tension = new_tension
+            current_capacity = new_current_capacity
+            soc = current_capacity / available_capacity
+        remaining_indexes = indexes[positions]
+        self.soc[remaining_indexes] = soc
+        self.resistance[remaining_indexes] = resistance
+        self.tension[remaining_indexes] = tension
+        self.available_capacity[remaining_indexes] = available_capacity
+        self.current_capacity[remaining_indexes] = current_capacity
+        return statuses
+
+    def __use_vehicles(self, indexes: np.ndarray, timelapse: float) -> np.ndarray:
+        """Uses some vehicles for a given time lapse.
+
+        Batteries reaching their end of life are renewed and too weak ones are upgraded, then the concerned vehicles are used again, as in 'Vehicle.use'.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the vehicles to use.
+        timelapse : float
+            Time lapse of vehicles' using (s).
+
+        Returns
+        -------
+        np.ndarray
+            Status of each vehicle's use.
+        """
+        steps_number = Cell.steps_number(timelapse)
+        statuses = np.empty(len(indexes), dtype=np.int8)
+        pending = np.arange(len(indexes))
+        while pending.size:
+            vehicles = indexes[pending]
+            results = self._advance(
+                vehicles,
+                -self.power[vehicles]
+                / (
+                    self.series_cells_numbers[vehicles]
+                    * self.parallel_branches_numbers[vehicles]
+                ),
+                steps_number,
+            )
+            statuses[pending] = results
+            too_powerfull = results == Status.TOO_POWERFULL
+            self.__upgrade_batteries(vehicles[too_powerfull])
+            done = results == Status.DONE
+            ended = np.zeros(len(vehicles), dtype=bool)
+            ended[done] = self.__update_batteries(vehicles[done])
+            self.__renew_batteries(vehicles[ended])
+            self.counters.upgrades_number += int(np.count_nonzero(too_powerfull))
+            self.counters.renewals_number += int(np.count_nonzero(ended))
+            if self.recorder is not None:
+                self.recorder.mark(
+                    vehicles[too_powerfull | ended], VehicleFlags.RENEWED
+                )
+            pending = pending[too_powerfull | ended]
+        return statuses
+
+    def __charge_vehicles(
+        self, indexes: np.ndarray, timelapse: float, powers: np.ndarray
+    ) -> np.ndarray:
+        """Charges some vehicles for a given time lapse.
+
+        Batteries reaching their end of life are renewed, as in 'Vehicle.charge'.
+
+        Parameters
+        ----------
+        indexes : np.ndarray
+            Indexes of the vehicles to charge.
+        timelapse : float
+            Time lapse of vehicles' charging (s).
+        powers : np.ndarray
+            Power of charging of each vehicle (W).
+
+        Returns
+        -------
+        np.ndarray
+            Status of each vehicle's charge.
+        """
+        statuses = self._advance(
+            indexes,
+            powers
+            / (
+                self.series_cells_numbers[indexes]
+                * self.parallel_branches_numbers[indexes]
+            ),
+            Cell.steps_number(timelapse),
+        )
+        done = statuses == Status.DONE
+        ended = self.__update_batteries(indexes[done])
+        self.__renew_batteries(indexes[done][ended])
+        self.counters.renewals_number += int(np.count_nonzero(ended))
+        if self.recorder is not None:
+            self.recorder.mark(indexes[done][ended], VehicleFlags.RENEWED)
+        self.counters.full_stops_number += int(
+            np.count_nonzero(statuses == Status.FULL)
+        )
+        return statuses
+
+    def __neediest_vehicles(self, busy_vehicles: np.ndarray) -> np.ndarray:
+        """Returns the vehicles not busy with the most missing capacity, one per charging station at most.
+
+        Missing capacities are computed from the cells, as the batteries' ones are not updated by a failed use, and full vehicles are skipped. The selection is a partition over the candidates, ties being broken by index.
+
+        Parameters
+        ----------
+        busy_vehicles : np.ndarray
+            Indexes of the vehicles used successfully during the step.
+
+        Returns
+        -------
+        np.ndarray
+            Indexes of the vehicles by decreasing missing capacity.
+        """
+        needs = (
+            (self.available_capacity - self.current_capacity)
+            * self.series_cells_numbers
+            * self.parallel_branches_numbers
+        )
+        needs[busy_vehicles] = 0
+        candidates = np.flatnonzero(needs > 0)
+        return candidates[
+            smallest_indexes(-needs[candidates], len(self.charging_stations_power))
+        ]
+
+    def use(
+        self,
+        timelapse: float,
+        load: float,
+        use_priority_criterion: str,
+    ) -> None:
+        """Method to use the fleet.
+
+        Uses the fleet for a given time lapse at a given load (between 0 and 1 to tell how much the fleet is used).
+        The part of the fleet which isn't used is charged in the charging stations' availability limit.
+
+        Parameters
+        ----------
+        timelapse : float
+            Time lapse of fleet use (s).
+        load : float
+            Load of use of the fleet.
+        use_priority_criterion : str
+            Name of a registered criterion (see 'register_criterion'). Lower the criterion value is, higher the priority will be to use the vehicle.
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start()
+        number_of_vehicles_to_use = round(load * len(self))
+        prioritized_vehicles = smallest_indexes(
+            get_criterion(use_priority_criterion)(self.priority_state()),
+            number_of_vehicles_to_use
+            + (
+                len(self.charging_stations_power)
+                if self.charging_allocation == "SORTED"
+                else 0
+            ),
+        )
+        vehicles_to_use = prioritized_vehicles[:number_of_vehicles_to_use]
+        if profiler is not None:
+            profiler.lap("select")
+        statuses = self.__use_vehicles(vehicles_to_use, timelapse)
+        failed_vehicles = vehicles_to_use[statuses == Status.EMPTY]
+        if profiler is not None:
+            profiler.lap("use")
+
+        grade = 0
+        if len(vehicles_to_use) > 0:
+            grade = (len(vehicles_to_use) - len(failed_vehicles)) / len(vehicles_to_use)
+
+        if self.charging_allocation == "NEEDIEST":
+            vehicles_to_charge = self.__neediest_vehicles(
+                vehicles_to_use[statuses != Status.EMPTY]
+            )
+            charging_stations = self.charging_stations_by_power[
+                : len(vehicles_to_charge)
+            ]
+        else:
+            vehicles_to_charge = np.concatenate(
+                (prioritized_vehicles[number_of_vehicles_to_use:], failed_vehicles)
+            )[: len(self.charging_stations_power)]
+            charging_stations = slice(len(vehicles_to_charge))
+        if profiler is not None:
+            profiler.lap("allocate")
+        self.__charge_vehicles(
+            vehicles_to_charge,
+            timelapse,
+            self.charging_stations_power[charging_stations],
+        )
+        if profiler is not None:
+            profiler.lap("charge")
+        self.counters.empty_failures_number += len(failed_vehicles)
+        self.counters.occupied_charging_stations_number = len(vehicles_to_charge)
+
+        self.time.append(timelapse + self.time[-1])
+        self.grades.append(grade + self.grades[-1])
+        if self.recorder is not None:
+            self.recorder.mark(
+                vehicles_to_use[statuses != Status.EMPTY], VehicleFlags.USED
+            )
+            self.recorder.mark(failed_vehicles, VehicleFlags.FAILED)
+            self.recorder.mark(vehicles_to_charge, VehicleFlags.CHARGED)
+            self.recorder.record(self)
+        if profiler is not None:
+            profiler.lap("bookkeeping")
+            profiler.stop()
+
+    def extend_fleet(self, *args: List[Vehicle]) -> None:
+        """Extends the fleet with new vehicles.
+
+        The vehicles' batteries are considered as new ones.
+        """
+        vehicles = [arg for arg in args if isinstance(arg, Vehicle)]
+        for vehicle in vehicles:
+            if vehicle.battery.cell.ocv != self.ocv:
+                raise ValueError(
+                    "Vehicles' cells must share the fleet's open circuit voltage function."
+                )
+        self.__append_vehicles(
+            [vehicle.power for vehicle in vehicles],
+            [vehicle.battery.series_cells_number for vehicle in vehicles],
+            [vehicle.battery.parallel_branches_number for vehicle in vehicles],
+            [vehicle.battery.cell.nominal_capacity for vehicle in vehicles],
+            [vehicle.battery.cell.spec.resistance for vehicle in vehicles],
+            [vehicle.battery.cell.alpha for vehicle in vehicles],
+            [vehicle.battery.cell.beta for vehicle in vehicles],
+        )
+
+    def add_charging_stations(self, *args: List[ChargingStation]) -> None:
+        """Adds new charging stations to the fleet."""
+        self.__append_charging_stations(
+            [arg.power for arg in args if isinstance(arg, ChargingStation)]
+        )
+
+    def reset(self) -> None:
+        """Resets the fleet vehicles and metrics."""
+        self.time = [0]
+        self.grades = [0]
+        self.__renew_batteries(np.arange(len(self)))
+        self.counters.reset()
+        if self.recorder is not None:
+            self.recorder.reset()
+
+    def priority_state(self) -> FleetState:
+        """Returns views on the state of the fleet's vehicles scored by priority criterions."""
+        return FleetState(
+            self.batteries_current_capacity,
+            self.batteries_nominal_capacity,
+            self.batteries_available_capacity,
+            self.soc,
+            self.power,
+        )
+
+    def vehicles_state(self) -> Dict[str, np.ndarray]:
+        """Returns the state of the fleet's vehicles.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Vehicles' state columns named after 'VEHICLE_STATE'.
+        """
+        return {name: getattr(self, name).copy() for name in VEHICLE_STATE}
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """Returns the state of the fleet.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Vehicles' state columns named after 'VEHICLE_STATE' and the fleet's time and grades.
+        """
+        snapshot = self.vehicles_state()
+        snapshot["time"] = np.array(self.time, dtype=float)
+        snapshot["grades"] = np.array(self.grades, dtype=float)
+        return snapshot
+
+    def restore(self, snapshot: Dict[str, np.ndarray]) -> None:
+        """Restores the state of the fleet.
+
+        Parameters
+        ----------
+        snapshot : Dict[str, np.ndarray]
+            State of a fleet with the same vehicles, as returned by 'snapshot'.
+        """
+        if len(snapshot["soc"]) != len(self):
+            raise ValueError(
+                "The snapshot has {} vehicles while the fleet has {}.".format(
+                    len(snapshot["soc"]), len(self)
+                )
+            )
+        for name in VEHICLE_STATE:
+            getattr(self, name)[:] = snapshot[name]
+        self.batteries_nominal_capacity = (
+            self.cells_nominal_capacity * self.parallel_branches_numbers
+        )
+        self.time = np.asarray(snapshot["time"]).tolist()
+        self.grades = np.asarray(snapshot["grades"]).tolist()
+        self.counters.reset()
+        if self.recorder is not None:
+            self.recorder.reset()
+
+    def __repr__(self) -> str:
+        return "VectorizedFleet({} vehicles, {} charging stations)".format(
+            len(self), len(self.charging_stations_power)
+        )
@@ -0,0 +1,310 @@
+import argparse
+import os
+from json import dumps
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+import numpy as np
+from .domain.sweep import FleetDistribution, LoadCycle, ScenarioDistribution
+
+VEHICLES_COLUMNS = {
+    "cells_nominal_capacity": np.float64,
+    "series_cells_numbers": np.int64,
+    "parallel_branches_numbers": np.int64,
+    "vehicles_power": np.float64,
+}
+
+
+def _chunks_sizes(number: int, chunk_size: int) -> Iterator[int]:
+    """Yields the sizes of the chunks splitting a number of items."""
+    for start in range(0, number, chunk_size):
+        yield min(chunk_size, number - start)
+
+
+def iter_vehicles(
+    fleet_distribution: FleetDistribution,
+    seed_sequence: np.random.SeedSequence,
+    chunk_size: int = 100_000,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """Draws a fleet's vehicles chunk by chunk.
+
+    Each column is drawn from its own generator, spawned from the seed, so that vehicles do not depend on the chunks' size.
+
+    Parameters
+    ----------
+    fleet_distribution : FleetDistribution
+        Distribution to draw the vehicles from.
+    seed_sequence : np.random.SeedSequence
+        Seed of the vehicles.
+    chunk_size : int
+        Maximum number of vehicles per chunk.
+
+    Yields
+    ------
+    Dict[str, np.ndarray]
+        Vehicles' columns named and typed after 'VEHICLES_COLUMNS'.
+    """
+    rngs = [
+        np.random.default_rng(child)
+        for child in seed_sequence.spawn(len(VEHICLES_COLUMNS))
+    ]
+    for size in _chunks_sizes(fleet_distribution.number_of_vehicles, chunk_size):
+        yield fleet_distribution.sample_vehicles(rngs, size)
+
+
+def iter_charging_stations(
+    fleet_distribution: FleetDistribution,
+    seed_sequence: np.random.SeedSequence,
+    chunk_size: int = 100_000,
+) -> Iterator[np.ndarray]:
+    """Draws a fleet's charging stations' delivered power (W) chunk by chunk.
+
+    Parameters
+    ----------
+    fleet_distribution : FleetDistribution
+        Distribution to draw the charging stations from.
+    seed_sequence : np.random.SeedSequence
+        Seed of the charging stations.
+    chunk_size : int
+        Maximum number of charging stations per chunk.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    for size in _chunks_sizes(
+        fleet_distribution.number_of_charging_stations, chunk_size
+    ):
+        yield fleet_distribution.sample_charging_stations(rng, size)
+
+
+def iter_tasks(
+    scenario_distribution: ScenarioDistribution,
+    seed_sequence: np.random.SeedSequence,
+    chunk_size: int = 100_000,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Draws a scenario's tasks chunk by chunk.
+
+    Each column is drawn from its own generator, spawned from the seed, and each chunk starts at the end time of the previous one, so that tasks, load cycle included, do not depend on the chunks' size.
+
+    Parameters
+    ----------
+    scenario_distribution : ScenarioDistribution
+        Distribution to draw the tasks from.
+    seed_sequence : np.random.SeedSequence
+        Seed of the scenario.
+    chunk_size : int
+        Maximum number of tasks per chunk.
+
+    Yields
+    ------
+    Tuple[np.ndarray, np.ndarray]
+        Tasks' timelapse (s) and tasks' needed fleet's load.
+    """
+    rngs = [np.random.default_rng(child) for child in seed_sequence.spawn(2)]
+    time = 0.0
+    for size in _chunks_sizes(scenario_distribution.tasks_number, chunk_size):
+        timelapses, loads, time = scenario_distribution.sample_tasks(rngs, size, time)
+        yield timelapses, loads
+
+
+def _write_json_rows(file: TextIO, chunks: Iterable[List[tuple]]) -> None:
+    """Writes rows of chunks as the items of a JSON array."""
+    file.write("[")
+    separator = ""
+    for rows in chunks:
+        if rows:
+            file.write(separator + dumps(rows)[1:-1])
+            separator = ", "
+    file.write("]")
+
+
+def _write_ndjson_rows(file: TextIO, chunks: Iterable[List[tuple]]) -> None:
+    """Writes rows of chunks as JSON arrays, one per line."""
+    for rows in chunks:
+        if rows:
+            file.write("\n".join(map(dumps, rows)) + "\n")
+
+
+def _write_columns(
+    path: str,
+    chunks: Iterable[Dict[str, np.ndarray]],
+    dtypes: Dict[str, type],
+    length: int,
+) -> None:
+    """Writes columns of chunks to memory-mapped '.npy' files of a directory, one per column, created beforehand so that empty columns are written too."""
+    os.makedirs(path, exist_ok=True)
+    columns = {
+        name: np.lib.format.open_memmap(
+            os.path.join(path, name + ".npy"),
+            mode="w+",
+            dtype=dtype,
+            shape=(length,),
+        )
+        for name, dtype in dtypes.items()
+    }
+    start = 0
+    for chunk in chunks:
+        for name, values in chunk.items():
+            columns[name][start : start + len(values)] = values
+        start += len(values)
+    for column in columns.values():
+        column.flush()
+
+
+def write_fleet(
+    fleet_distribution: FleetDistribution,
+    path: str,
+    seed: Optional[int] = None,
+    chunk_size: int = 100_000,
+) -> int:
+    """Draws a fleet and streams it to disk, in a format chosen after the path's extension.
+
+    A ".json" path is written in the layout of 'ResourcesData', any other one as a directory of '.npy' columns named after 'ColumnarResourcesData' fields. Only one chunk is held in memory at once.
+
+    Parameters
+    ----------
+    fleet_distribution : FleetDistribution
+        Distribution to draw the fleet from.
+    path : str
+        Path of the JSON file or of the columns' directory.
+    seed : Optional[int]
+        Seed of the fleet, drawn from the operating system if None.
+    chunk_size : int
+        Maximum number of vehicles or charging stations drawn at once.
+
+    Returns
+    -------
+    int
+        Entropy of the fleet's seed, to draw it again.
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    vehicles_seed_sequence, charging_stations_seed_sequence = seed_sequence.spawn(2)
+    vehicles = iter_vehicles(fleet_distribution, vehicles_seed_sequence, chunk_size)
+    charging_stations = iter_charging_stations(
+        fleet_distribution, charging_stations_seed_sequence, chunk_size
+    )
+    if path.endswith(".json"):
+        with open(path, "w") as file:
+            file.write('{"vehicles": ')
+            _write_json_rows(
+                file,
+                (
+                    list(zip(*(chunk[name].tolist() for name in VEHICLES_COLUMNS)))
+                    for chunk in vehicles
+                ),
+            )
+            file.write(', "charging_stations": ')
+            _write_json_rows(file, (chunk.tolist() for chunk in charging_stations))
+            file.write("}")
+    else:
+        _write_columns(
+            path, vehicles, VEHICLES_COLUMNS, fleet_distribution.number_of_vehicles
+        )
+        _write_columns(
+            path,
+            ({"charging_stations_power": chunk} for chunk in charging_stations),
+            {"charging_stations_power": np.float64},
+            fleet_distribution.number_of_charging_stations,
+        )
+    return seed_sequence.entropy
+
+
+def write_scenario(
+    scenario_distribution: ScenarioDistribution,
+    path: str,
+    seed: Optional[int] = None,
+    chunk_size: int = 100_000,
+) -> int:
+    """Draws a scenario and streams it to disk, in a format chosen after the path's extension.
+
+    A ".json" path is written in the layout of 'InputsData.scenario', a ".ndjson" one with one [timelapse, load] task per line, as read by 'NdjsonUserAdapter', and any other one as a directory of "timelapses" and "loads" '.npy' columns. Only one chunk is held in memory at once.
+
+    Parameters
+    ----------
+    scenario_distribution : ScenarioDistribution
+        Distribution to draw the scenario from.
+    path : str
+        Path of the JSON or NDJSON file or of the columns' directory.
+    seed : Optional[int]
+        Seed of the scenario, drawn from the operating system if None.
+    chunk_size : int
+        Maximum number of tasks drawn at once.
+
+    Returns
+    -------
+    int
+        Entropy of the scenario's seed, to draw it again.
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    tasks = iter_tasks(scenario_distribution, seed_sequence, chunk_size)
+    if path.endswith(".json") or path.endswith(".ndjson"):
+        write_rows = _write_json_rows if path.endswith(".json") else _write_ndjson_rows
+        with open(path, "w") as file:
+            write_rows(
+                file,
+                (
+                    list(zip(timelapses.tolist(), loads.tolist()))
+                    for timelapses, loads in tasks
+                ),
+            )
+    else:
+        _write_columns(
+            path,
+            (
+                {"timelapses": timelapses, "loads": loads}
+                for timelapses, loads in tasks
+            ),
+            {"timelapses": np.float64, "loads": np.float64},
+            scenario_distribution.tasks_number,
+        )
+    return seed_sequence.entropy
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    """Generates fleets and scenarios from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="fleet_operator.generators",
+        description="Draws a fleet or a scenario and writes it to a JSON file, a NDJSON file (scenarios only) or a directory of '.npy' columns, after the output's extension.",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="Seed, drawn from the operating system by default."
+    )
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    subparsers = parser.add_subparsers(dest="resource", required=True)
+    fleet_parser = subparsers.add_parser("fleet", help="Draws a fleet.")
+    fleet_parser.add_argument("output")
+    fleet_parser.add_argument("--vehicles", type=int, default=100)
+    fleet_parser.add_argument("--charging-stations", type=int, default=20)
+    scenario_parser = subparsers.add_parser("scenario", help="Draws a scenario.")
+    scenario_parser.add_argument("output")
+    scenario_parser.add_argument("--tasks", type=int, default=500)
+    scenario_parser.add_argument(
+        "--load-cycle",
+        action="store_true",
+        help="Draws loads around a daily and weekly cycle instead of uniformly.",
+    )
+    scenario_parser.add_argument(
+        "--noise",
+        type=float,
+        default=0.05,
+        help="Standard deviation of the loads around the load cycle.",
+    )
+    args = parser.parse_args(arguments)
+    if args.resource == "fleet":
+        entropy = write_fleet(
+            FleetDistribution(args.vehicles, args.charging_stations),
+            args.output,
+            args.seed,
+            args.chunk_size,
+        )
+    else:
+        entropy = write_scenario(
+            ScenarioDistribution(
+                args.tasks,
+                load_cycle=LoadCycle(noise=args.noise) if args.load_cycle else None,
+            ),
+            args.output,
+            args.seed,
+            args.chunk_size,
+        )
+    print("Seed: {}".format(entropy))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+from typing import Dict, Literal, Optional, Tuple, Union
+import numpy as np
+from .domain.data_models import ColumnarOutputsData, OutputsData
+
+
+def lttb(x: np.ndarray, y: np.ndarray, points_number: int) -> np.ndarray:
+    """Returns the indexes of the points of a series kept by the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are kept, and the other ones are split into points_number - 2 buckets, keeping from each the point forming the largest triangle with the point kept from the previous bucket and the mean of the next one.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Abscissas of the series, increasing.
+    y : np.ndarray
+        Ordinates of the series.
+    points_number : int
+        Number of points to keep, at least 3.
+
+    Returns
+    -------
+    np.ndarray
+        Increasing indexes of the kept points, all of them if they are not more than points_number.
+    """
+    length = len(x)
+    if length <= points_number or points_number < 3:
+        return np.arange(length)
+    edges = np.append(
+        (np.arange(points_number - 1) * ((length - 2) / (points_number - 2))).astype(
+            np.intp
+        )
+        + 1,
+        length,
+    )
+    indexes = np.empty(points_number, dtype=np.intp)
+    indexes[0], indexes[-1] = 0, length - 1
+    kept = 0
+    for bucket in range(points_number - 2):
+        start, end, next_end = edges[bucket], edges[bucket + 1], edges[bucket + 2]
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        areas = np.abs(
+            (x[kept] - next_x) * (y[start:end] - y[kept])
+            - (x[kept] - x[start:end]) * (next_y - y[kept])
+        )
+        kept = start + int(np.argmax(areas))
+        indexes[bucket + 1] = kept
+    return indexes
+
+
+def min_max(y: np.ndarray, buckets_number: int) -> np.ndarray:
+    """Returns the indexes of the points of a series kept by min/max bucketing.
+
+    The series is split into buckets_number buckets of consecutive points, keeping the lowest and the highest points of each, as well as the first and last points of the series.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        Ordinates of the series.
+    buckets_number : int
+        Number of buckets.
+
+    Returns
+    -------
+    np.ndarray
+        Increasing indexes of the kept points, all of them if they are not more than twice buckets_number.
+    """
+    length = len(y)
+    if length <= 2 * buckets_number:
+        return np.arange(length)
+    buckets = np.arange(length) * buckets_number // length
+    order = np.lexsort((y, buckets))  # By bucket, then by ordinate
+    bounds = np.flatnonzero(np.diff(buckets)) + 1
+    return np.unique(
+        np.concatenate(
+            (
+                order[np.append(0, bounds)],
+                order[np.append(bounds - 1, length - 1)],
+                [0, length - 1],
+            )
+        )
+    )
+
+
+def downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    width: int,
+    method: Literal["LTTB", "MINMAX"] = "LTTB",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Downsamples a series to be drawn on a given number of pixels, keeping its shape.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Abscissas of the series, increasing.
+    y : np.ndarray
+        Ordinates of the series.
+    width : int
+        Width of the drawing (pixels).
+    method : Literal["LTTB", "MINMAX"]
+        "LTTB" keeps one point per pixel (see 'lttb'), "MINMAX" the lowest and highest points of each pixel (see 'min_max').
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Abscissas and ordinates of the kept points.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if method == "LTTB":
+        indexes = lttb(x, y, width)
+    elif method == "MINMAX":
+        indexes = min_max(y, width)
+    else:
+        raise ValueError("Unknown downsampling method {}.".format(repr(method)))
+    return x[indexes], y[indexes]
+
+
+def plot_outputs(
+    outputs: Dict[str, Union[OutputsData, ColumnarOutputsData]],
+    path: Optional[str] = None,
+    width: int = 1000,
+    height: int = 600,
+    method: Literal["LTTB", "MINMAX"] = "LTTB",
+    title: Optional[str] = None,
+) -> None:
+    """Plots the grades of several runs in one figure, downsampled to the figure's width.
+
+    With a path, the figure is rendered headless, without pyplot, in the format of the path's extension (".png" or ".svg" for instance). matplotlib is only imported when plotting.
+
+    Parameters
+    ----------
+    outputs : Dict[str, Union[OutputsData, ColumnarOutputsData]]
+        Outputs of each run, indexed by label.
+    path : Optional[str]
+        Path of the image file, the figure is shown if None.
+    width : int
+        Width of the figure (pixels).
+    height : int
+        Height of the figure (pixels).
+    method : Literal["LTTB", "MINMAX"]
+        Downsampling method (see 'downsample').
+    title : Optional[str]
+        Title of the figure.
+    """
+    dpi = 100
+    if path is None:
+        import matplotlib.pyplot as plt
+
+        figure = plt.figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    else:
+        from matplotlib.figure import Figure
+
+        figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    axes = figure.add_subplot()
+    for label, output in outputs.items():
+        axes.plot(*downsample(output.time, output.grades, width, method), label=label)
+    axes.set_xlabel("Time (s)")
+    axes.set_ylabel("Cumulated grade")
+    if title is not None:
+        axes.set_title(title)
+    axes.legend()
+    if path is None:
+        plt.show()
+    else:
+        figure.savefig(path)
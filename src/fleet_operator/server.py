@@ -1,6 +1,12 @@
 from json import loads
-from pkg_resources import resource_filename
-from .domain.server import IObtainFleetData
+from typing import TYPE_CHECKING, Optional
+from importlib.resources import files
+from .columnar import load_columns
+from .domain.data_models import ColumnarResourcesData
+from .domain.server import IAsyncObtainFleetData, IObtainFleetData
+
+if TYPE_CHECKING:
+    from .connections import HttpConnectionPool
 
 
 class ConsoleServerAdapter(IObtainFleetData):
@@ -15,11 +21,74 @@ class ConsoleServerAdapter(IObtainFleetData):
 class JsonServerAdapter(IObtainFleetData):
     """Resources adapater for resources passed as JSON strings."""
 
-    def get_fleet_data(self, *args: list, **kwargs: dict) -> dict:
-        """Returns dictionary from concatenated json string from json filenames relative to fleet_operator folder."""
-        super().get_fleet_data(*args, **kwargs)
-        with open(
-            resource_filename("fleet_operator", "data/fleet.json"), "r"
-        ) as resources_json:
+    def get_fleet_data(
+        self, path: Optional[str] = None, *args: list, **kwargs: dict
+    ) -> dict:
+        """Returns dictionary from concatenated json string from the json file at path, the packaged fleet if None."""
+        super().get_fleet_data(path, *args, **kwargs)
+        if path is None:
+            resources_json = (
+                files("fleet_operator").joinpath("data/fleet.json").open("r")
+            )
+        else:
+            resources_json = open(path, "r")
+        with resources_json:
             resources = loads(resources_json.read())
         return resources
+
+
+class NpyServerAdapter(IObtainFleetData):
+    """Resources adapter for resources stored as binary columns.
+
+    Columns are '.npy' files of a directory, memory-mapped, or arrays of a '.npz' archive, named after 'ColumnarResourcesData' fields. An optional open circuit voltage curve is read from "ocv_soc" and "ocv_tension" columns.
+    """
+
+    data_model = ColumnarResourcesData
+
+    def get_fleet_data(
+        self, path: str, mmap_mode: Optional[str] = "r", *args: list, **kwargs: dict
+    ) -> dict:
+        """Returns dictionary of the columns of the directory or archive at path."""
+        super().get_fleet_data(path, mmap_mode, *args, **kwargs)
+        resources = load_columns(
+            path,
+            [
+                "cells_nominal_capacity",
+                "series_cells_numbers",
+                "parallel_branches_numbers",
+                "vehicles_power",
+                "charging_stations_power",
+                "ocv_soc",
+                "ocv_tension",
+            ],
+            mmap_mode,
+        )
+        if "ocv_soc" in resources or "ocv_tension" in resources:
+            resources["ocv"] = {
+                key: resources.pop("ocv_" + key).tolist()
+                for key in ["soc", "tension"]
+                if "ocv_" + key in resources
+            }
+        return resources
+
+
+class AsyncJsonServerAdapter(IAsyncObtainFleetData):
+    """Asynchronous resources adapter for resources passed as JSON files, read in worker threads."""
+
+    async def get_fleet_data(self, path: str, *args: list, **kwargs: dict) -> dict:
+        """Returns dictionary from the json file at path."""
+        from asyncio import to_thread
+        from pathlib import Path
+
+        content = await to_thread(Path(path).read_text)
+        return loads(content)
+
+
+class HttpServerAdapter(IAsyncObtainFleetData):
+    """Asynchronous resources adapter for resources served as JSON by an HTTP resources service."""
+
+    async def get_fleet_data(
+        self, pool: "HttpConnectionPool", path: str, *args: list, **kwargs: dict
+    ) -> dict:
+        """Returns dictionary from the JSON body of the resource at path, requested on a pooled connection."""
+        return await pool.get_json(path)
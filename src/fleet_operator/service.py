@@ -0,0 +1,391 @@
+import argparse
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from queue import Empty, Queue
+from threading import Lock, Thread
+from time import monotonic
+from typing import Dict, List, Literal, NamedTuple, Optional, Sequence, Tuple
+from pydantic import ValidationError
+from .domain.core import FleetControler, simulate
+from .domain.data_models import ColumnarOutputsData, InputsData, ResourcesData
+from .server import ConsoleServerAdapter
+
+_fleet_controlers: Dict[str, Tuple[FleetControler, dict]] = {}
+
+
+class UnknownFleetError(KeyError):
+    """Error raised by a 'SimulationService' for a fleet it does not keep."""
+
+
+def _load_fleet(
+    fleet_id: str,
+    resources: dict,
+    engine: Literal["OBJECT", "VECTORIZED", "EVENT"],
+    charging_allocation: Literal["SORTED", "NEEDIEST"],
+) -> None:
+    """Builds a fleet in the worker process and keeps it with a snapshot of its reset state."""
+    fleet_controler = FleetControler(
+        ConsoleServerAdapter(**resources),
+        engine=engine,
+        charging_allocation=charging_allocation,
+    )
+    fleet_controler.fleet.reset()
+    _fleet_controlers[fleet_id] = (fleet_controler, fleet_controler.fleet.snapshot())
+
+
+def _evict_fleet(fleet_id: str) -> None:
+    """Forgets a fleet of the worker process."""
+    _fleet_controlers.pop(fleet_id, None)
+
+
+def _run_batch(
+    fleet_id: str, requests: Sequence[Tuple[List[Tuple[float, float]], str]]
+) -> List[ColumnarOutputsData]:
+    """Runs scenarios on a fleet of the worker process, each from its reset state."""
+    if fleet_id not in _fleet_controlers:
+        raise UnknownFleetError("Unknown fleet {}.".format(repr(fleet_id)))
+    fleet_controler, snapshot = _fleet_controlers[fleet_id]
+    return [
+        simulate(fleet_controler.fleet, scenario, use_priority_criterion, snapshot)
+        for scenario, use_priority_criterion in requests
+    ]
+
+
+class _Request(NamedTuple):
+    fleet_id: str
+    scenario: List[Tuple[float, float]]
+    use_priority_criterion: str
+    future: Future
+
+
+class SimulationService:
+    """Long-lived simulation service keeping built fleets in worker processes.
+
+    Each fleet is built once, in the worker process it is assigned to, and is kept there until evicted, the least recently used fleet being evicted when more than max_fleets are kept. Simulation requests are queued and dispatched by batches: requests queued together for a fleet are sent to its worker as one task, each being run from the fleet's reset state.
+
+    Parameters
+    ----------
+    engine : Literal["OBJECT", "VECTORIZED", "EVENT"]
+        Simulation engine of the fleets.
+    charging_allocation : Literal["SORTED", "NEEDIEST"]
+        Allocation of the charging stations of the fleets.
+    workers : int
+        Number of worker processes.
+    max_fleets : int
+        Maximum number of fleets kept.
+    batch_size : int
+        Maximum number of requests of a batch.
+    batch_delay : float
+        Maximum time waited for requests to join a batch (s).
+    """
+
+    def __init__(
+        self,
+        engine: Literal["OBJECT", "VECTORIZED", "EVENT"] = "OBJECT",
+        charging_allocation: Literal["SORTED", "NEEDIEST"] = "SORTED",
+        workers: int = 1,
+        max_fleets: int = 16,
+        batch_size: int = 64,
+        batch_delay: float = 0.005,
+    ) -> None:
+        self.engine = engine
+        self.charging_allocation = charging_allocation
+        self.max_fleets = max_fleets
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.__executors = [ProcessPoolExecutor(1) for _ in range(workers)]
+        self.__fleets: "OrderedDict[str, int]" = OrderedDict()
+        self.__lock = Lock()
+        self.__requests: Queue = Queue()
+        self.__dispatcher = Thread(target=self.__dispatch, daemon=True)
+        self.__dispatcher.start()
+
+    def add_fleet(self, resources: dict) -> str:
+        """Validates and builds a fleet, unless an identical one is already kept.
+
+        Parameters
+        ----------
+        resources : dict
+            Dictionary containing the resources (see 'ResourcesData').
+
+        Returns
+        -------
+        str
+            Identity of the fleet, to refer to it in simulation requests.
+        """
+        resources = ResourcesData(**resources).dict()
+        fleet_id = sha256(
+            dumps(
+                [resources, self.engine, self.charging_allocation], sort_keys=True
+            ).encode()
+        ).hexdigest()[:16]
+        with self.__lock:
+            if fleet_id in self.__fleets:
+                self.__fleets.move_to_end(fleet_id)
+                return fleet_id
+            loads_number = [0] * len(self.__executors)
+            for worker in self.__fleets.values():
+                loads_number[worker] += 1
+            worker = loads_number.index(min(loads_number))
+            self.__fleets[fleet_id] = worker
+            self.__executors[worker].submit(
+                _load_fleet, fleet_id, resources, self.engine, self.charging_allocation
+            )
+            while len(self.__fleets) > self.max_fleets:
+                evicted_id, evicted_worker = self.__fleets.popitem(last=False)
+                self.__executors[evicted_worker].submit(_evict_fleet, evicted_id)
+        return fleet_id
+
+    @property
+    def fleets(self) -> List[str]:
+        """Identities of the kept fleets, from the least to the most recently used."""
+        with self.__lock:
+            return list(self.__fleets)
+
+    def submit(
+        self,
+        fleet_id: str,
+        scenario: List[Tuple[float, float]],
+        use_priority_criterion: str,
+    ) -> Future:
+        """Queues a simulation request.
+
+        Parameters
+        ----------
+        fleet_id : str
+            Identity of a kept fleet.
+        scenario : List[Tuple[float, float]]
+            Scenario of fleet tasks as a list of tuples: timelapse of task (s), task's needed fleet's load.
+        use_priority_criterion : str
+            Criterion to use to sort vehicles.
+
+        Returns
+        -------
+        Future
+            Future of the request's 'ColumnarOutputsData', raising the error of its run if it failed, an 'UnknownFleetError' if the fleet was evicted meanwhile.
+        """
+        inputs_data = InputsData(
+            scenario=scenario, use_priority_criterion=use_priority_criterion
+        )
+        with self.__lock:
+            if fleet_id not in self.__fleets:
+                raise UnknownFleetError("Unknown fleet {}.".format(repr(fleet_id)))
+            self.__fleets.move_to_end(fleet_id)
+        future: Future = Future()
+        self.__requests.put(
+            _Request(
+                fleet_id,
+                inputs_data.scenario,
+                inputs_data.use_priority_criterion,
+                future,
+            )
+        )
+        return future
+
+    def __dispatch(self) -> None:
+        """Groups queued requests by fleet and sends each group to the fleet's worker."""
+        while True:
+            request = self.__requests.get()
+            if request is None:
+                return
+            batch = [request]
+            deadline = monotonic() + self.batch_delay
+            while len(batch) < self.batch_size:
+                try:
+                    request = self.__requests.get(
+                        timeout=max(deadline - monotonic(), 0)
+                    )
+                except Empty:
+                    break
+                if request is None:
+                    self.__requests.put(None)
+                    break
+                batch.append(request)
+            groups: Dict[str, List[_Request]] = {}
+            for request in batch:
+                groups.setdefault(request.fleet_id, []).append(request)
+            for fleet_id, requests in groups.items():
+                with self.__lock:
+                    worker = self.__fleets.get(fleet_id)
+                try:
+                    if worker is None:
+                        raise UnknownFleetError(
+                            "Unknown fleet {}.".format(repr(fleet_id))
+                        )
+                    batch_future = self.__executors[worker].submit(
+                        _run_batch,
+                        fleet_id,
+                        [
+                            (request.scenario, request.use_priority_criterion)
+                            for request in requests
+                        ],
+                    )
+                except Exception as error:  # e.g. a broken worker's pool
+                    for request in requests:
+                        request.future.set_exception(error)
+                    continue
+                batch_future.add_done_callback(
+                    lambda batch_future, requests=requests: self.__resolve(
+                        batch_future, requests
+                    )
+                )
+
+    @staticmethod
+    def __resolve(batch_future: Future, requests: List[_Request]) -> None:
+        """Sets the result of each request of a batch."""
+        try:
+            outputs = batch_future.result()
+        except BaseException as error:
+            for request in requests:
+                request.future.set_exception(error)
+        else:
+            for request, output in zip(requests, outputs):
+                request.future.set_result(output)
+
+    def close(self) -> None:
+        """Stops dispatching requests and shuts the worker processes down."""
+        self.__requests.put(None)
+        self.__dispatcher.join()
+        for executor in self.__executors:
+            executor.shutdown()
+
+    def __enter__(self) -> "SimulationService":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class SimulationRequestHandler(BaseHTTPRequestHandler):
+    """JSON over HTTP front of a 'SimulationService'.
+
+    - GET /fleets returns the identities of the kept fleets.
+    - POST /fleets with resources (see 'ResourcesData') returns {"fleet_id": ...}.
+    - POST /simulations with {"fleet_id": ..., "scenario": [...], "use_priority_criterion": ...} returns the outputs (see 'OutputsData').
+
+    Invalid requests are answered with status 400, unknown paths and fleets with status 404 and failed runs, their workers' crashes included, with status 500, all with {"error": ...}.
+    """
+
+    protocol_version = "HTTP/1.1"
+    service: SimulationService
+
+    def do_GET(self) -> None:
+        if self.path == "/fleets":
+            self.__reply(200, {"fleets": self.service.fleets})
+        else:
+            self.__reply(404, {"error": "Unknown path {}.".format(self.path)})
+
+    def do_POST(self) -> None:
+        future = None
+        try:
+            body = loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if not isinstance(body, dict):
+                raise TypeError("The request's body must be a JSON object.")
+            if self.path == "/fleets":
+                self.__reply(200, {"fleet_id": self.service.add_fleet(body)})
+            elif self.path == "/simulations":
+                future = self.service.submit(
+                    body.get("fleet_id"),
+                    body.get("scenario"),
+                    body.get("use_priority_criterion"),
+                )
+            else:
+                self.__reply(404, {"error": "Unknown path {}.".format(self.path)})
+        except UnknownFleetError as error:
+            self.__reply(404, {"error": error.args[0]})
+        except (ValueError, TypeError, ValidationError) as error:
+            self.__reply(400, {"error": str(error)})
+        except Exception as error:
+            self.__reply(500, {"error": "{}: {}".format(type(error).__name__, error)})
+        if future is not None:
+            self.__reply_result(future)
+
+    def __reply_result(self, future: Future) -> None:
+        """Replies with the outputs of a simulation request once it is run."""
+        try:
+            outputs = future.result()
+        except UnknownFleetError as error:
+            self.__reply(404, {"error": error.args[0]})
+        except Exception as error:
+            self.__reply(500, {"error": "{}: {}".format(type(error).__name__, error)})
+        else:
+            self.__reply(200, outputs.as_dict())
+
+    def __reply(self, status: int, content: dict) -> None:
+        body = dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def serve(
+    service: SimulationService, host: str = "127.0.0.1", port: int = 8000
+) -> ThreadingHTTPServer:
+    """Returns an HTTP server, to be started with 'serve_forever', exposing a simulation service.
+
+    Parameters
+    ----------
+    service : SimulationService
+        The exposed service.
+    host : str
+        Host to bind.
+    port : int
+        Port to bind, any free one if 0.
+
+    Returns
+    -------
+    ThreadingHTTPServer
+        The HTTP server.
+    """
+    handler = type(
+        "BoundSimulationRequestHandler", (SimulationRequestHandler,), {"service": service}
+    )
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    """Serves simulations over HTTP from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="fleet_operator.service",
+        description="Serves simulations over HTTP, keeping built fleets in memory.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--engine", choices=["OBJECT", "VECTORIZED", "EVENT"], default="OBJECT"
+    )
+    parser.add_argument(
+        "--charging-allocation", choices=["SORTED", "NEEDIEST"], default="SORTED"
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--max-fleets", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--batch-delay", type=float, default=0.005)
+    args = parser.parse_args(arguments)
+    with SimulationService(
+        args.engine,
+        args.charging_allocation,
+        args.workers,
+        args.max_fleets,
+        args.batch_size,
+        args.batch_delay,
+    ) as service:
+        server = serve(service, args.host, args.port)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
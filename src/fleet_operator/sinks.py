@@ -0,0 +1,149 @@
+import math
+import os
+from typing import Dict, Optional
+import numpy as np
+from .domain.data_models import ColumnarOutputsData
+from .domain.sinks import IResultsSink
+
+OUTPUTS_COLUMNS = ["time", "grades"]
+
+
+class MemmapResultsSink(IResultsSink):
+    """Results sink writing time and grades to memory-mapped '.npy' files, one per column.
+
+    The directory can be read back with 'load_columns'. Columns are preallocated for the whole run if its number of tasks is known, grown by a given number of steps whenever a write exceeds them otherwise, and shrunk in place on close to the steps written.
+
+    Parameters
+    ----------
+    path : str
+        Path of the directory, created if needed.
+    tasks_number : Optional[int]
+        Number of tasks of the scenario, the run writing one more step for the fleet's initial state, unknown if None (e.g. streamed scenarios).
+    growth_steps : int
+        Number of steps the columns are grown by.
+    """
+
+    def __init__(
+        self, path: str, tasks_number: Optional[int] = None, growth_steps: int = 65536
+    ) -> None:
+        if growth_steps < 1:
+            raise ValueError("The columns must be grown by a positive number of steps.")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.growth_steps = growth_steps
+        self.steps_number = 0
+        self.__columns: Optional[Dict[str, np.memmap]] = {
+            name: np.lib.format.open_memmap(
+                os.path.join(path, name + ".npy"),
+                mode="w+",
+                dtype=float,
+                shape=(growth_steps if tasks_number is None else tasks_number + 1,),
+            )
+            for name in OUTPUTS_COLUMNS
+        }
+
+    def write(self, outputs: ColumnarOutputsData) -> None:
+        if self.__columns is None:
+            raise ValueError("Writing to a closed sink.")
+        end = self.steps_number + len(outputs.time)
+        capacity = len(self.__columns["time"])
+        if end > capacity:
+            self.__resize(
+                capacity
+                + math.ceil((end - capacity) / self.growth_steps) * self.growth_steps
+            )
+            self.__columns = {
+                name: np.lib.format.open_memmap(
+                    os.path.join(self.path, name + ".npy"), mode="r+"
+                )
+                for name in OUTPUTS_COLUMNS
+            }
+        self.__columns["time"][self.steps_number : end] = outputs.time
+        self.__columns["grades"][self.steps_number : end] = outputs.grades
+        self.steps_number = end
+
+    def close(self) -> None:
+        if self.__columns is None:
+            return
+        if self.steps_number < len(self.__columns["time"]):
+            self.__resize(self.steps_number)
+        else:
+            self.__unmap()
+
+    def __unmap(self) -> Dict[str, int]:
+        """Flushes the columns and drops the sink's references to them, which unmaps their files, returning their data's offset in the files."""
+        offsets = {}
+        for name in OUTPUTS_COLUMNS:
+            self.__columns[name].flush()
+            offsets[name] = self.__columns[name].offset
+        self.__columns = None
+        return offsets
+
+    def __resize(self, steps_number: int) -> None:
+        """Unmaps the columns and resizes their files in place to a number of steps, rewriting their headers."""
+        offsets = self.__unmap()
+        for name, offset in offsets.items():
+            with open(os.path.join(self.path, name + ".npy"), "r+b") as column_file:
+                np.lib.format.write_array_header_1_0(
+                    column_file,
+                    {
+                        "descr": np.lib.format.dtype_to_descr(np.dtype(float)),
+                        "fortran_order": False,
+                        "shape": (steps_number,),
+                    },
+                )
+                # Headers are padded so that the length of the shape does not change theirs
+                if column_file.tell() != offset:
+                    raise ValueError(
+                        "The header of {} can not be resized.".format(name)
+                    )
+                column_file.truncate(offset + steps_number * np.dtype(float).itemsize)
+
+
+class CsvResultsSink(IResultsSink):
+    """Results sink appending time and grades to a CSV file, one "time,grades" row per step.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, overwritten.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.__file = open(path, "w")
+        self.__file.write(",".join(OUTPUTS_COLUMNS) + "\n")
+
+    def write(self, outputs: ColumnarOutputsData) -> None:
+        np.savetxt(
+            self.__file,
+            np.column_stack((outputs.time, outputs.grades)),
+            fmt="%.17g",
+            delimiter=",",
+        )
+
+    def close(self) -> None:
+        self.__file.close()
+
+
+class NdjsonResultsSink(IResultsSink):
+    """Results sink appending time and grades to a newline delimited JSON file, one [time, grade] step per line.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, overwritten.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.__file = open(path, "w")
+
+    def write(self, outputs: ColumnarOutputsData) -> None:
+        self.__file.write(
+            "".join(
+                "[{!r}, {!r}]\n".format(time, grade)
+                for time, grade in zip(outputs.time.tolist(), outputs.grades.tolist())
+            )
+        )
+
+    def close(self) -> None:
+        self.__file.close()
@@ -0,0 +1,37 @@
+from typing import Dict
+import numpy as np
+from .domain.trajectories import TrajectoryRecorder
+
+
+def save_trajectories(recorder: TrajectoryRecorder, path: str) -> None:
+    """Saves the records of a trajectory recorder as a compressed '.npz' archive.
+
+    Records keep their float32 and uint8 types, and the archive can be read back with 'load_trajectories' or 'load_columns'.
+
+    Parameters
+    ----------
+    recorder : TrajectoryRecorder
+        Recorder whose records are saved, from the oldest to the latest.
+    path : str
+        Path of the archive.
+    """
+    np.savez_compressed(
+        path, decimation=np.array(recorder.decimation), **recorder.trajectories()
+    )
+
+
+def load_trajectories(path: str) -> Dict[str, np.ndarray]:
+    """Loads the records saved by 'save_trajectories'.
+
+    Parameters
+    ----------
+    path : str
+        Path of the archive.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Records indexed by name (see 'TrajectoryRecorder.trajectories'), and the "decimation" they were recorded with.
+    """
+    with np.load(path) as archive:
+        return {name: archive[name] for name in archive.files}
@@ -1,6 +1,17 @@
 from json import loads
-from pkg_resources import resource_filename
-from .domain.user import IRequestInputsData
+from typing import TYPE_CHECKING, Iterator, List, Optional
+from importlib.resources import files
+from .columnar import load_columns
+from .domain.data_models import (
+    ColumnarInputsData,
+    ColumnarScenarioData,
+    ScenarioData,
+    StreamScenarioData,
+)
+from .domain.user import IAsyncRequestInputsData, IRequestInputsData, IStreamInputsData
+
+if TYPE_CHECKING:
+    from .connections import HttpConnectionPool
 
 
 class ConsoleUserAdapter(IRequestInputsData):
@@ -15,12 +26,94 @@ class ConsoleUserAdapter(IRequestInputsData):
 class JsonUserAdapter(IRequestInputsData):
     """Inputs adapater for inputs passed as JSON strings."""
 
-    def get_inputs_data(self, *args: list, **kwargs: dict) -> dict:
-        """Returns dictionary from concatenated json string from json filenames relative to fleet_operator folder."""
-        super().get_inputs_data(*args, **kwargs)
-        with open(
-            resource_filename("fleet_operator", "data/scenario.json"), "r"
-        ) as scenario_json:
+    def get_inputs_data(
+        self, path: Optional[str] = None, *args: list, **kwargs: dict
+    ) -> dict:
+        """Returns dictionary from concatenated json string from the json file at path, the packaged scenario if None."""
+        super().get_inputs_data(path, *args, **kwargs)
+        if path is None:
+            scenario_json = (
+                files("fleet_operator").joinpath("data/scenario.json").open("r")
+            )
+        else:
+            scenario_json = open(path, "r")
+        with scenario_json:
             scenario = loads(scenario_json.read())
         kwargs["scenario"] = scenario
         return kwargs
+
+
+class NpyUserAdapter(IRequestInputsData):
+    """Inputs adapter for scenarios stored as binary columns.
+
+    Columns are "timelapses" and "loads" '.npy' files of a directory, memory-mapped, or arrays of a '.npz' archive.
+    """
+
+    data_model = ColumnarInputsData
+
+    def get_inputs_data(
+        self, path: str, mmap_mode: Optional[str] = "r", *args: list, **kwargs: dict
+    ) -> dict:
+        """Returns named parameters with the scenario's columns of the directory or archive at path."""
+        super().get_inputs_data(path, mmap_mode, *args, **kwargs)
+        kwargs.update(load_columns(path, ["timelapses", "loads"], mmap_mode))
+        return kwargs
+
+
+class NdjsonUserAdapter(IStreamInputsData):
+    """Streamed inputs adapter for scenarios stored as newline delimited JSON tasks."""
+
+    def get_inputs_data(self, path: str, *args: list, **kwargs: dict) -> dict:
+        """Returns named parameters with a scenario lazily read from a NDJSON file, one [timelapse, load] task per line."""
+        super().get_inputs_data(path, *args, **kwargs)
+        kwargs["scenario"] = self.__read_tasks(path)
+        return kwargs
+
+    @staticmethod
+    def __read_tasks(path: str) -> Iterator[List[float]]:
+        with open(path, "r") as scenario_ndjson:
+            for line in scenario_ndjson:
+                if line.strip():
+                    yield loads(line)
+
+
+class JsonScenarioAdapter(JsonUserAdapter):
+    """Inputs adapter for scenarios passed as JSON strings, read without criterion to be run with several ones."""
+
+    data_model = ScenarioData
+
+
+class NpyScenarioAdapter(NpyUserAdapter):
+    """Inputs adapter for scenarios stored as binary columns, read without criterion to be run with several ones."""
+
+    data_model = ColumnarScenarioData
+
+
+class NdjsonScenarioAdapter(NdjsonUserAdapter):
+    """Streamed inputs adapter for scenarios stored as newline delimited JSON tasks, read without criterion to be run with several ones."""
+
+    data_model = StreamScenarioData
+
+
+class AsyncJsonUserAdapter(IAsyncRequestInputsData):
+    """Asynchronous inputs adapter for scenarios passed as JSON files, read in worker threads."""
+
+    async def get_inputs_data(self, path: str, *args: list, **kwargs: dict) -> dict:
+        """Returns named parameters with the scenario of the json file at path."""
+        from asyncio import to_thread
+        from pathlib import Path
+
+        content = await to_thread(Path(path).read_text)
+        kwargs["scenario"] = loads(content)
+        return kwargs
+
+
+class HttpUserAdapter(IAsyncRequestInputsData):
+    """Asynchronous inputs adapter for scenarios served as JSON by an HTTP resources service."""
+
+    async def get_inputs_data(
+        self, pool: "HttpConnectionPool", path: str, *args: list, **kwargs: dict
+    ) -> dict:
+        """Returns named parameters with the scenario from the JSON body of the resource at path, requested on a pooled connection."""
+        kwargs["scenario"] = await pool.get_json(path)
+        return kwargs
@@ -0,0 +1,88 @@
+import os
+from importlib.resources import files
+from json import loads
+import numpy as np
+import pytest
+from fleet_operator.checkpoint import (
+    STATE_DIRNAME,
+    load_checkpoint,
+    simulate_from_checkpoint,
+)
+from fleet_operator.domain.core import FleetControler, simulate
+from fleet_operator.server import ConsoleServerAdapter, JsonServerAdapter
+
+TASKS_NUMBER = 60
+INTERVAL = 7
+
+
+@pytest.fixture(scope="module")
+def resources():
+    data = JsonServerAdapter().data
+    return {
+        "vehicles": data.vehicles[:10],
+        "charging_stations": data.charging_stations[:2],
+    }
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    content = files("fleet_operator").joinpath("data/scenario.json").read_text()
+    return [tuple(task) for task in loads(content)[:TASKS_NUMBER]]
+
+
+def build_fleet(resources, engine):
+    return FleetControler(ConsoleServerAdapter(**resources), engine=engine).fleet
+
+
+def interrupt(fleet, tasks_number):
+    """Makes the fleet fail once it has run a number of tasks, as if the run was killed."""
+    use = fleet.use
+
+    def interrupted_use(*args):
+        if len(fleet.time) > tasks_number:
+            raise KeyboardInterrupt
+        use(*args)
+
+    fleet.use = interrupted_use
+
+
+@pytest.mark.parametrize("engine", ["OBJECT", "VECTORIZED"])
+def test_resumed_run_matches_an_uninterrupted_one(
+    tmp_path, resources, scenario, engine
+):
+    expected = simulate(build_fleet(resources, engine), scenario, "PERFORMANT")
+    assert expected.grades[-1] > 0
+    path = str(tmp_path / "checkpoint")
+    fleet = build_fleet(resources, engine)
+    interrupt(fleet, 40)
+    with pytest.raises(KeyboardInterrupt):
+        simulate_from_checkpoint(fleet, scenario, "PERFORMANT", path, INTERVAL)
+    snapshot, scenario_index = load_checkpoint(path)
+    assert scenario_index == 35
+    assert np.array_equal(snapshot["time"], expected.time[:36])
+    assert np.array_equal(snapshot["grades"], expected.grades[:36])
+    outputs = simulate_from_checkpoint(
+        build_fleet(resources, engine), scenario, "PERFORMANT", path, INTERVAL
+    )
+    assert np.array_equal(outputs.time, expected.time)
+    assert np.array_equal(outputs.grades, expected.grades)
+    snapshot, scenario_index = load_checkpoint(path, mmap_mode=None)
+    assert scenario_index == TASKS_NUMBER
+    assert np.array_equal(snapshot["grades"], expected.grades)
+
+
+def test_checkpoint_survives_an_interrupted_swap(tmp_path, resources, scenario):
+    path = str(tmp_path / "checkpoint")
+    fleet = build_fleet(resources, "VECTORIZED")
+    expected = simulate_from_checkpoint(
+        fleet, scenario[:20], "PERFORMANT", path, INTERVAL
+    )
+    state_path = os.path.join(path, STATE_DIRNAME)
+    os.replace(state_path, state_path + ".old")
+    snapshot, scenario_index = load_checkpoint(path)
+    assert scenario_index == 20
+    assert np.array_equal(snapshot["grades"], expected.grades)
+    assert np.array_equal(snapshot["soc"], fleet.vehicles_state()["soc"])
+    os.replace(state_path + ".old", state_path + ".tmp")
+    with pytest.raises(FileNotFoundError):
+        load_checkpoint(path)
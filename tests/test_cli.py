@@ -0,0 +1,88 @@
+import json
+import numpy as np
+import pytest
+from pydantic import ValidationError
+from fleet_operator import cli
+from fleet_operator.domain.core import FleetControler
+from fleet_operator.server import JsonServerAdapter
+from fleet_operator.user import (
+    JsonScenarioAdapter,
+    JsonUserAdapter,
+    NdjsonScenarioAdapter,
+    NdjsonUserAdapter,
+    NpyScenarioAdapter,
+    NpyUserAdapter,
+)
+
+SCENARIO = [[1800.0, 0.5], [3600.0, 0.25], [600.0, 1.0], [7200.0, 0.75]] * 5
+
+
+@pytest.fixture(scope="module")
+def fleet_controler():
+    return FleetControler(JsonServerAdapter(), engine="VECTORIZED")
+
+
+@pytest.fixture
+def scenario_files(tmp_path):
+    json_path = tmp_path / "scenario.json"
+    json_path.write_text(json.dumps(SCENARIO))
+    ndjson_path = tmp_path / "scenario.ndjson"
+    ndjson_path.write_text("".join(json.dumps(task) + "\n" for task in SCENARIO))
+    npy_path = tmp_path / "scenario_columns"
+    npy_path.mkdir()
+    np.save(npy_path / "timelapses.npy", np.array(SCENARIO)[:, 0])
+    np.save(npy_path / "loads.npy", np.array(SCENARIO)[:, 1])
+    return str(json_path), str(ndjson_path), str(npy_path)
+
+
+def test_run_adapters_require_a_criterion(fleet_controler, scenario_files):
+    json_path, ndjson_path, npy_path = scenario_files
+    with pytest.raises(ValidationError, match="use_priority_criterion"):
+        JsonUserAdapter(fleet_controler, json_path)
+    with pytest.raises(ValidationError, match="use_priority_criterion"):
+        NpyUserAdapter(fleet_controler, npy_path)
+    with pytest.raises(ValidationError, match="use_priority_criterion"):
+        NdjsonUserAdapter(fleet_controler, ndjson_path)
+    with pytest.raises(ValidationError, match="use_priority_criterion"):
+        JsonUserAdapter(fleet_controler, json_path, use_priority_criterion=None)
+
+
+def test_scenarios_are_read_without_criterion(fleet_controler, scenario_files):
+    json_path, ndjson_path, npy_path = scenario_files
+    expected = [tuple(task) for task in SCENARIO]
+    adapter = cli.load_scenario(json_path, fleet_controler)
+    assert isinstance(adapter, JsonScenarioAdapter)
+    assert adapter.data.scenario == expected
+    assert list(NpyScenarioAdapter(fleet_controler, npy_path).data.scenario) == expected
+    adapter = cli.load_scenario(ndjson_path, fleet_controler)
+    assert isinstance(adapter, NdjsonScenarioAdapter)
+    assert list(adapter.iter_scenario()) == expected
+    outputs = JsonScenarioAdapter(fleet_controler, json_path).run_criterions(
+        ["PERFORMANT", "POOR"], max_workers=1
+    )
+    assert sorted(outputs) == ["PERFORMANT", "POOR"]
+
+
+def test_every_scenario_format_gives_the_same_outputs(scenario_files, tmp_path):
+    outputs = []
+    for path in scenario_files:
+        output_path = tmp_path / "outputs.json"
+        cli.main(
+            [
+                "--scenario",
+                path,
+                "--engine",
+                "VECTORIZED",
+                "--criterions",
+                "PERFORMANT",
+                "MEDIUM",
+                "--workers",
+                "1",
+                "--output",
+                str(output_path),
+            ]
+        )
+        outputs.append(json.loads(output_path.read_text()))
+    assert outputs[0] == outputs[1] == outputs[2]
+    assert sorted(outputs[0]) == ["MEDIUM", "PERFORMANT"]
+    assert len(outputs[0]["PERFORMANT"]["grades"]) == len(SCENARIO) + 1
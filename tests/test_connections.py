@@ -0,0 +1,148 @@
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from threading import Event, Thread
+import pytest
+from fleet_operator import connections
+from fleet_operator.connections import HttpConnectionPool
+
+
+class ResourcesHandler(BaseHTTPRequestHandler):
+    """Stand-in of a resources service answering every path with its JSON echo, once the server's 'answer' event is set, closing its connections silently after each response when the server's 'drop_connections' is set."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.requests_number += 1
+        self.server.answer.wait()
+        body = dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = self.server.drop_connections
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class ResourcesServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), ResourcesHandler)
+        self.requests_number = 0
+        self.connections_number = 0
+        self.drop_connections = False
+        self.answer = Event()
+        self.answer.set()
+
+    def process_request(self, request: object, client_address: object) -> None:
+        self.connections_number += 1
+        super().process_request(request, client_address)
+
+
+@pytest.fixture
+def server():
+    server = ResourcesServer()
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_connections_are_reused(server):
+    async def run(pool):
+        async with pool:
+            return [await pool.get_json("/{}".format(index)) for index in range(5)]
+
+    pool = HttpConnectionPool(*server.server_address, size=2)
+    bodies = asyncio.run(run(pool))
+    assert bodies == [{"path": "/{}".format(index)} for index in range(5)]
+    assert pool.opened_connections_number == 1
+    assert server.connections_number == 1
+
+
+def test_concurrent_requests_are_bounded_by_the_size(server):
+    async def run(pool):
+        async with pool:
+            return await asyncio.gather(
+                *(pool.get_json("/{}".format(index)) for index in range(20))
+            )
+
+    pool = HttpConnectionPool(*server.server_address, size=3)
+    bodies = asyncio.run(run(pool))
+    assert bodies == [{"path": "/{}".format(index)} for index in range(20)]
+    assert pool.opened_connections_number <= 3
+    assert server.requests_number == 20
+
+
+def test_stale_connections_are_retried_once(server):
+    async def run(pool):
+        async with pool:
+            return [await pool.get_json("/{}".format(index)) for index in range(3)]
+
+    server.drop_connections = True
+    pool = HttpConnectionPool(*server.server_address, size=1)
+    bodies = asyncio.run(run(pool))
+    assert bodies == [{"path": "/{}".format(index)} for index in range(3)]
+    assert pool.opened_connections_number == 3
+    assert server.requests_number == 3
+
+
+def test_failures_on_new_connections_are_raised():
+    server = ResourcesServer()
+    server.server_close()
+    pool = HttpConnectionPool(*server.server_address, size=1)
+    with pytest.raises(ConnectionError):
+        asyncio.run(pool.get_json("/"))
+
+
+def test_pool_is_reused_across_event_loops(server):
+    async def run(pool):
+        return await asyncio.gather(
+            *(pool.get_json("/{}".format(index)) for index in range(4))
+        )
+
+    pool = HttpConnectionPool(*server.server_address, size=1)
+    for _ in range(2):
+        assert asyncio.run(run(pool)) == [
+            {"path": "/{}".format(index)} for index in range(4)
+        ]
+    asyncio.run(pool.close())
+    assert pool.opened_connections_number == 1
+
+
+def test_cancelled_requests_connections_are_closed_once_done(server, monkeypatch):
+    opened = []
+
+    class RecordedConnection(connections.HTTPConnection):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            opened.append(self)
+
+    async def run(pool):
+        request = asyncio.ensure_future(pool.get_json("/cancelled"))
+        while server.requests_number == 0:
+            await asyncio.sleep(0.01)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        assert opened[0].sock is not None  # Still used by the worker thread
+        server.answer.set()
+        for _ in range(500):
+            if opened[0].sock is None:
+                break
+            await asyncio.sleep(0.01)
+        assert opened[0].sock is None
+        async with pool:
+            return await pool.get_json("/next")
+
+    monkeypatch.setattr(connections, "HTTPConnection", RecordedConnection)
+    server.answer.clear()
+    pool = HttpConnectionPool(*server.server_address, size=1)
+    assert asyncio.run(run(pool)) == {"path": "/next"}
+    assert pool.opened_connections_number == 2
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+from fleet_operator.domain import criterions
+from fleet_operator.domain.criterions import (
+    criterion_names,
+    get_criterion,
+    register_criterion,
+    smallest_indexes,
+)
+from fleet_operator.domain.data_models import InputsData
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(criterions, "_criterions", dict(criterions._criterions))
+
+
+def stable_prefix(values, number):
+    return np.argsort(values, kind="stable")[: max(number, 0)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_smallest_indexes_is_a_stable_argsort_prefix(seed):
+    generator = np.random.default_rng(seed)
+    length = int(generator.integers(1, 200))
+    values = generator.integers(-5, 5, length).astype(float)  # Many ties
+    values[generator.random(length) < 0.05] = np.inf
+    for number in [-1, 0, 1, length // 3, length - 1, length, length + 1]:
+        assert np.array_equal(
+            smallest_indexes(values, number), stable_prefix(values, number)
+        )
+    values = generator.normal(size=length)
+    number = int(generator.integers(0, length + 1))
+    assert np.array_equal(
+        smallest_indexes(values, number), stable_prefix(values, number)
+    )
+
+
+def test_smallest_indexes_with_nan():
+    values = np.array([3.0, np.nan, 1.0, 1.0, np.nan, 2.0])
+    for number in range(len(values) + 1):
+        assert np.array_equal(
+            smallest_indexes(values, number), stable_prefix(values, number)
+        )
+
+
+def test_unknown_criterions_raise():
+    assert criterion_names()[:3] == ["PERFORMANT", "MEDIUM", "POOR"]
+    with pytest.raises(ValueError, match="Unknown criterion 'UNKNOWN'"):
+        get_criterion("UNKNOWN")
+    with pytest.raises(ValidationError, match="use_priority_criterion"):
+        InputsData(scenario=[(600.0, 0.5)], use_priority_criterion="UNKNOWN")
+
+
+def test_duplicate_criterions_raise(registry):
+    @register_criterion("RESERVE")
+    def reserve_criterion(state):
+        return state.available_capacity - state.current_capacity
+
+    assert get_criterion("RESERVE") is reserve_criterion
+    with pytest.raises(ValueError, match="already registered"):
+        register_criterion("RESERVE", reserve_criterion)
+    with pytest.raises(ValueError, match="already registered"):
+        register_criterion("POOR")(reserve_criterion)
+    assert get_criterion("RESERVE") is reserve_criterion
+    register_criterion("POOR", reserve_criterion, replace=True)
+    assert get_criterion("POOR") is reserve_criterion
+    assert criterion_names().count("POOR") == 1
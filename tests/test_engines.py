@@ -0,0 +1,85 @@
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pytest
+from fleet_operator.domain.core import FleetControler
+from fleet_operator.server import JsonServerAdapter
+from fleet_operator.user import JsonUserAdapter
+
+CRITERIONS = ("PERFORMANT", "POOR", "MEDIUM")
+ALLOCATIONS = ("SORTED", "NEEDIEST")
+# Final grade, sum of the grades and counters, in the order of 'FleetCounters', of the
+# object engine before the other engines were added, running the packaged scenario
+# with each criterion in turn on the packaged fleet
+BASELINE = {
+    "PERFORMANT": (12.280509269357577, 2809.588833467713, (0, 73, 27286, 9972, 20)),
+    "POOR": (8.185238609311162, 1917.9124519645711, (0, 0, 27372, 9982, 20)),
+    "MEDIUM": (10.343466781706645, 2388.306670644966, (0, 0, 27336, 9967, 20)),
+}
+
+Outputs = Tuple[np.ndarray, np.ndarray, tuple]
+
+
+@lru_cache(maxsize=None)
+def run(
+    engine: str,
+    charging_allocation: str,
+    use_priority_criterions: Tuple[str, ...] = CRITERIONS,
+    tolerance: Optional[float] = None,
+) -> Dict[str, Outputs]:
+    """Runs the packaged scenario with each criterion in turn on one packaged fleet, batteries' upgrades outliving resets, and returns the times, grades and counters of each run."""
+    fleet_controler = FleetControler(
+        JsonServerAdapter(),
+        engine=engine,
+        tolerance=tolerance,
+        charging_allocation=charging_allocation,
+    )
+    counters = fleet_controler.fleet.counters
+    outputs = {}
+    for use_priority_criterion in use_priority_criterions:
+        output = JsonUserAdapter(
+            fleet_controler, use_priority_criterion=use_priority_criterion
+        ).run()
+        outputs[use_priority_criterion] = (
+            output.time,
+            output.grades,
+            tuple(getattr(counters, name) for name in counters.__slots__),
+        )
+    return outputs
+
+
+def assert_same_outputs(outputs: Outputs, reference_outputs: Outputs) -> None:
+    time, grades, counters = outputs
+    reference_time, reference_grades, reference_counters = reference_outputs
+    np.testing.assert_array_equal(time, reference_time)
+    np.testing.assert_array_equal(grades, reference_grades)
+    assert counters == reference_counters
+
+
+@pytest.mark.parametrize("use_priority_criterion", CRITERIONS)
+def test_object_engine_matches_baseline(use_priority_criterion):
+    _, grades, counters = run("OBJECT", "SORTED")[use_priority_criterion]
+    final_grade, grades_sum, baseline_counters = BASELINE[use_priority_criterion]
+    assert len(grades) == 501
+    assert grades[-1] == pytest.approx(final_grade, rel=1e-12)
+    assert grades.sum() == pytest.approx(grades_sum, rel=1e-12)
+    assert counters == baseline_counters
+
+
+@pytest.mark.parametrize("use_priority_criterion", CRITERIONS)
+@pytest.mark.parametrize("charging_allocation", ALLOCATIONS)
+@pytest.mark.parametrize("engine", ["VECTORIZED", "EVENT"])
+def test_engines_match_object_engine(
+    engine, charging_allocation, use_priority_criterion
+):
+    assert_same_outputs(
+        run(engine, charging_allocation)[use_priority_criterion],
+        run("OBJECT", charging_allocation)[use_priority_criterion],
+    )
+
+
+def test_closed_form_cells_match_stepped_cells():
+    assert_same_outputs(
+        run("OBJECT", "SORTED", ("PERFORMANT",), tolerance=1e-9)["PERFORMANT"],
+        run("OBJECT", "SORTED")["PERFORMANT"],
+    )
@@ -0,0 +1,81 @@
+import json
+import os
+import numpy as np
+import pytest
+from fleet_operator.columnar import load_columns
+from fleet_operator.domain.sweep import (
+    FleetDistribution,
+    LoadCycle,
+    ScenarioDistribution,
+)
+from fleet_operator.generators import VEHICLES_COLUMNS, write_fleet, write_scenario
+
+SEED = 20240501
+
+
+def read(path):
+    """Returns the bytes of a file, or of every file of a directory by name."""
+    if os.path.isdir(path):
+        return {name: read(os.path.join(path, name)) for name in os.listdir(path)}
+    with open(path, "rb") as file:
+        return file.read()
+
+
+@pytest.mark.parametrize("extension", [".json", ""])
+def test_fleets_do_not_depend_on_the_chunk_size(tmp_path, extension):
+    fleet_distribution = FleetDistribution(250, 31)
+    paths = [str(tmp_path / "fleet{}{}".format(size, extension)) for size in (7, 1000)]
+    entropies = [
+        write_fleet(fleet_distribution, path, SEED, chunk_size)
+        for path, chunk_size in zip(paths, (7, 1000))
+    ]
+    assert entropies == [SEED, SEED]
+    assert read(paths[0]) == read(paths[1])
+
+
+@pytest.mark.parametrize("extension", [".json", ".ndjson", ""])
+@pytest.mark.parametrize("load_cycle", [None, LoadCycle()])
+def test_scenarios_do_not_depend_on_the_chunk_size(tmp_path, extension, load_cycle):
+    scenario_distribution = ScenarioDistribution(300, load_cycle=load_cycle)
+    paths = [
+        str(tmp_path / "scenario{}{}".format(size, extension)) for size in (7, 1000)
+    ]
+    for path, chunk_size in zip(paths, (7, 1000)):
+        write_scenario(scenario_distribution, path, SEED, chunk_size)
+    assert read(paths[0]) == read(paths[1])
+
+
+def test_formats_hold_the_same_fleet(tmp_path):
+    json_path, columns_path = str(tmp_path / "fleet.json"), str(tmp_path / "fleet")
+    for path in (json_path, columns_path):
+        write_fleet(FleetDistribution(40, 5), path, SEED, chunk_size=16)
+    with open(json_path) as fleet_json:
+        fleet = json.load(fleet_json)
+    columns = load_columns(
+        columns_path, list(VEHICLES_COLUMNS) + ["charging_stations_power"]
+    )
+    for index, (name, dtype) in enumerate(VEHICLES_COLUMNS.items()):
+        assert columns[name].dtype == dtype
+        values = [vehicle[index] for vehicle in fleet["vehicles"]]
+        assert columns[name].tolist() == values
+    assert columns["charging_stations_power"].tolist() == fleet["charging_stations"]
+
+
+def test_empty_outputs_are_written(tmp_path):
+    columns_path = str(tmp_path / "fleet")
+    write_fleet(FleetDistribution(0, 0), columns_path, SEED)
+    for name, dtype in dict(
+        VEHICLES_COLUMNS, charging_stations_power=np.float64
+    ).items():
+        column = np.load(os.path.join(columns_path, name + ".npy"))
+        assert column.shape == (0,) and column.dtype == dtype
+    write_scenario(ScenarioDistribution(0), str(tmp_path / "scenario"), SEED)
+    for name in ("timelapses", "loads"):
+        assert np.load(str(tmp_path / "scenario" / (name + ".npy"))).shape == (0,)
+    write_fleet(FleetDistribution(0, 0), str(tmp_path / "fleet.json"), SEED)
+    assert json.loads((tmp_path / "fleet.json").read_text()) == {
+        "vehicles": [],
+        "charging_stations": [],
+    }
+    write_scenario(ScenarioDistribution(0), str(tmp_path / "scenario.ndjson"), SEED)
+    assert (tmp_path / "scenario.ndjson").read_text() == ""
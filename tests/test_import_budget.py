@@ -0,0 +1,63 @@
+"""Import-time budget of the package's entry points.
+
+Each entry point is imported in fresh interpreters with '-X importtime', right after numpy and pydantic, and must not pull in a heavy module it does not need while its own import time, the dependencies' one excluded, stays within its budget. Bytecode is written by a first unmeasured import, so that the budget is the one of a warm start, and the best of several imports is kept. Budgets are multiplied by the IMPORT_BUDGET_SCALE environment variable, if set, on slow machines.
+"""
+import os
+import subprocess
+import sys
+from typing import Dict, List
+import pytest
+
+SOURCES = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+DEPENDENCIES = ["numpy", "pydantic"]
+BUDGETS = {  # Import time once the dependencies are imported (ms)
+    "fleet_operator.domain.core": 25,
+    "fleet_operator.server": 30,
+    "fleet_operator.user": 30,
+    "fleet_operator.cli": 40,
+}
+FORBIDDEN = [
+    "pkg_resources",
+    "matplotlib",
+    "scipy",
+    "asyncio",
+    "concurrent.futures.process",
+]
+REPEAT = 5
+
+
+def import_times(modules: List[str]) -> Dict[str, int]:
+    """Imports modules in order in a fresh interpreter and returns the cumulated import time of every imported module (us)."""
+    environment = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.abspath(SOURCES), environment.get("PYTHONPATH")])
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulated, name = line[len("import time:") :].split("|")
+        if cumulated.strip().isdigit():
+            times[name.strip()] = int(cumulated)
+    return times
+
+
+@pytest.mark.parametrize("module", list(BUDGETS))
+def test_import_budget(module):
+    modules = DEPENDENCIES + [module]
+    times = import_times(modules)
+    forbidden = [name for name in FORBIDDEN if name in times]
+    assert not forbidden, "{} imports {}.".format(module, ", ".join(forbidden))
+    module_time = min(import_times(modules)[module] for _ in range(REPEAT)) / 1e3
+    budget = BUDGETS[module] * float(os.environ.get("IMPORT_BUDGET_SCALE", 1))
+    assert module_time <= budget, "{} imports in {:.1f} ms, over {:.0f} ms.".format(
+        module, module_time, budget
+    )
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+from fleet_operator.domain.core import (
+    Battery,
+    Cell,
+    ChargingStation,
+    Fleet,
+    Vehicle,
+    simulate,
+)
+from fleet_operator.domain.packs import CellPacks, PackBattery
+from fleet_operator.domain.utils import (
+    BatteryLifetimeError,
+    EmptyCellError,
+    FullCellError,
+    TooPowerfullDischargeError,
+)
+
+ERRORS = (
+    BatteryLifetimeError,
+    EmptyCellError,
+    FullCellError,
+    TooPowerfullDischargeError,
+)
+USES = [(1800, -20e3), (600, 30e3), (3600, -15e3), (4000, 50e3), (600, -40e3)]
+
+
+def outcome(battery, timelapse, power):
+    """Uses a battery and returns the error raised, if any, with its state."""
+    try:
+        battery.use(timelapse, power)
+        error = None
+    except ERRORS as exception:
+        error = type(exception)
+    return (
+        error,
+        battery.nominal_capacity,
+        battery.available_capacity,
+        battery.current_capacity,
+        battery.cell.soc,
+    )
+
+
+def test_identical_cells_behave_as_battery():
+    battery = Battery(Cell(alpha=1e-7, beta=1e-6), 100, 10)
+    pack_battery = PackBattery.sample(
+        100, 10, np.random.default_rng(0), dispersion=0, alpha=1e-7, beta=1e-6
+    )
+    for timelapse, power in USES * 3:
+        assert outcome(pack_battery, timelapse, power) == outcome(
+            battery, timelapse, power
+        )
+        assert pack_battery.tension == pytest.approx(battery.tension, rel=1e-12)
+
+
+def test_fleet_of_identical_cells_behaves_as_fleet_of_batteries():
+    def fleet(pack):
+        fleet = Fleet()
+        for index in range(8):
+            fleet.extend_fleet(
+                Vehicle(
+                    10e3 + 4e3 * index,
+                    PackBattery.sample(dispersion=0, alpha=1e-6, beta=1e-7)
+                    if pack
+                    else Battery(Cell(alpha=1e-6, beta=1e-7)),
+                )
+            )
+        fleet.add_charging_stations(*(ChargingStation(50e3) for _ in range(4)))
+        return fleet
+
+    scenario = [
+        (900 + 300 * (index % 4), 0.25 * (1 + index % 3)) for index in range(200)
+    ]
+    battery_fleet, pack_fleet = fleet(False), fleet(True)
+    outputs = simulate(battery_fleet, scenario, "PERFORMANT")
+    pack_outputs = simulate(pack_fleet, scenario, "PERFORMANT")
+    np.testing.assert_array_equal(pack_outputs.grades, outputs.grades)
+    assert repr(pack_fleet.counters) == repr(battery_fleet.counters)
+    assert pack_fleet.counters.upgrades_number > 0
+
+
+def test_packs_are_their_weakest_branch():
+    capacities = np.array([2.4, 2.6, 2.7, 2.5]) * 3600
+    resistances = np.array([0.07, 0.09, 0.06, 0.06])
+    packs = CellPacks([2], [2], capacities, resistances, [0, 0, 0, 0], [0, 0, 0, 0])
+    battery = PackBattery(packs)
+    cells = [
+        Cell(resistance=resistance, nominal_capacity=capacity)
+        for capacity, resistance in zip(capacities, resistances)
+    ]
+    for timelapse, power in [(1800, -30), (600, 12)]:
+        battery.use(timelapse, power)
+        for cell in cells:
+            cell.use(timelapse, power / 4)
+        tensions = [cell.tension for cell in cells]
+        assert battery.tension == min(
+            tensions[0] + tensions[1], tensions[2] + tensions[3]
+        )
+        for name in ("nominal_capacity", "available_capacity", "current_capacity"):
+            assert getattr(battery, name) == 2 * min(
+                getattr(cell, name) for cell in cells
+            )
+    assert battery.cell.soc == pytest.approx(
+        min(cell.current_capacity for cell in cells)
+        / min(cell.available_capacity for cell in cells)
+    )
+
+
+def test_packs_fail_with_their_first_failing_cell():
+    capacities = np.array([2.6, 2.6, 2.6, 1.3]) * 3600
+    packs = CellPacks([2], [2], capacities, [0.07] * 4, [0] * 4, [0] * 4)
+    battery = PackBattery(packs)
+    weakest_cell = Cell(nominal_capacity=capacities[3])
+    with pytest.raises(EmptyCellError):
+        weakest_cell.use(3 * 3600, -5)
+    with pytest.raises(EmptyCellError):
+        battery.use(3 * 3600, -20)
+    assert packs.current_capacity[3] == weakest_cell.current_capacity
+    assert packs.current_capacity[0] > packs.current_capacity[3]
+
+
+def test_vehicles_renew_and_upgrade_pack_batteries():
+    vehicle = Vehicle(battery=PackBattery.sample(rng=np.random.default_rng(0)))
+    vehicle.use(1200)
+    vehicle.upgrade_battery()
+    assert isinstance(vehicle.battery, PackBattery)
+    assert vehicle.battery.parallel_branches_number == 20
+    vehicle.use(1200)
+    battery = vehicle.battery
+    vehicle.change_battery()
+    assert vehicle.battery is battery
+    assert battery.current_capacity == battery.nominal_capacity
+    with pytest.raises(TypeError):
+        vehicle.restore(vehicle.snapshot())
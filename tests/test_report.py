@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from fleet_operator.domain.data_models import ColumnarOutputsData
+from fleet_operator.report import downsample, lttb, min_max, plot_outputs
+
+
+@pytest.fixture(scope="module")
+def series():
+    generator = np.random.default_rng(0)
+    x = np.cumsum(generator.uniform(1, 10, 10_000))
+    return x, np.cumsum(generator.normal(size=10_000))
+
+
+def test_lttb_keeps_the_largest_triangles():
+    x = np.arange(8, dtype=float)
+    y = np.array([0, 1, 5, 2, 0, -3, 1, 0], dtype=float)
+    assert lttb(x, y, 4).tolist() == [0, 2, 5, 7]
+
+
+@pytest.mark.parametrize("points_number", [3, 10, 997])
+def test_lttb_keeps_the_endpoints_and_points_number(series, points_number):
+    x, y = series
+    indexes = lttb(x, y, points_number)
+    assert len(indexes) == points_number
+    assert indexes[0] == 0 and indexes[-1] == len(x) - 1
+    assert (np.diff(indexes) > 0).all()
+    assert lttb(x[:5], y[:5], 10).tolist() == list(range(5))
+
+
+def test_min_max_keeps_the_extremes_of_each_bucket():
+    y = np.array([3, 1, 4, 1, 5, 9, 2, 6, 5, 3], dtype=float)
+    assert min_max(y, 2).tolist() == [0, 1, 4, 5, 6, 9]
+    assert min_max(y, 5).tolist() == list(range(10))
+
+
+@pytest.mark.parametrize("buckets_number", [1, 10, 1000])
+def test_min_max_keeps_the_endpoints_and_extremes(series, buckets_number):
+    _, y = series
+    indexes = min_max(y, buckets_number)
+    assert len(indexes) <= 2 * buckets_number + 2
+    assert indexes[0] == 0 and indexes[-1] == len(y) - 1
+    assert (np.diff(indexes) > 0).all()
+    assert y[indexes].min() == y.min() and y[indexes].max() == y.max()
+
+
+def test_downsample_methods(series):
+    x, y = series
+    kept_x, kept_y = downsample(x, y, 100)
+    assert len(kept_x) == 100
+    assert np.array_equal(kept_y, y[lttb(x, y, 100)])
+    kept_x, kept_y = downsample(x.tolist(), y.tolist(), 100, "MINMAX")
+    assert np.array_equal(kept_x, x[min_max(y, 100)])
+    with pytest.raises(ValueError):
+        downsample(x, y, 100, "MEAN")
+
+
+def test_plot_outputs_renders_headless(tmp_path, series):
+    pytest.importorskip("matplotlib")
+    x, y = series
+    path = tmp_path / "grades.png"
+    plot_outputs(
+        {"RUN": ColumnarOutputsData(time=x, grades=y)},
+        str(path),
+        width=300,
+        height=200,
+        title="Grades",
+    )
+    assert path.stat().st_size > 0
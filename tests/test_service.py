@@ -0,0 +1,151 @@
+import os
+from http.client import HTTPConnection
+from json import dumps, loads
+from threading import Thread
+import numpy as np
+import pytest
+from fleet_operator.domain.core import FleetControler, simulate
+from fleet_operator.domain.criterions import register_criterion
+from fleet_operator.server import ConsoleServerAdapter
+from fleet_operator.service import SimulationService, UnknownFleetError, serve
+
+RESOURCES = {
+    "vehicles": [
+        [10000.0, 100, 8, 40000.0],
+        [9000.0, 90, 10, 45000.0],
+        [11000.0, 80, 9, 30000.0],
+    ],
+    "charging_stations": [100000.0],
+}
+SCENARIO = [[1200.0, 0.5], [600.0, 1.0], [1800.0, 0.3], [900.0, 0.6]]
+
+
+@register_criterion("FAILING_IN_WORKER")
+def failing_in_worker(fleet_state):
+    raise RuntimeError("criterion failure")
+
+
+@register_criterion("CRASHING_WORKER")
+def crashing_worker(fleet_state):
+    os._exit(1)
+
+
+def resources(charging_power):
+    return dict(RESOURCES, charging_stations=[charging_power])
+
+
+@pytest.fixture(scope="module")
+def service():
+    with SimulationService(engine="VECTORIZED", max_fleets=2) as service:
+        yield service
+
+
+@pytest.fixture(scope="module")
+def address(service):
+    server = serve(service, "127.0.0.1", 0)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def request(address, method, path, body=None):
+    connection = HTTPConnection(*address, timeout=60)
+    try:
+        content = body if isinstance(body, (str, type(None))) else dumps(body)
+        connection.request(method, path, content)
+        response = connection.getresponse()
+        return response.status, loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_add_fleet_keeps_identical_fleets_once(service):
+    fleet_id = service.add_fleet(resources(100000.0))
+    assert service.add_fleet(resources(100000.0)) == fleet_id
+    assert service.add_fleet(resources(110000.0)) != fleet_id
+    with pytest.raises(ValueError):
+        service.add_fleet(dict(RESOURCES, vehicles=[]))
+
+
+def test_submit_matches_a_direct_run(service):
+    fleet_id = service.add_fleet(resources(100000.0))
+    outputs = service.submit(fleet_id, SCENARIO, "PERFORMANT").result(60)
+    fleet = FleetControler(
+        ConsoleServerAdapter(**resources(100000.0)), engine="VECTORIZED"
+    ).fleet
+    expected = simulate(fleet, SCENARIO, "PERFORMANT")
+    assert outputs.grades[-1] > 0
+    assert np.array_equal(outputs.grades, expected.grades)
+    assert np.array_equal(outputs.time, expected.time)
+    repeated = service.submit(fleet_id, SCENARIO, "PERFORMANT").result(60)
+    assert np.array_equal(repeated.grades, outputs.grades)
+
+
+def test_least_recently_used_fleet_is_evicted(service):
+    first = service.add_fleet(resources(120000.0))
+    second = service.add_fleet(resources(130000.0))
+    service.submit(first, SCENARIO, "PERFORMANT").result(60)
+    assert service.fleets == [second, first]
+    third = service.add_fleet(resources(140000.0))
+    assert service.fleets == [first, third]
+    with pytest.raises(UnknownFleetError):
+        service.submit(second, SCENARIO, "PERFORMANT")
+    with pytest.raises(ValueError):
+        service.submit(first, SCENARIO, "UNKNOWN")
+
+
+def test_http_statuses(service, address):
+    status, content = request(address, "POST", "/fleets", resources(100000.0))
+    assert status == 200
+    fleet_id = content["fleet_id"]
+    assert request(address, "GET", "/fleets") == (200, {"fleets": service.fleets})
+    body = {
+        "fleet_id": fleet_id,
+        "scenario": SCENARIO,
+        "use_priority_criterion": "PERFORMANT",
+    }
+    status, content = request(address, "POST", "/simulations", body)
+    assert status == 200 and len(content["grades"]) == len(SCENARIO) + 1
+    assert request(address, "POST", "/simulations", "[]")[0] == 400
+    assert request(address, "POST", "/simulations", "{")[0] == 400
+    assert (
+        request(address, "POST", "/simulations", dict(body, scenario=[]))[0] == 400
+    )
+    status, content = request(
+        address, "POST", "/simulations", dict(body, fleet_id="unknown")
+    )
+    assert status == 404 and "unknown" in content["error"]
+    assert request(address, "POST", "/unknown", {})[0] == 404
+    assert request(address, "GET", "/unknown")[0] == 404
+    status, content = request(
+        address,
+        "POST",
+        "/simulations",
+        dict(body, use_priority_criterion="FAILING_IN_WORKER"),
+    )
+    assert status == 500 and content["error"] == "RuntimeError: criterion failure"
+    assert request(address, "POST", "/simulations", body)[0] == 200
+
+
+def test_http_status_of_a_crashed_worker():
+    with SimulationService(engine="VECTORIZED") as service:
+        server = serve(service, "127.0.0.1", 0)
+        Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            fleet_id = service.add_fleet(resources(100000.0))
+            body = {
+                "fleet_id": fleet_id,
+                "scenario": SCENARIO,
+                "use_priority_criterion": "CRASHING_WORKER",
+            }
+            address = server.server_address
+            status, content = request(address, "POST", "/simulations", body)
+            assert status == 500
+            assert content["error"].startswith("BrokenProcessPool")
+            body["use_priority_criterion"] = "PERFORMANT"
+            assert request(address, "POST", "/simulations", body)[0] == 500
+        finally:
+            server.shutdown()
+            server.server_close()
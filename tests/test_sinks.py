@@ -0,0 +1,109 @@
+import os
+from importlib.resources import files
+from json import loads
+import numpy as np
+import pytest
+from fleet_operator.columnar import load_columns
+from fleet_operator.domain.core import FleetControler, iter_simulate, simulate
+from fleet_operator.domain.data_models import ColumnarOutputsData
+from fleet_operator.server import ConsoleServerAdapter, JsonServerAdapter
+from fleet_operator.sinks import (
+    OUTPUTS_COLUMNS,
+    CsvResultsSink,
+    MemmapResultsSink,
+    NdjsonResultsSink,
+)
+
+TASKS_NUMBER = 50
+CHUNK_SIZE = 7
+
+
+@pytest.fixture(scope="module")
+def fleet():
+    data = JsonServerAdapter().data
+    return FleetControler(
+        ConsoleServerAdapter(
+            vehicles=data.vehicles[:10], charging_stations=data.charging_stations[:2]
+        ),
+        engine="VECTORIZED",
+    ).fleet
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    content = files("fleet_operator").joinpath("data/scenario.json").read_text()
+    return [tuple(task) for task in loads(content)[:TASKS_NUMBER]]
+
+
+@pytest.fixture(scope="module")
+def expected(fleet, scenario):
+    return simulate(fleet, scenario, "PERFORMANT")
+
+
+def outputs(start, stop):
+    return ColumnarOutputsData(
+        time=np.arange(start, stop, dtype=float),
+        grades=np.arange(start, stop, dtype=float) / 2,
+    )
+
+
+def load_outputs(path):
+    columns = load_columns(path, OUTPUTS_COLUMNS, mmap_mode=None)
+    return columns["time"], columns["grades"]
+
+
+def test_memmap_sink_grows_by_chunks(tmp_path):
+    path = str(tmp_path / "outputs")
+    with MemmapResultsSink(path, growth_steps=4) as sink:
+        for start, stop in [(0, 3), (3, 8), (8, 9), (9, 22)]:
+            sink.write(outputs(start, stop))
+        assert sink.steps_number == 22
+    time, grades = load_outputs(path)
+    assert np.array_equal(time, np.arange(22, dtype=float))
+    assert np.array_equal(grades, time / 2)
+    assert os.path.getsize(os.path.join(path, "time.npy")) == 128 + 22 * 8
+
+
+def test_memmap_sink_shrinks_preallocated_columns(tmp_path):
+    path = str(tmp_path / "outputs")
+    sink = MemmapResultsSink(path, tasks_number=10)
+    sink.write(outputs(0, 4))
+    sink.close()
+    sink.close()
+    time, _ = load_outputs(path)
+    assert np.array_equal(time, np.arange(4, dtype=float))
+    with pytest.raises(ValueError):
+        sink.write(outputs(4, 5))
+    with MemmapResultsSink(path, tasks_number=3) as sink:
+        sink.write(outputs(0, 4))
+    time, _ = load_outputs(path)
+    assert np.array_equal(time, np.arange(4, dtype=float))
+    with pytest.raises(ValueError):
+        MemmapResultsSink(path, growth_steps=0)
+
+
+@pytest.mark.parametrize("tasks_number", [None, TASKS_NUMBER])
+def test_memmap_sink_writes_a_run(tmp_path, fleet, scenario, expected, tasks_number):
+    path = str(tmp_path / "outputs")
+    with MemmapResultsSink(path, tasks_number, growth_steps=16) as sink:
+        sink.write_all(iter_simulate(fleet, iter(scenario), "PERFORMANT", CHUNK_SIZE))
+    time, grades = load_outputs(path)
+    assert np.array_equal(time, expected.time)
+    assert np.array_equal(grades, expected.grades)
+
+
+def test_text_sinks_write_a_run_exactly(tmp_path, fleet, scenario, expected):
+    csv_path, ndjson_path = str(tmp_path / "outputs.csv"), str(tmp_path / "outputs")
+    with CsvResultsSink(csv_path) as sink:
+        sink.write_all(iter_simulate(fleet, scenario, "PERFORMANT", CHUNK_SIZE))
+    with NdjsonResultsSink(ndjson_path) as sink:
+        sink.write_all(iter_simulate(fleet, scenario, "PERFORMANT", CHUNK_SIZE))
+    with open(csv_path) as csv_file:
+        assert csv_file.readline() == "time,grades\n"
+    rows = np.loadtxt(csv_path, delimiter=",", skiprows=1)
+    assert np.array_equal(rows[:, 0], expected.time)
+    assert np.array_equal(rows[:, 1], expected.grades)
+    with open(ndjson_path) as ndjson_file:
+        steps = np.array([loads(line) for line in ndjson_file])
+    assert np.array_equal(steps[:, 0], expected.time)
+    assert np.array_equal(steps[:, 1], expected.grades)
@@ -0,0 +1,105 @@
+from importlib.resources import files
+from json import loads
+import pytest
+from fleet_operator.domain.data_models import ResourcesData
+from fleet_operator.domain.sizing import FleetSizer, resize
+from fleet_operator.server import JsonServerAdapter
+
+TASKS_NUMBER = 80
+
+
+@pytest.fixture(scope="module")
+def resources_data():
+    data = JsonServerAdapter().data
+    return ResourcesData(
+        vehicles=data.vehicles[:10], charging_stations=data.charging_stations[:2]
+    )
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    content = files("fleet_operator").joinpath("data/scenario.json").read_text()
+    return [tuple(task) for task in loads(content)[:TASKS_NUMBER]]
+
+
+def sizer(resources_data, scenario, dimension):
+    return FleetSizer(
+        resources_data, dimension, scenario, "PERFORMANT", engine="VECTORIZED"
+    )
+
+
+def test_resize_repeats_the_base_resources(resources_data):
+    first, second = resources_data.charging_stations
+    resources = resize(resources_data, "CHARGING_STATIONS", 5)
+    assert resources["charging_stations"] == [first, second, first, second, first]
+    assert resources["vehicles"] == resources_data.vehicles
+    assert len(resize(resources_data, "VEHICLES", 3)["vehicles"]) == 3
+    with pytest.raises(ValueError):
+        resize(resources_data, "BATTERIES", 3)
+
+
+def test_minimum_size_is_bracketed(resources_data, scenario):
+    fleet_sizer = sizer(resources_data, scenario, "CHARGING_STATIONS")
+    assert fleet_sizer.size_limit == 10
+    outputs = fleet_sizer.minimum_size(4)
+    assert outputs.size == 6
+    assert outputs.evaluated_sizes == [1, 2, 4, 8, 6, 5]
+    assert outputs.simulated_steps < len(outputs.evaluated_sizes) * TASKS_NUMBER
+    assert "2 candidates" in repr(fleet_sizer)
+    check = sizer(resources_data, scenario, "CHARGING_STATIONS")
+    assert check.final_grade(6) >= 4 > check.final_grade(5)
+
+
+def test_maximum_size_is_bracketed(resources_data, scenario):
+    fleet_sizer = sizer(resources_data, scenario, "VEHICLES")
+    assert fleet_sizer.size_limit == 640
+    outputs = fleet_sizer.maximum_size(0.9)
+    assert outputs.size == 11
+    assert outputs.evaluated_sizes == [1, 2, 4, 8, 16, 12, 10, 11]
+    assert "2 candidates" in repr(fleet_sizer)
+    check = sizer(resources_data, scenario, "VEHICLES")
+    assert check.final_grade(11) >= 0.9 > check.final_grade(12)
+
+
+def test_given_bounds_are_searched(resources_data, scenario):
+    fleet_sizer = sizer(resources_data, scenario, "CHARGING_STATIONS")
+    outputs = fleet_sizer.minimum_size(4, low=3, high=100)
+    assert outputs.size == 6
+    assert outputs.evaluated_sizes[0] == 10
+    fleet_sizer = sizer(resources_data, scenario, "VEHICLES")
+    assert fleet_sizer.maximum_size(0.9, low=8, high=11).size == 11
+
+
+def test_runs_stop_once_their_outcome_is_known(resources_data, scenario):
+    fleet_sizer = sizer(resources_data, scenario, "CHARGING_STATIONS")
+    assert fleet_sizer.reaches(6, 1)
+    reaching_steps = fleet_sizer.simulated_steps
+    assert reaching_steps < TASKS_NUMBER
+    assert not fleet_sizer.reaches(1, 50)
+    assert fleet_sizer.simulated_steps - reaching_steps <= TASKS_NUMBER - 50 + 1
+    assert fleet_sizer.reaches(6, 4)
+    assert fleet_sizer.simulated_steps - reaching_steps < 2 * TASKS_NUMBER
+
+
+def test_unreached_targets_stop_early(resources_data, scenario):
+    fleet_sizer = sizer(resources_data, scenario, "CHARGING_STATIONS")
+    with pytest.raises(ValueError, match="not reached with 10 charging stations"):
+        fleet_sizer.minimum_size(50)
+    assert fleet_sizer.simulated_steps < 5 * TASKS_NUMBER / 2
+    fleet_sizer = sizer(resources_data, scenario, "VEHICLES")
+    with pytest.raises(ValueError, match="not reached with 1 vehicles"):
+        fleet_sizer.maximum_size(1.5)
+
+
+def test_invalid_searches_are_rejected(resources_data, scenario):
+    fleet_sizer = sizer(resources_data, scenario, "CHARGING_STATIONS")
+    with pytest.raises(ValueError, match="exceeds the 80 tasks"):
+        fleet_sizer.minimum_size(TASKS_NUMBER + 1)
+    with pytest.raises(ValueError, match="exceeds the largest considered one"):
+        fleet_sizer.minimum_size(1, low=11)
+    with pytest.raises(ValueError, match="maximum_size"):
+        sizer(resources_data, scenario, "VEHICLES").minimum_size(1)
+    with pytest.raises(ValueError, match="minimum_size"):
+        fleet_sizer.maximum_size(1)
+    with pytest.raises(ValueError, match="Unknown criterion"):
+        FleetSizer(resources_data, "VEHICLES", scenario, "FASTEST")
@@ -0,0 +1,105 @@
+import json
+from importlib.resources import files
+import numpy as np
+import pytest
+from pydantic import ValidationError
+from fleet_operator.domain.core import FleetControler, simulate
+from fleet_operator.server import ConsoleServerAdapter, JsonServerAdapter
+from fleet_operator.sinks import CsvResultsSink
+from fleet_operator.user import NdjsonUserAdapter
+
+TASKS_NUMBER = 40
+
+
+@pytest.fixture(scope="module")
+def fleet_controler():
+    data = JsonServerAdapter().data
+    return FleetControler(
+        ConsoleServerAdapter(
+            vehicles=data.vehicles[:10], charging_stations=data.charging_stations[:2]
+        ),
+        engine="VECTORIZED",
+    )
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    content = files("fleet_operator").joinpath("data/scenario.json").read_text()
+    return [tuple(task) for task in json.loads(content)[:TASKS_NUMBER]]
+
+
+def write_ndjson(path, tasks):
+    path.write_text("".join(json.dumps(task) + "\n" for task in tasks))
+    return str(path)
+
+
+def adapter(fleet_controler, path):
+    return NdjsonUserAdapter(fleet_controler, path, use_priority_criterion="PERFORMANT")
+
+
+def test_streamed_run_matches_a_loaded_one(tmp_path, fleet_controler, scenario):
+    expected = simulate(fleet_controler.fleet, scenario, "PERFORMANT")
+    assert expected.grades[-1] > 0
+    path = tmp_path / "scenario.ndjson"
+    path.write_text(
+        "\n".join(json.dumps(task) + "\n" for task in scenario)
+    )  # Blank lines are skipped
+    chunks = list(adapter(fleet_controler, str(path)).iter_run(chunk_size=9))
+    assert len(chunks) == 5 and max(len(chunk.time) for chunk in chunks) <= 9
+    outputs = adapter(fleet_controler, str(path)).run()
+    streamed_time = np.concatenate([chunk.time for chunk in chunks])
+    assert np.array_equal(streamed_time, outputs.time)
+    assert np.array_equal(outputs.time, expected.time)
+    assert np.array_equal(outputs.grades, expected.grades)
+    csv_path = str(tmp_path / "outputs.csv")
+    with CsvResultsSink(csv_path) as sink:
+        adapter(fleet_controler, str(path)).run_into(sink, chunk_size=9)
+    rows = np.loadtxt(csv_path, delimiter=",", skiprows=1)
+    assert np.array_equal(rows[:, 1], expected.grades)
+
+
+def test_empty_scenario_raises_before_the_fleet_is_reset(
+    tmp_path, fleet_controler, scenario
+):
+    simulate(fleet_controler.fleet, scenario[:5], "PERFORMANT")
+    time = list(fleet_controler.fleet.time)
+    empty_adapter = adapter(fleet_controler, write_ndjson(tmp_path / "empty", []))
+    with pytest.raises(ValidationError) as error:
+        empty_adapter.iter_run()
+    assert error.value.errors()[0]["loc"] == ("scenario",)
+    assert error.value.errors()[0]["type"] == "value_error.list.min_items"
+    assert fleet_controler.fleet.time == time
+
+
+@pytest.mark.parametrize(
+    "task, loc",
+    [
+        ([600.0, 1.5], ("scenario", 0, "load")),
+        ([0.0, 0.5], ("scenario", 0, "timelapse")),
+        ([600.0], ("scenario", 0)),
+        (600.0, ("scenario", 0)),
+    ],
+)
+def test_invalid_first_task_raises_before_the_fleet_is_reset(
+    tmp_path, fleet_controler, scenario, task, loc
+):
+    simulate(fleet_controler.fleet, scenario[:5], "PERFORMANT")
+    time = list(fleet_controler.fleet.time)
+    path = write_ndjson(tmp_path / "scenario.ndjson", [task] + scenario)
+    with pytest.raises(ValidationError) as error:
+        adapter(fleet_controler, path).iter_run()
+    assert error.value.errors()[0]["loc"] == loc
+    assert fleet_controler.fleet.time == time
+
+
+def test_invalid_task_raises_once_read(tmp_path, fleet_controler, scenario):
+    time = simulate(fleet_controler.fleet, scenario[:20], "PERFORMANT").time[-1]
+    path = write_ndjson(
+        tmp_path / "scenario.ndjson", scenario[:20] + [[600.0, -0.5]] + scenario[20:]
+    )
+    chunks = adapter(fleet_controler, path).iter_run(chunk_size=5)
+    assert len(next(chunks).time) == 5
+    with pytest.raises(ValidationError) as error:
+        list(chunks)
+    assert error.value.errors()[0]["loc"] == ("scenario", 20, "load")
+    assert fleet_controler.fleet.time[-1] == time
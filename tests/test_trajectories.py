@@ -0,0 +1,128 @@
+from importlib.resources import files
+from json import loads
+import numpy as np
+import pytest
+from fleet_operator.columnar import load_columns
+from fleet_operator.domain.core import FleetControler, simulate
+from fleet_operator.domain.trajectories import (
+    TRAJECTORY_STATE,
+    TrajectoryRecorder,
+    VehicleFlags,
+)
+from fleet_operator.server import ConsoleServerAdapter, JsonServerAdapter
+from fleet_operator.trajectories import load_trajectories, save_trajectories
+
+VEHICLES_NUMBER = 3
+TASKS_NUMBER = 40
+
+
+class SteppedFleet:
+    """Stand-in of a fleet whose state at step n is n + the vehicle's index."""
+
+    def __init__(self) -> None:
+        self.time = [0.0]
+
+    def step(self, recorder: TrajectoryRecorder) -> None:
+        self.time.append(self.time[-1] + 10)
+        recorder.record(self)
+
+    def vehicles_state(self):
+        values = len(self.time) - 1 + np.arange(VEHICLES_NUMBER, dtype=float)
+        return {name: values for name in TRAJECTORY_STATE}
+
+
+def run(recorder, steps_number):
+    fleet = SteppedFleet()
+    for _ in range(steps_number):
+        fleet.step(recorder)
+    return recorder
+
+
+@pytest.fixture(scope="module")
+def resources():
+    data = JsonServerAdapter().data
+    return {
+        "vehicles": data.vehicles[:10],
+        "charging_stations": data.charging_stations[:2],
+    }
+
+
+@pytest.fixture(scope="module")
+def scenario():
+    content = files("fleet_operator").joinpath("data/scenario.json").read_text()
+    return [tuple(task) for task in loads(content)[:TASKS_NUMBER]]
+
+
+def test_decimated_records_cumulate_flags():
+    recorder = TrajectoryRecorder(VEHICLES_NUMBER, 4, decimation=3)
+    fleet = SteppedFleet()
+    recorder.mark([0], VehicleFlags.USED)
+    fleet.step(recorder)
+    recorder.mark(np.array([0, 2]), VehicleFlags.FAILED)
+    fleet.step(recorder)
+    recorder.mark([1], VehicleFlags.RENEWED)
+    fleet.step(recorder)
+    recorder.mark([1], VehicleFlags.CHARGED)
+    for _ in range(7):
+        fleet.step(recorder)
+    trajectories = recorder.trajectories()
+    assert trajectories["steps"].tolist() == [3, 6, 9]
+    assert trajectories["time"].tolist() == [30, 60, 90]
+    assert trajectories["soc"][:, 0].tolist() == [3, 6, 9]
+    used, failed = VehicleFlags.USED, VehicleFlags.FAILED
+    assert trajectories["flags"].tolist() == [
+        [used | failed, VehicleFlags.RENEWED, failed],
+        [0, VehicleFlags.CHARGED, 0],
+        [0, 0, 0],
+    ]
+    recorder.reset()
+    assert recorder.trajectories()["steps"].tolist() == []
+    assert run(recorder, 3).trajectories()["steps"].tolist() == [3]
+    with pytest.raises(ValueError):
+        TrajectoryRecorder(VEHICLES_NUMBER, 4, decimation=0)
+
+
+def test_records_overflow_raises_unless_ring():
+    recorder = run(TrajectoryRecorder(VEHICLES_NUMBER, 3), 3)
+    with pytest.raises(ValueError, match="ring"):
+        SteppedFleet().step(recorder)
+    recorder = run(TrajectoryRecorder(VEHICLES_NUMBER, 3, decimation=2, ring=True), 15)
+    assert recorder.records_count == 7
+    trajectories = recorder.trajectories()
+    assert trajectories["steps"].tolist() == [10, 12, 14]
+    assert trajectories["resistance"][:, 2].tolist() == [12, 14, 16]
+
+
+@pytest.mark.parametrize("steps_number", [5, 11])
+def test_saved_trajectories_round_trip(tmp_path, steps_number):
+    recorder = TrajectoryRecorder(VEHICLES_NUMBER, 4, decimation=2, ring=True)
+    recorder.mark([1], VehicleFlags.FAILED)
+    run(recorder, steps_number)
+    path = str(tmp_path / "trajectories.npz")
+    save_trajectories(recorder, path)
+    loaded = load_trajectories(path)
+    expected = recorder.trajectories()
+    assert sorted(loaded) == sorted(list(expected) + ["decimation"])
+    assert loaded["decimation"] == 2
+    for name, records in expected.items():
+        assert loaded[name].dtype == records.dtype
+        assert np.array_equal(loaded[name], records)
+    columns = load_columns(path, ["steps", "flags"])
+    assert np.array_equal(columns["steps"], expected["steps"])
+    assert columns["steps"].tolist() == list(range(2, steps_number + 1, 2))[-4:]
+
+
+@pytest.mark.parametrize("engine", ["OBJECT", "VECTORIZED"])
+def test_recorded_fleets_run_as_before(resources, scenario, engine):
+    fleet = FleetControler(ConsoleServerAdapter(**resources), engine=engine).fleet
+    expected = simulate(fleet, scenario, "PERFORMANT")
+    fleet.recorder = TrajectoryRecorder(len(resources["vehicles"]), 8, decimation=5)
+    outputs = simulate(fleet, scenario, "PERFORMANT")
+    assert np.array_equal(outputs.grades, expected.grades)
+    trajectories = fleet.recorder.trajectories()
+    assert np.array_equal(trajectories["time"], outputs.time[5::5])
+    assert np.array_equal(
+        trajectories["soc"][-1], fleet.vehicles_state()["soc"].astype(np.float32)
+    )
+    flags = np.bitwise_or.reduce(trajectories["flags"], axis=0)
+    assert (flags & VehicleFlags.USED).any() and (flags & VehicleFlags.CHARGED).any()